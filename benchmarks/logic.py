@@ -0,0 +1,148 @@
+from copy import deepcopy
+from glob import glob
+from timeit import timeit
+from typing import List
+
+from taleweave.context import set_current_world
+from taleweave.models.entity import World
+from taleweave.systems.generic.logic import (
+    CompiledLogicTable,
+    LogicRule,
+    LogicSchedule,
+    LogicTable,
+    TriggerTable,
+    list_logic_entities,
+    load_logic,
+    update_attributes,
+    update_columns,
+    update_incremental,
+)
+from taleweave.utils.columns import AttributeColumns
+
+from .world import make_world
+
+MOODS = ["happy", "neutral", "sad", "angry"]
+PACK_GLOB = "taleweave/systems/*/*/logic.yaml"
+TABLE_COUNT = 4
+
+
+def make_table() -> CompiledLogicTable:
+    rules = [
+        LogicRule(
+            group="mood",
+            match={"type": "character", "mood": mood},
+            chance=0.1,
+            set={"mood": MOODS[(i + 1) % len(MOODS)]},
+        )
+        for i, mood in enumerate(MOODS)
+    ]
+    rules.extend(
+        [
+            LogicRule(
+                group="hunger",
+                match={"type": "character", "hunger": "full"},
+                chance=0.1,
+                set={"hunger": "hungry"},
+            ),
+            LogicRule(
+                match={"type": "item", "edible": True, "cooked": False},
+                chance=0.05,
+                set={"spoiled": True},
+            ),
+            LogicRule(
+                match={"type": "room", "temperature": "warm"},
+                chance=0.2,
+                set={"temperature": "hot"},
+            ),
+            LogicRule(
+                match={"type": "room", "temperature": "hot"},
+                chance=0.2,
+                set={"temperature": "warm"},
+            ),
+            # initialization rules, like the ones in the sim logic
+            LogicRule(
+                group="hunger",
+                rule='"hunger" not in attributes',
+                set={"hunger": "full"},
+            ),
+            LogicRule(
+                rule='"thirst" not in attributes',
+                set={"thirst": "hydrated"},
+            ),
+        ]
+    )
+    return CompiledLogicTable(LogicTable(rules=rules), "benchmark")
+
+
+def run_cases(
+    title: str,
+    world: World,
+    tables: List[CompiledLogicTable],
+    triggers: List[TriggerTable],
+):
+    entities = list(list_logic_entities(world))
+    column_entities = list(list_logic_entities(deepcopy(world)))
+    incremental_entities = list(list_logic_entities(deepcopy(world)))
+    schedules = [LogicSchedule() for _ in tables]
+    table_triggers = list(zip(tables, triggers))
+
+    def update_each():
+        for entity in entities:
+            for table, trigger_table in table_triggers:
+                update_attributes(entity, table, trigger_table)
+
+    def update_columnar():
+        columns = AttributeColumns(column_entities)
+        for table, trigger_table in table_triggers:
+            update_columns(columns, table, trigger_table)
+
+    def update_scheduled():
+        for schedule in schedules:
+            schedule.advance()
+
+        for entity in incremental_entities:
+            for (table, trigger_table), schedule in zip(table_triggers, schedules):
+                update_incremental(entity, table, trigger_table, schedule)
+
+    cases = [
+        ("per entity", update_each),
+        ("columnar", update_columnar),
+        ("incremental", update_scheduled),
+    ]
+
+    rule_count = sum(len(table.rules) for table in tables)
+    print(f"{title}: {len(entities)} logic entities and {rule_count} rules")
+    print(f"{'path':<24}{'turn (ms)':>14}{'speedup':>10}")
+
+    base_time = None
+    for name, update in cases:
+        # the first turn sets up the columns and schedules
+        update()
+        turn_time = timeit(update, number=3) * 1000 / 3
+        base_time = base_time or turn_time
+        speedup = base_time / max(turn_time, 1e-9)
+        print(f"{name:<24}{turn_time:>14.2f}{speedup:>9.1f}x")
+
+
+def main():
+    # several logic packs are usually loaded and fused into the logic engine
+    tables = [make_table() for _ in range(TABLE_COUNT)]
+    run_cases(
+        "synthetic tables", make_world(room_count=500), tables, [{}] * len(tables)
+    )
+    print()
+
+    # the logic packs that ship with the sim, rpg, and environment systems
+    world = make_world(room_count=500)
+    set_current_world(world)
+    systems = [load_logic(filename) for filename in sorted(glob(PACK_GLOB))]
+    run_cases(
+        "shipped logic packs",
+        world,
+        [system.rules for system in systems],
+        [system.triggers for system in systems],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+from random import Random
+from timeit import timeit
+
+from taleweave.models.entity import Room, World
+from taleweave.utils.search import (
+    find_character,
+    find_character_in_room,
+    find_containing_room,
+    find_item,
+    find_item_in_room,
+    find_room,
+)
+from taleweave.utils.string import normalize_name
+
+from .world import make_world
+
+
+def scan_room(world: World, room_name: str) -> Room | None:
+    for room in world.rooms:
+        if normalize_name(room.name) == normalize_name(room_name):
+            return room
+
+    return None
+
+
+def scan_character(world: World, character_name: str):
+    for room in world.rooms:
+        character = find_character_in_room(room, character_name)
+        if character:
+            return character
+
+    return None
+
+
+def scan_item(world: World, item_name: str):
+    for room in world.rooms:
+        item = find_item_in_room(room, item_name)
+        if item:
+            return item
+
+    return None
+
+
+def scan_containing_room(world: World, entity):
+    for room in world.rooms:
+        if entity in room.characters or entity in room.items:
+            return room
+
+    return None
+
+
+def main():
+    world = make_world()
+    rng = Random(1)
+    room_count = len(world.rooms)
+    characters = [character for room in world.rooms for character in room.characters]
+
+    room_names = [f"room {rng.randrange(room_count)}" for _ in range(200)]
+    character_names = [f"character {rng.randrange(room_count)}-0" for _ in range(200)]
+    item_names = [f"item {rng.randrange(room_count)}-1" for _ in range(200)]
+    sample_characters = [rng.choice(characters) for _ in range(200)]
+
+    # build the index before timing lookups
+    find_room(world, room_names[0])
+
+    cases = [
+        (
+            "find_room",
+            lambda: [scan_room(world, name) for name in room_names],
+            lambda: [find_room(world, name) for name in room_names],
+        ),
+        (
+            "find_character",
+            lambda: [scan_character(world, name) for name in character_names],
+            lambda: [find_character(world, name) for name in character_names],
+        ),
+        (
+            "find_item",
+            lambda: [scan_item(world, name) for name in item_names],
+            lambda: [find_item(world, name) for name in item_names],
+        ),
+        (
+            "find_containing_room",
+            lambda: [scan_containing_room(world, c) for c in sample_characters],
+            lambda: [find_containing_room(world, c) for c in sample_characters],
+        ),
+    ]
+
+    print(f"world with {room_count} rooms and {len(characters)} characters")
+    print(f"{'lookup':<24}{'linear (ms)':>14}{'indexed (ms)':>14}{'speedup':>10}")
+    for name, linear, indexed in cases:
+        linear_time = timeit(linear, number=1) * 1000
+        indexed_time = timeit(indexed, number=1) * 1000
+        speedup = linear_time / max(indexed_time, 1e-9)
+        print(f"{name:<24}{linear_time:>14.2f}{indexed_time:>14.2f}{speedup:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
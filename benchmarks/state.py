@@ -0,0 +1,46 @@
+from os import path
+from tempfile import TemporaryDirectory
+from timeit import timeit
+
+from taleweave.models.base import dump_model
+from taleweave.models.entity import WorldState
+from taleweave.utils.file import dump_state_data, load_state_data, write_atomic
+
+from .world import make_world
+
+# the YAML loader was used for every state file before the loader picked a format by extension
+FORMATS = [
+    ("yaml", "state.yaml"),
+    ("json", "state.json"),
+    ("msgpack", "state.msgpack"),
+    ("msgpack+zstd", "state.msgpack.zst"),
+]
+
+
+def main():
+    count = 3
+    world = make_world(room_count=500)
+    state = dump_model(WorldState, WorldState(memory={}, turn=1, world=world))
+
+    print(f"world state with {len(world.rooms)} rooms, averaged over {count} runs")
+    print(f"{'format':<16}{'size (kB)':>12}{'save (ms)':>12}{'load (ms)':>12}")
+
+    with TemporaryDirectory() as temp:
+        for name, filename in FORMATS:
+            filename = path.join(temp, filename)
+
+            def save():
+                write_atomic(filename, dump_state_data(filename, state))
+
+            def load():
+                WorldState(**load_state_data(filename))
+
+            save_time = timeit(save, number=count) * 1000 / count
+            load_time = timeit(load, number=count) * 1000 / count
+            size = path.getsize(filename) / 1024
+
+            print(f"{name:<16}{size:>12.0f}{save_time:>12.1f}{load_time:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
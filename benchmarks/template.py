@@ -0,0 +1,43 @@
+from timeit import timeit
+
+from taleweave.utils.template import compile_template, format_str
+
+TEMPLATES = [
+    "{{character.name}} moves {{direction}} into the {{room | name}}.",
+    "You see {{items | and_list}} around the room.",
+    "{% for item in items %}{{item | a_prefix}}{% if not loop.last %}, {% endif %}{% endfor %}.",
+    "{{character.name}} picks up {{item | the_prefix | punctuate}}",
+]
+
+
+def render_all():
+    for template in TEMPLATES:
+        format_str(
+            template,
+            character={"name": "Bob"},
+            direction="north",
+            item="apple",
+            items=["apple", "sword", "lantern"],
+            room="kitchen",
+        )
+
+
+def render_cold():
+    compile_template.cache_clear()
+    render_all()
+
+
+def main():
+    count = 1000
+    render_all()
+
+    cold_time = timeit(render_cold, number=count) * 1000 / count
+    warm_time = timeit(render_all, number=count) * 1000 / count
+
+    print(f"rendering {len(TEMPLATES)} templates, averaged over {count} runs")
+    print(f"{'cold (ms)':>12}{'warm (ms)':>12}{'speedup':>10}")
+    print(f"{cold_time:>12.3f}{warm_time:>12.3f}{cold_time / warm_time:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
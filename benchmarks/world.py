@@ -0,0 +1,70 @@
+from random import Random
+
+from taleweave.models.entity import Character, Item, Portal, Room, World
+
+
+def make_world(
+    room_count: int = 2000,
+    characters_per_room: int = 2,
+    items_per_room: int = 3,
+    items_per_character: int = 2,
+    seed: int = 0,
+) -> World:
+    """
+    Build a large synthetic world for benchmarks, with each room linked to the next and a few random rooms.
+    """
+
+    rng = Random(seed)
+    rooms = []
+
+    for r in range(room_count):
+        characters = [
+            Character(
+                name=f"character {r}-{c}",
+                backstory="A benchmark character.",
+                description="A benchmark character.",
+                attributes={"hunger": "full", "mood": "happy", "health": 10},
+                items=[
+                    Item(
+                        name=f"tool {r}-{c}-{i}",
+                        description="A benchmark tool.",
+                        attributes={"edible": False},
+                    )
+                    for i in range(items_per_character)
+                ],
+            )
+            for c in range(characters_per_room)
+        ]
+        items = [
+            Item(
+                name=f"item {r}-{i}",
+                description="A benchmark item.",
+                attributes={"edible": True, "cooked": False},
+            )
+            for i in range(items_per_room)
+        ]
+        portals = [
+            Portal(
+                name=f"door {r}",
+                description="A benchmark door.",
+                destination=f"room {(r + 1) % room_count}",
+            ),
+            Portal(
+                name=f"trapdoor {r}",
+                description="A benchmark trapdoor.",
+                destination=f"room {rng.randrange(room_count)}",
+            ),
+        ]
+        rooms.append(
+            Room(
+                name=f"room {r}",
+                description="A benchmark room.",
+                attributes={"temperature": "warm"},
+                characters=characters,
+                items=items,
+                portals=portals,
+            )
+        )
+
+    order = [character.name for room in rooms for character in room.characters]
+    return World(name="benchmark", order=order, rooms=rooms, theme="benchmark")
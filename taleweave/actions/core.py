@@ -13,6 +13,7 @@ from taleweave.context import (
 from taleweave.errors import ActionError
 from taleweave.systems.core.action import ACTION_SYSTEM_NAME
 from taleweave.utils.conversation import loop_conversation
+from taleweave.utils.index import move_character, move_item
 from taleweave.utils.search import (
     find_character_in_room,
     find_item_in_character,
@@ -135,8 +136,7 @@ def action_move(direction: str) -> str:
                 direction=direction,
             )
         )
-        action_room.characters.remove(action_character)
-        dest_room.characters.append(action_character)
+        move_character(action_world, action_room, dest_room, action_character)
 
         return format_prompt(
             "action_move_result", direction=direction, dest_room=dest_room
@@ -150,7 +150,7 @@ def action_take(item: str) -> str:
     Args:
         item: The name of the item to take.
     """
-    with action_context() as (action_room, action_character):
+    with world_context() as (action_world, action_room, action_character):
         action_item = find_item_in_room(action_room, item)
         if not action_item:
             raise ActionError(format_prompt("action_take_error_item", item=item))
@@ -163,8 +163,7 @@ def action_take(item: str) -> str:
                 item=item,
             )
         )
-        action_room.items.remove(action_item)
-        action_character.items.append(action_item)
+        move_item(action_world, action_room, action_character, action_item)
 
         return format_prompt("action_take_result", item=item)
 
@@ -289,7 +288,7 @@ def action_give(character: str, item: str) -> str:
         character: The name of the character to give the item to.
         item: The name of the item to give.
     """
-    with action_context() as (action_room, action_character):
+    with world_context() as (action_world, action_room, action_character):
         destination_character = find_character_in_room(action_room, character)
         if not destination_character:
             raise ActionError(
@@ -311,8 +310,7 @@ def action_give(character: str, item: str) -> str:
                 item=item,
             )
         )
-        action_character.items.remove(action_item)
-        destination_character.items.append(action_item)
+        move_item(action_world, action_character, destination_character, action_item)
 
         return format_prompt("action_give_result", character=character, item=item)
 
@@ -325,7 +323,7 @@ def action_drop(item: str) -> str:
         item: The name of the item to drop.
     """
 
-    with action_context() as (action_room, action_character):
+    with world_context() as (action_world, action_room, action_character):
         action_item = find_item_in_character(action_character, item)
         if not action_item:
             raise ActionError(format_prompt("action_drop_error_item", item=item))
@@ -335,8 +333,7 @@ def action_drop(item: str) -> str:
                 "action_drop_broadcast", action_character=action_character, item=item
             )
         )
-        action_character.items.remove(action_item)
-        action_room.items.append(action_item)
+        move_item(action_world, action_character, action_room, action_item)
 
         return format_prompt("action_drop_result", item=item)
 
@@ -3,7 +3,6 @@ from logging import getLogger
 from packit.agent import Agent, agent_easy_connect
 
 from taleweave.context import (
-    action_context,
     add_extra_actions,
     broadcast,
     get_agent_for_character,
@@ -23,6 +22,7 @@ from taleweave.generate import (
 )
 from taleweave.systems.core.action import ACTION_SYSTEM_NAME
 from taleweave.utils.effect import apply_effects, is_effect_ready
+from taleweave.utils.index import add_item, add_portal, add_room
 from taleweave.utils.search import find_character_in_room
 from taleweave.utils.string import normalize_name
 from taleweave.utils.template import format_prompt
@@ -67,7 +67,7 @@ def action_explore(direction: str) -> str:
         try:
             systems = get_game_systems()
             new_room = generate_room(dungeon_master, action_world, systems)
-            action_world.rooms.append(new_room)
+            add_room(action_world, new_room)
 
             # link the rooms together, starting with the current room
             outgoing_portal, incoming_portal = generate_portals(
@@ -78,8 +78,8 @@ def action_explore(direction: str) -> str:
                 systems,
                 outgoing_name=direction,
             )
-            action_room.portals.append(outgoing_portal)
-            new_room.portals.append(incoming_portal)
+            add_portal(action_world, action_room, outgoing_portal)
+            add_portal(action_world, new_room, incoming_portal)
             link_rooms(dungeon_master, action_world, systems, [new_room])
 
             broadcast(
@@ -118,7 +118,7 @@ def action_search(unused: bool) -> str:
                 systems,
                 dest_room=action_room,
             )
-            action_room.items.append(new_item)
+            add_item(action_world, action_room, new_item)
 
             broadcast(
                 format_prompt(
@@ -142,7 +142,7 @@ def action_use(item: str, target: str) -> str:
         item: The name of the item to use.
         target: The name of the character to use the item on, or "self" to use the item on yourself.
     """
-    with action_context() as (action_room, action_character):
+    with world_context() as (action_world, action_room, action_character):
         dungeon_master = get_dungeon_master()
 
         action_item = next(
@@ -206,7 +206,7 @@ def action_use(item: str, target: str) -> str:
         effect.last_used = current_turn
 
         try:
-            apply_effects(target_character, [effect])
+            apply_effects(action_world, target_character, [effect])
         except Exception:
             logger.exception("error applying effect: %s", effect)
             raise ValueError(
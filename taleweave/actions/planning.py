@@ -9,7 +9,15 @@ from taleweave.context import (
 from taleweave.errors import ActionError
 from taleweave.models.planning import CalendarEvent
 from taleweave.systems.core.planning import PLANNING_SYSTEM_NAME
-from taleweave.utils.planning import get_recent_notes
+from taleweave.utils.planning import (
+    add_event,
+    add_note,
+    erase_prefix_notes,
+    get_recent_notes,
+    has_note,
+    replace_note,
+    set_notes,
+)
 from taleweave.utils.template import format_prompt
 
 
@@ -25,13 +33,13 @@ def take_note(fact: str):
     config = get_game_config()
 
     with action_context() as (_, action_character):
-        if fact in action_character.planner.notes:
+        if has_note(action_character, fact):
             raise ActionError(get_prompt("action_take_note_error_duplicate"))
 
         if len(action_character.planner.notes) >= config.world.character.note_limit:
             raise ActionError(get_prompt("action_take_note_error_limit"))
 
-        action_character.planner.notes.append(fact)
+        add_note(action_character, fact)
 
         return get_prompt("action_take_note_result")
 
@@ -61,17 +69,11 @@ def erase_notes(prefix: str) -> str:
         if len(action_character.planner.notes) == 0:
             raise ActionError(get_prompt("action_erase_notes_error_empty"))
 
-        matches = [
-            note for note in action_character.planner.notes if note.startswith(prefix)
-        ]
-        if not matches:
+        count = erase_prefix_notes(action_character, prefix)
+        if count == 0:
             raise ActionError(get_prompt("action_erase_notes_error_match"))
 
-        action_character.planner.notes[:] = [
-            note for note in action_character.planner.notes if note not in matches
-        ]
-
-        return format_prompt("action_erase_notes_result", count=len(matches))
+        return format_prompt("action_erase_notes_result", count=count)
 
 
 def edit_note(old: str, new: str) -> str:
@@ -87,12 +89,10 @@ def edit_note(old: str, new: str) -> str:
         if len(action_character.planner.notes) == 0:
             raise ActionError(get_prompt("action_edit_note_error_empty"))
 
-        if old not in action_character.planner.notes:
+        if not has_note(action_character, old):
             raise ActionError(get_prompt("action_edit_note_error_match"))
 
-        action_character.planner.notes[:] = [
-            new if note == old else note for note in action_character.planner.notes
-        ]
+        replace_note(action_character, old, new)
 
         return get_prompt("action_edit_note_result")
 
@@ -132,7 +132,7 @@ def summarize_notes(limit: int) -> str:
                 )
             )
 
-        action_character.planner.notes[:] = new_notes
+        set_notes(action_character, new_notes)
         return get_prompt("action_summarize_notes_result")
 
 
@@ -164,7 +164,7 @@ def schedule_event(name: str, turns: int):
             raise ActionError(get_prompt("action_schedule_event_error_duplicate"))
 
         event = CalendarEvent(name, turns + current_turn)
-        action_character.planner.calendar.events.append(event)
+        add_event(action_character, event)
         return format_prompt("action_schedule_event_result", name=name, turns=turns)
 
 
@@ -1,4 +1,5 @@
 from contextlib import contextmanager
+from contextvars import ContextVar
 from logging import getLogger
 from types import UnionType
 from typing import (
@@ -6,6 +7,7 @@ from typing import (
     Callable,
     Dict,
     List,
+    NamedTuple,
     Sequence,
     Tuple,
     Type,
@@ -26,17 +28,85 @@ from taleweave.utils.string import normalize_name
 
 logger = getLogger(__name__)
 
+
+class ActionContext(NamedTuple):
+    """
+    The world, room, character, and turn for the action that is currently running.
+
+    Fields that are None fall back to the shared world context.
+    """
+
+    world: World | None = None
+    room: Room | None = None
+    character: Character | None = None
+    turn: int | None = None
+
+
+class CharacterAgentRegistry:
+    """
+    The characters and their agents, indexed by normalized name, character ID, and agent identity.
+    """
+
+    entries: Dict[str, Tuple[Character, Agent]]
+    agent_index: Dict[int, Tuple[Character, Agent]]
+    id_index: Dict[str, Tuple[Character, Agent]]
+    name_index: Dict[str, Tuple[Character, Agent]]
+
+    def __init__(self):
+        self.entries = {}
+        self.agent_index = {}
+        self.id_index = {}
+        self.name_index = {}
+
+    def set(self, name: str, character: Character, agent: Agent):
+        previous = self.entries.get(name)
+        if previous:
+            self.remove_index(previous)
+
+        entry = (character, agent)
+        self.entries[name] = entry
+        self.agent_index[id(agent)] = entry
+        self.id_index[character.id] = entry
+        self.name_index[normalize_name(character.name)] = entry
+
+    def remove_index(self, entry: Tuple[Character, Agent]):
+        character, agent = entry
+
+        if self.agent_index.get(id(agent)) is entry:
+            del self.agent_index[id(agent)]
+
+        if self.id_index.get(character.id) is entry:
+            del self.id_index[character.id]
+
+        name = normalize_name(character.name)
+        if self.name_index.get(name) is entry:
+            del self.name_index[name]
+
+    def get_by_agent(self, agent: Agent) -> Tuple[Character, Agent] | None:
+        return self.agent_index.get(id(agent))
+
+    def get_by_character(self, character: Character) -> Tuple[Character, Agent] | None:
+        return self.id_index.get(character.id)
+
+    def get_by_name(self, name: str) -> Tuple[Character, Agent] | None:
+        return self.name_index.get(normalize_name(name))
+
+    def values(self) -> List[Tuple[Character, Agent]]:
+        return list(self.entries.values())
+
+
 # world context
 current_turn = 0
 current_world: World | None = None
-current_room: Room | None = None
-current_character: Character | None = None
+current_action: ContextVar[ActionContext] = ContextVar(
+    "current_action", default=ActionContext()
+)
 dungeon_master: Agent | None = None
 
 # game context
 # TODO: wrap these into a class that can be passed around
 action_groups: Dict[str, List[Callable[..., str]]] = {}
-character_agents: Dict[str, Tuple[Character, Agent]] = {}
+character_agents = CharacterAgentRegistry()
 event_emitter = EventEmitter()
 game_config: Config = DEFAULT_CONFIG
 game_systems: List[GameSystem] = []
@@ -107,11 +177,32 @@ def world_context():
     yield world, room, character
 
 
+@contextmanager
+def bind_action_context(
+    world: World | None = None,
+    room: Room | None = None,
+    character: Character | None = None,
+    turn: int | None = None,
+):
+    """
+    Set the action context for the current thread or task, restoring the previous context on exit.
+    """
+
+    token = current_action.set(ActionContext(world, room, character, turn))
+    try:
+        yield current_action.get()
+    finally:
+        current_action.reset(token)
+
+
 # endregion
 
 
 # region context getters
 def get_action_context() -> Tuple[Room, Character]:
+    current_room = get_current_room()
+    current_character = get_current_character()
+
     if not current_room:
         raise ValueError("The current room must be set before calling action functions")
     if not current_character:
@@ -123,6 +214,10 @@ def get_action_context() -> Tuple[Room, Character]:
 
 
 def get_world_context() -> Tuple[World, Room, Character]:
+    current_world = get_current_world()
+    current_room = get_current_room()
+    current_character = get_current_character()
+
     if not current_world:
         raise ValueError(
             "The current world must be set before calling action functions"
@@ -137,20 +232,28 @@ def get_world_context() -> Tuple[World, Room, Character]:
     return (current_world, current_room, current_character)
 
 
+def get_current_action() -> ActionContext:
+    return current_action.get()
+
+
 def get_current_world() -> World | None:
-    return current_world
+    return current_action.get().world or current_world
 
 
 def get_current_room() -> Room | None:
-    return current_room
+    return current_action.get().room
 
 
 def get_current_character() -> Character | None:
-    return current_character
+    return current_action.get().character
 
 
 def get_current_turn() -> int:
-    return current_turn
+    turn = current_action.get().turn
+    if turn is None:
+        return current_turn
+
+    return turn
 
 
 def get_dungeon_master() -> Agent:
@@ -200,13 +303,11 @@ def set_current_world(world: World | None):
 
 
 def set_current_room(room: Room | None):
-    global current_room
-    current_room = room
+    current_action.set(current_action.get()._replace(room=room))
 
 
 def set_current_character(character: Character | None):
-    global current_character
-    current_character = character
+    current_action.set(current_action.get()._replace(character=character))
 
 
 def set_current_turn(turn: int):
@@ -215,7 +316,7 @@ def set_current_turn(turn: int):
 
 
 def set_character_agent(name, character, agent):
-    character_agents[name] = (character, agent)
+    character_agents.set(name, character, agent)
 
 
 def set_dungeon_master(agent):
@@ -252,42 +353,29 @@ def add_extra_actions(group: str, actions: List[Callable[..., str]]):
 
 # region search functions
 def get_character_for_agent(agent: Agent) -> Character | None:
-    return next(
-        (
-            inner_character
-            for inner_character, inner_agent in character_agents.values()
-            if inner_agent == agent
-        ),
-        None,
-    )
+    entry = character_agents.get_by_agent(agent)
+    if entry:
+        return entry[0]
+
+    return None
 
 
 def get_agent_for_character(character: Character) -> Agent | None:
-    return next(
-        (
-            inner_agent
-            for inner_character, inner_agent in character_agents.values()
-            if inner_character == character
-        ),
-        None,
-    )
+    entry = character_agents.get_by_character(character)
+    if entry:
+        return entry[1]
+
+    return None
 
 
 def get_character_agent_for_name(
     name: str,
 ) -> Tuple[Character, Agent] | Tuple[None, None]:
-    return next(
-        (
-            (character, agent)
-            for character, agent in character_agents.values()
-            if normalize_name(character.name) == normalize_name(name)
-        ),
-        (None, None),
-    )
+    return character_agents.get_by_name(name) or (None, None)
 
 
 def get_all_character_agents():
-    return list(character_agents.values())
+    return character_agents.values()
 
 
 # endregion
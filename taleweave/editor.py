@@ -28,7 +28,15 @@ from taleweave.models.config import DEFAULT_CONFIG, Config
 from taleweave.models.entity import World, WorldState
 from taleweave.models.event import GenerateEvent
 from taleweave.plugins import load_plugin
-from taleweave.utils.file import load_yaml, save_yaml
+from taleweave.state import snapshot_system_data, write_world_state
+from taleweave.utils.file import (
+    dump_state_data,
+    load_state_data,
+    load_yaml,
+    write_atomic,
+)
+from taleweave.utils.index import add_character, add_item, add_portal, add_room
+from taleweave.utils.journal import load_state_file
 from taleweave.utils.search import (
     find_character,
     find_item,
@@ -39,6 +47,7 @@ from taleweave.utils.search import (
     list_portals,
     list_rooms,
 )
+from taleweave.utils.store import WorldStore, is_store_file
 from taleweave.utils.world import describe_entity
 
 ENTITY_TYPES = ["room", "portal", "item", "character"]
@@ -160,17 +169,34 @@ def parse_args():
 def load_world(state_file, world_file) -> Tuple[World, WorldState | None]:
     systems = get_game_systems()
 
+    if state_file and is_store_file(state_file):
+        if not path.exists(state_file):
+            raise ValueError(f"World store {state_file} does not exist")
+
+        store = WorldStore(state_file)
+        try:
+            if not store.has_state():
+                raise ValueError(
+                    f"World store {state_file} does not have a world state"
+                )
+
+            state = WorldState(**store.load())
+            load_or_initialize_system_data(world_file, systems, state.world, store)
+        finally:
+            store.close()
+
+        return (state.world, state)
+
     if state_file and path.exists(state_file):
-        with open(state_file, "r") as f:
-            state = WorldState(**load_yaml(f))
+        # replay the journal, so the editor sees the same state as the engine
+        state = WorldState(**load_state_file(state_file))
 
         load_or_initialize_system_data(world_file, systems, state.world)
 
         return (state.world, state)
 
     if world_file and path.exists(world_file):
-        with open(world_file, "r") as f:
-            world = World(**load_yaml(f))
+        world = World(**load_state_data(world_file))
 
         load_or_initialize_system_data(world_file, systems, world)
 
@@ -189,14 +215,16 @@ def save_world(state_file, world_file, world: World, state: WorldState | None):
         logger.warning(f"Saving world {world.name} to {state_file}")
         return
 
-        with open(state_file, "w") as f:
-            save_yaml(f, dump_model(WorldState, state))
+        json_state = dump_model(WorldState, state)
+        if is_store_file(state_file):
+            json_state["systems"] = snapshot_system_data(get_game_systems())
+
+        write_world_state(json_state, state_file)
     else:
         logger.warning(f"Saving world {world.name} to {world_file}")
         return
 
-        with open(world_file, "w") as f:
-            save_yaml(f, dump_model(World, world))
+        write_atomic(world_file, dump_state_data(world_file, dump_model(World, world)))
 
 
 def command_new(args):
@@ -293,7 +321,7 @@ def command_generate(args):
 
     if args.type == "room":
         room = generate_room(dungeon_master, world, systems)
-        world.rooms.append(room)
+        add_room(world, room)
 
     if args.type == "portal":
         source_room = find_room(world, args.room)
@@ -309,8 +337,8 @@ def command_generate(args):
         outgoing_portal, incoming_portal = generate_portals(
             dungeon_master, world, source_room, destination_room, systems
         )
-        source_room.portals.append(outgoing_portal)
-        destination_room.portals.append(incoming_portal)
+        add_portal(world, source_room, outgoing_portal)
+        add_portal(world, destination_room, incoming_portal)
 
     if args.type == "item":
         # TODO: add item to character or container inventory
@@ -320,7 +348,7 @@ def command_generate(args):
             return
 
         item = generate_item(dungeon_master, world, systems)
-        room.items.append(item)
+        add_item(world, room, item)
 
     if args.type == "character":
         room = find_room(world, args.room)
@@ -331,7 +359,7 @@ def command_generate(args):
         character = generate_character(
             dungeon_master, world, systems, room, args.prompt
         )
-        room.characters.append(character)
+        add_character(world, room, character)
 
     save_world(args.state, args.world, world, state)
 
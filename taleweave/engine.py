@@ -21,16 +21,31 @@ from taleweave.models.entity import World, WorldState
 from taleweave.models.files import WorldPrompt
 from taleweave.state import create_agents, save_world
 from taleweave.utils.file import load_yaml
+from taleweave.utils.index import add_room
+from taleweave.utils.journal import load_state_file
+from taleweave.utils.store import WorldStore, is_store_file
 from taleweave.utils.template import format_prompt
+from taleweave.utils.world import get_description_cache
 
 logger = getLogger(__name__)
 
 
 def load_or_initialize_system_data(
-    world_path: str, systems: List[GameSystem], world: World
+    world_path: str,
+    systems: List[GameSystem],
+    world: World,
+    store: WorldStore | None = None,
 ):
     for system in systems:
-        if system.data:
+        if store and system.data and system.data.restore:
+            if store.has_system_data(system.name):
+                logger.info(f"loading system data for {system.name} from {store.path}")
+                data = system.data.restore(store.load_system_data(system.name))
+                set_system_data(system.name, data)
+                continue
+            else:
+                logger.info(f"no system data found for {system.name} in {store.path}")
+        elif system.data:
             system_data_file = f"{world_path}.{system.name}.json"
 
             if path.exists(system_data_file):
@@ -47,9 +62,15 @@ def load_or_initialize_system_data(
             set_system_data(system.name, data)
 
 
-def save_system_data(world_path: str, systems: List[GameSystem]):
+def save_system_data(
+    world_path: str, systems: List[GameSystem], store: WorldStore | None = None
+):
     for system in systems:
-        if system.data:
+        if store and system.data and system.data.dump:
+            logger.info(f"saving system data for {system.name} to {store.path}")
+            data = system.data.dump(get_system_data(system.name))
+            store.save_system_data(system.name, data)
+        elif system.data:
             system_data_file = f"{world_path}.{system.name}.json"
             logger.info(f"saving system data to {system_data_file}")
             system.data.save(system_data_file, get_system_data(system.name))
@@ -89,10 +110,24 @@ def load_or_generate_world(
     )
     set_dungeon_master(world_builder)
 
-    if path.exists(world_state_file):
+    # world stores hold the world state and system data, and are updated in place
+    store = None
+    if is_store_file(world_state_file):
+        store = WorldStore(world_state_file)
+
+    if store and store.has_state():
+        logger.info(f"loading world state from store {world_state_file}")
+        state = WorldState(**store.load())
+
+        set_current_turn(state.turn)
+        load_or_initialize_system_data(world_path, systems, state.world, store)
+
+        memory = state.memory
+        turn = state.turn
+        world = state.world
+    elif not store and path.exists(world_state_file):
         logger.info(f"loading world state from {world_state_file}")
-        with open(world_state_file, "r") as f:
-            state = WorldState(**load_yaml(f))
+        state = WorldState(**load_state_file(world_state_file))
 
         set_current_turn(state.turn)
         load_or_initialize_system_data(world_path, systems, state.world)
@@ -105,7 +140,7 @@ def load_or_generate_world(
         with open(world_file, "r") as f:
             world = World(**load_yaml(f))
 
-        load_or_initialize_system_data(world_path, systems, world)
+        load_or_initialize_system_data(world_path, systems, world, store)
     else:
         logger.info(f"generating a new world using theme: {world_prompt.theme}")
         world = generate_world(
@@ -115,11 +150,13 @@ def load_or_generate_world(
             systems,
             room_count=room_count,
         )
-        load_or_initialize_system_data(world_path, systems, world)
+        load_or_initialize_system_data(world_path, systems, world, store)
 
     # TODO: check if there have been any changes before saving
     save_world(world, world_file)
-    save_system_data(world_path, systems)
+    save_system_data(world_path, systems, store)
+    if store:
+        store.close()
 
     if add_rooms:
         new_rooms = []
@@ -129,7 +166,7 @@ def load_or_generate_world(
                 world_builder, world, systems, current_room=i, total_rooms=add_rooms
             )
             new_rooms.append(room)
-            world.rooms.append(room)
+            add_room(world, room)
 
         # if the world was already full, no new rooms will be added
         if new_rooms:
@@ -152,6 +189,9 @@ def simulate_world(world: World, systems: List[GameSystem], turns: int):
                 logger.info(f"running system {system.name}")
                 system.simulate(world, current_turn)
 
+        cache = get_description_cache()
+        logger.info("description cache: %d hits, %d misses", cache.hits, cache.misses)
+
         set_current_turn(current_turn + 1)
         if i >= turns:
             logger.info("reached turn limit at world turn %s", current_turn + 1)
@@ -55,16 +55,30 @@ class SystemSimulate(Protocol):
 class SystemData:
     load: Callable[[str], Any]
     save: Callable[[str, Any], None]
+    # convert the data to and from plain values, so it can be kept in a world store instead of a file
+    dump: Callable[[Any], Any] | None = None
+    restore: Callable[[Any], Any] | None = None
 
-    def __init__(self, load: Callable[[str], Any], save: Callable[[str, Any], None]):
+    def __init__(
+        self,
+        load: Callable[[str], Any],
+        save: Callable[[str, Any], None],
+        *,
+        dump: Callable[[Any], Any] | None = None,
+        restore: Callable[[Any], Any] | None = None,
+    ):
         self.load = load
         self.save = save
+        self.dump = dump
+        self.restore = restore
 
 
 class GameSystem:
     name: str
     data: SystemData | None = None
     format: SystemFormat | None = None
+    # the format callback only depends on the entity's name and attributes, so it can be cached
+    format_cache: bool = False
     generate: SystemGenerate | None = None
     initialize: SystemInitialize | None = None
     simulate: SystemSimulate | None = None
@@ -76,6 +90,7 @@ class GameSystem:
         *,
         data: SystemData | None = None,
         format: SystemFormat | None = None,
+        format_cache: bool = False,
         generate: SystemGenerate | None = None,
         initialize: SystemInitialize | None = None,
         simulate: SystemSimulate | None = None,
@@ -83,6 +98,7 @@ class GameSystem:
         self.name = name
         self.data = data
         self.format = format
+        self.format_cache = format_cache
         self.generate = generate
         self.initialize = initialize
         self.simulate = simulate
@@ -25,6 +25,7 @@ from taleweave.models.entity import Character, Item, Portal, Room, World, WorldE
 from taleweave.models.event import GenerateEvent
 from taleweave.utils import try_parse_float, try_parse_int
 from taleweave.utils.effect import resolve_int_range
+from taleweave.utils.index import add_portal, add_room
 from taleweave.utils.search import (
     list_characters,
     list_characters_in_room,
@@ -562,8 +563,8 @@ def link_rooms(
                     agent, world, room, dest_room, systems
                 )
 
-                room.portals.append(outgoing_portal)
-                dest_room.portals.append(incoming_portal)
+                add_portal(world, room, outgoing_portal)
+                add_portal(world, dest_room, incoming_portal)
             except Exception:
                 logger.exception("error generating portal")
                 continue
@@ -597,7 +598,7 @@ def generate_world(
             )
             generate_system_attributes(agent, world, room, systems)
             broadcast_generated(entity=room)
-            world.rooms.append(room)
+            add_room(world, room)
         except Exception:
             logger.exception("error generating room")
             continue
@@ -46,6 +46,7 @@ else:
 if True:
     from taleweave.context import (
         get_prompt_library,
+        get_system_config,
         set_current_world,
         set_game_config,
         set_game_systems,
@@ -59,7 +60,23 @@ if True:
     from taleweave.models.files import TemplateFile, WorldPrompt
     from taleweave.models.prompt import PromptLibrary
     from taleweave.plugins import load_plugin
-    from taleweave.state import save_world_state
+    from taleweave.state import (
+        JournalWriter,
+        SnapshotWriter,
+        StoreWriter,
+        snapshot_system_data,
+        snapshot_world,
+    )
+    from taleweave.systems.core.graph import GRAPH_SYSTEM, graph_renderer
+    from taleweave.systems.core.graph import init as init_graph
+    from taleweave.systems.generic.logic import (
+        LOGIC_ENGINE_MODES,
+        LOGIC_ENGINE_SYSTEM,
+        fuse_logic,
+    )
+    from taleweave.utils.store import is_store_file
+    from taleweave.utils.template import compile_prompt_library
+    from taleweave.utils.worker import CoalescingWorker
 
 
 def int_or_inf(value: str) -> float | int:
@@ -106,6 +123,16 @@ def parse_args():
         action="store_true",
         help="Whether to run the websocket server",
     )
+    parser.add_argument(
+        "--profile-logic",
+        type=str,
+        help="The JSON or CSV file to save the logic rule profile to",
+    )
+    parser.add_argument(
+        "--track-changes",
+        action="store_true",
+        help="Compare entity versions instead of attributes in the effective attribute and description caches",
+    )
 
     # data and plugin arguments
     parser.add_argument(
@@ -174,7 +201,16 @@ def parse_args():
     parser.add_argument(
         "--world-state",
         type=str,
-        help="The file to save the world state to. Defaults to $world.state.json, if not set",
+        help=(
+            "The file to save the world state to. Defaults to $world.state.json, if not set. "
+            "Files ending in .msgpack or .msgpack.zst use a binary format, and .db or .sqlite files use a world store"
+        ),
+    )
+    parser.add_argument(
+        "--world-journal",
+        type=int,
+        default=0,
+        help="Save the world state as a journal of changes, compacting it every N turns",
     )
     parser.add_argument(
         "--world-template",
@@ -221,6 +257,7 @@ def load_prompt_library(args) -> None:
                 library = get_prompt_library()
                 library.prompts.update(new_library.prompts)
 
+    compile_prompt_library(get_prompt_library())
     return None
 
 
@@ -275,6 +312,24 @@ def main():
             f"added actions to group '{action_group}': {[action.__name__ for action in module_actions]}"
         )
 
+    # record logic rule statistics, if enabled, before the logic tables are compiled
+    if args.profile_logic:
+        from taleweave.systems.generic.profiler import (
+            LogicProfiler,
+            format_summary,
+            set_logic_profiler,
+        )
+
+        profiler = LogicProfiler()
+        set_logic_profiler(profiler)
+
+        def save_logic_profile():
+            profiler.save(args.profile_logic)
+            for line in format_summary(profiler.report()):
+                logger.info(line)
+
+        atexit.register(save_logic_profile)
+
     # set up the game systems
     systems: List[GameSystem] = []
     for system_name in args.systems or []:
@@ -283,6 +338,29 @@ def main():
         logger.info(f"loaded game systems: {module_systems}")
         systems.extend(module_systems)
 
+    # record entity versions, if enabled
+    if args.track_changes:
+        from taleweave.utils.changes import ChangeTracker, set_change_tracker
+
+        set_change_tracker(ChangeTracker())
+
+    # merge the logic systems into a single pass, if enabled
+    logic_engine = get_system_config(LOGIC_ENGINE_SYSTEM)
+    if isinstance(logic_engine, str) and logic_engine not in LOGIC_ENGINE_MODES:
+        logger.warning(
+            "unknown logic engine mode %s, expected one of %s",
+            logic_engine,
+            LOGIC_ENGINE_MODES,
+        )
+        logic_engine = True
+
+    if logic_engine:
+        systems = fuse_logic(
+            systems,
+            columnar=(logic_engine == "columnar"),
+            incremental=(logic_engine == "incremental"),
+        )
+
     # make sure the server system runs after any updates
     if args.server:
         from taleweave.server.websocket import server_system
@@ -306,10 +384,36 @@ def main():
     )
     set_current_world(world)
 
+    # render the world graph when the rooms or characters move, unless disabled
+    if get_system_config(GRAPH_SYSTEM) is not False and not any(
+        system.name == GRAPH_SYSTEM for system in systems
+    ):
+        systems.extend(init_graph())
+
+    atexit.register(graph_renderer.stop)
+
+    # write snapshots in the background, making sure the last one is written before exiting
+    snapshot_writer: CoalescingWorker
+    if is_store_file(world_state_file):
+        snapshot_writer = StoreWriter()
+    elif args.world_journal > 0:
+        snapshot_writer = JournalWriter(args.world_journal)
+    else:
+        snapshot_writer = SnapshotWriter()
+
+    snapshot_writer.start()
+    atexit.register(snapshot_writer.stop)
+
     # make sure the snapshot system runs last
     def snapshot_system(world: World, turn: int, data: None = None) -> None:
         logger.info("taking snapshot of world state")
-        save_world_state(world, turn, world_state_file)
+        snapshot = snapshot_world(world, turn)
+
+        # world stores save the system data with the world state on each turn
+        if is_store_file(world_state_file):
+            snapshot["systems"] = snapshot_system_data(systems)
+
+        snapshot_writer.submit(world_state_file, snapshot)
 
     systems.append(GameSystem(name="snapshot", simulate=snapshot_system))
 
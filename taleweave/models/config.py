@@ -1,7 +1,9 @@
-from typing import Dict, List
+from typing import Dict, List, Literal
 
 from .base import Attributes, IntRange, dataclass
 
+DEFAULT_DIGEST_LIMIT = 100
+
 
 @dataclass
 class Size:
@@ -67,6 +69,7 @@ class WorldCharacterConfig:
     event_limit: int
     memory_limit: int
     note_limit: int
+    digest_limit: int = DEFAULT_DIGEST_LIMIT
 
 
 @dataclass
@@ -84,6 +87,8 @@ class WorldTurnConfig:
     action_retries: int
     planning_steps: int
     planning_retries: int
+    action_concurrency: int = 1
+    action_conflicts: Literal["reject", "retry"] = "retry"
 
 
 @dataclass
@@ -146,6 +151,8 @@ DEFAULT_CONFIG = Config(
             action_retries=5,
             planning_steps=3,
             planning_retries=3,
+            action_concurrency=1,
+            action_conflicts="retry",
         ),
     ),
 )
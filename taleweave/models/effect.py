@@ -97,5 +97,6 @@ class EffectResult:
     description: str
     attributes: List[AttributeEffectResult] = Field(default_factory=list)
     duration: int | None = None
+    expires: int | None = None
     id: str = Field(default_factory=uuid)
     type: Literal["effect_result"] = "effect_result"
@@ -15,6 +15,10 @@ class CalendarEvent:
 class Calendar:
     events: List[CalendarEvent] = Field(default_factory=list)
 
+    def __post_init__(self):
+        # keep the events ordered by turn, so they can be searched by turn
+        self.events.sort(key=lambda event: event.turn)
+
 
 @dataclass
 class Planner:
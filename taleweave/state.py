@@ -1,7 +1,6 @@
 from collections import deque
-from json import dump
-from os import path
-from typing import Dict, List, Sequence
+from logging import getLogger
+from typing import Any, Dict, List, Sequence
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from packit.agent import Agent, agent_easy_connect
@@ -9,12 +8,20 @@ from packit.agent import Agent, agent_easy_connect
 from taleweave.context import (
     get_all_character_agents,
     get_game_config,
+    get_system_data,
     set_character_agent,
 )
+from taleweave.game_system import GameSystem
 from taleweave.models.base import dump_model, dump_model_json
 from taleweave.models.entity import World
 from taleweave.player import LocalPlayer
+from taleweave.utils.effect import update_effect_durations
+from taleweave.utils.journal import StateJournal, write_state_file
+from taleweave.utils.store import WorldStore, is_store_file
 from taleweave.utils.template import format_prompt
+from taleweave.utils.worker import CoalescingWorker
+
+logger = getLogger(__name__)
 
 
 def create_agents(
@@ -40,24 +47,9 @@ def create_agents(
             set_character_agent(character.name, character, agent)
 
 
-def graph_world(world: World, turn: int):
-    import graphviz
-
-    graph_name = f"{path.basename(world.name)}-{turn}"
-    graph = graphviz.Digraph(graph_name, format="png")
-    for room in world.rooms:
-        characters = [character.name for character in room.characters]
-        room_label = "\n".join([room.name, *characters])
-        graph.node(room.name, room_label)
-        for portal in room.portals:
-            graph.edge(room.name, portal.destination, label=portal.name)
-
-    graph_path = path.dirname(world.name)
-    graph.render(directory=graph_path)
-
-
 def snapshot_world(world: World, turn: int):
     # save the world itself, along with the turn number and the memory of each agent
+    update_effect_durations(world, turn)
     json_world = dump_model(World, world)
 
     json_memory = {}
@@ -101,10 +93,94 @@ def save_world(world, filename):
 
 
 def save_world_state(world, turn, filename):
-    graph_world(world, turn)
     json_state = snapshot_world(world, turn)
-    with open(filename, "w") as f:
-        dump(json_state, f, default=world_json, indent=2)
+    write_world_state(json_state, filename)
+
+
+def snapshot_system_data(systems: List[GameSystem]) -> Dict[str, Any]:
+    # dump the data for each system that can be kept in a world store
+    return {
+        system.name: system.data.dump(get_system_data(system.name))
+        for system in systems
+        if system.data and system.data.dump
+    }
+
+
+def write_world_state(json_state: Dict[str, Any], filename: str):
+    if is_store_file(filename):
+        store = WorldStore(filename, default=world_json)
+        try:
+            store.write(json_state)
+        finally:
+            store.close()
+
+        return
+
+    write_state_file(filename, json_state, default=world_json)
+
+
+class SnapshotWriter(CoalescingWorker):
+    """
+    Write world state snapshots on a background thread, so the turn does not wait for serialization or disk I/O.
+
+    Snapshots are taken on the simulation thread and submitted with their filename. Only the latest pending snapshot
+    for each file is kept, so when writes fall behind, older snapshots are skipped rather than queued.
+    """
+
+    def __init__(self):
+        super().__init__("snapshot")
+
+    def handle(self, key: str, item: Any) -> None:
+        write_world_state(item, key)
+
+
+class JournalWriter(CoalescingWorker):
+    """
+    Write world state snapshots on a background thread as a base snapshot and a journal of the changes on each turn.
+    """
+
+    compact_turns: int
+    journals: Dict[str, StateJournal]
+
+    def __init__(self, compact_turns: int):
+        super().__init__("journal")
+        self.compact_turns = compact_turns
+        self.journals = {}
+
+    def handle(self, key: str, item: Any) -> None:
+        journal = self.journals.get(key)
+        if journal is None:
+            journal = self.journals[key] = StateJournal(
+                key, self.compact_turns, default=world_json
+            )
+
+        journal.write(item)
+
+
+class StoreWriter(CoalescingWorker):
+    """
+    Write world state snapshots on a background thread to a world store, only updating the rows that have changed.
+    """
+
+    stores: Dict[str, WorldStore]
+
+    def __init__(self):
+        super().__init__("store")
+        self.stores = {}
+
+    def handle(self, key: str, item: Any) -> None:
+        store = self.stores.get(key)
+        if store is None:
+            store = self.stores[key] = WorldStore(key, default=world_json)
+
+        store.write(item)
+
+    def stop(self) -> None:
+        super().stop()
+        for store in self.stores.values():
+            store.close()
+
+        self.stores = {}
 
 
 def world_json(obj):
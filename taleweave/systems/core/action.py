@@ -1,6 +1,7 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from json import loads
 from logging import getLogger
-from typing import Any
+from typing import Any, Dict, List, Set
 
 from packit.errors import ToolError
 from packit.loops import loop_retry
@@ -8,20 +9,23 @@ from packit.results import function_result
 from packit.toolbox import Toolbox
 
 from taleweave.context import (
+    bind_action_context,
     broadcast,
     get_action_group,
     get_character_agent_for_name,
     get_character_for_agent,
     get_current_world,
+    get_game_config,
     set_current_character,
     set_current_room,
 )
 from taleweave.errors import ActionError
 from taleweave.game_system import GameSystem
-from taleweave.models.entity import World
+from taleweave.models.entity import Character, Room, World
 from taleweave.models.event import ActionEvent, ResultEvent
-from taleweave.utils.effect import expire_effects
+from taleweave.utils.effect import expire_world_effects
 from taleweave.utils.search import find_containing_room
+from taleweave.utils.string import normalize_name
 from taleweave.utils.template import format_prompt
 from taleweave.utils.world import format_attributes
 
@@ -51,9 +55,70 @@ def world_result_parser(value, agent, **kwargs):
     return function_result(value, agent=agent, **kwargs)
 
 
-def prompt_character_action(
-    room, character, agent, action_toolbox, current_turn
-) -> str:
+def clean_action_value(value: str) -> str:
+    """
+    Clean up common formatting problems in an action reply before parsing it.
+    """
+
+    # trim suffixes that are used elsewhere
+    value = value.removesuffix("END").strip()
+
+    # fix the "action_ move" whitespace issue
+    if '"action_ ' in value:
+        value = value.replace('"action_ ', '"action_')
+
+    # fix unbalanced curly braces
+    if value.startswith("{") and not value.endswith("}"):
+        open_count = value.count("{")
+        close_count = value.count("}")
+
+        if open_count > close_count:
+            fixed_value = value + ("}" * (open_count - close_count))
+            try:
+                loads(fixed_value)
+                value = fixed_value
+            except Exception:
+                pass
+
+    return value
+
+
+def convert_tool_error(error: ToolError, action_names: List[str]) -> ActionError:
+    """
+    Convert a tool error into an action error that can be shown to the character.
+    """
+
+    e_str = str(error)
+    if e_str and "Error running tool" in e_str:
+        # extract the tool name and rest of the message from the error
+        # the format is: "Error running tool: <action_name>: <message>"
+        action_name, message = e_str.split(":", 1)
+        action_name = action_name.removeprefix("Error running tool").strip()
+        message = message.strip()
+        return ActionError(
+            format_prompt(
+                "world_simulate_character_action_error_action",
+                action=action_name,
+                message=message,
+            )
+        )
+    elif e_str and "Unknown tool" in e_str:
+        return ActionError(
+            format_prompt(
+                "world_simulate_character_action_error_unknown_tool",
+                actions=action_names,
+            )
+        )
+    else:
+        return ActionError(
+            format_prompt(
+                "world_simulate_character_action_error_json",
+                actions=action_names,
+            )
+        )
+
+
+def format_action_prompt(room, character, action_toolbox, current_turn) -> str:
     action_names = action_toolbox.list_tools()
 
     # collect data for the prompt
@@ -67,30 +132,32 @@ def prompt_character_action(
     character_effects = [effect.name for effect in character.active_effects]
     character_items = [item.name for item in character.items]
 
+    return format_prompt(
+        "world_simulate_character_action",
+        actions=action_names,
+        character_effects=character_effects,
+        character_items=character_items,
+        attributes=character_attributes,
+        directions=room_directions,
+        room=room,
+        visible_characters=room_characters,
+        visible_items=room_items,
+        notes_prompt=notes_prompt,
+        events_prompt=events_prompt,
+    )
+
+
+def prompt_character_action(
+    room, character, agent, action_toolbox, current_turn
+) -> str:
+    action_names = action_toolbox.list_tools()
+
     # set up a result parser for the agent
     def result_parser(value, **kwargs):
         if not room or not character:
             raise ValueError("Room and character must be set before parsing results")
 
-        # trim suffixes that are used elsewhere
-        value = value.removesuffix("END").strip()
-
-        # fix the "action_ move" whitespace issue
-        if '"action_ ' in value:
-            value = value.replace('"action_ ', '"action_')
-
-        # fix unbalanced curly braces
-        if value.startswith("{") and not value.endswith("}"):
-            open_count = value.count("{")
-            close_count = value.count("}")
-
-            if open_count > close_count:
-                fixed_value = value + ("}" * (open_count - close_count))
-                try:
-                    loads(fixed_value)
-                    value = fixed_value
-                except Exception:
-                    pass
+        value = clean_action_value(value)
 
         try:
             # TODO: try to avoid parsing the JSON twice
@@ -102,52 +169,13 @@ def prompt_character_action(
 
             return result
         except ToolError as e:
-            e_str = str(e)
-            if e_str and "Error running tool" in e_str:
-                # extract the tool name and rest of the message from the error
-                # the format is: "Error running tool: <action_name>: <message>"
-                action_name, message = e_str.split(":", 1)
-                action_name = action_name.removeprefix("Error running tool").strip()
-                message = message.strip()
-                raise ActionError(
-                    format_prompt(
-                        "world_simulate_character_action_error_action",
-                        action=action_name,
-                        message=message,
-                    )
-                )
-            elif e_str and "Unknown tool" in e_str:
-                raise ActionError(
-                    format_prompt(
-                        "world_simulate_character_action_error_unknown_tool",
-                        actions=action_names,
-                    )
-                )
-            else:
-                raise ActionError(
-                    format_prompt(
-                        "world_simulate_character_action_error_json",
-                        actions=action_names,
-                    )
-                )
+            raise convert_tool_error(e, action_names)
 
     # prompt and act
     logger.info("starting turn for character: %s", character.name)
     result = loop_retry(
         agent,
-        format_prompt(
-            "world_simulate_character_action",
-            actions=action_names,
-            character_effects=character_effects,
-            character_items=character_items,
-            attributes=character_attributes,
-            directions=room_directions,
-            room=room,
-            visible_characters=room_characters,
-            visible_items=room_items,
-            notes_prompt=notes_prompt,
-            events_prompt=events_prompt,
-        ),
+        format_action_prompt(room, character, action_toolbox, current_turn),
         result_parser=result_parser,
         toolbox=action_toolbox,
     )
@@ -168,7 +196,265 @@ def initialize_action(world: World):
     action_tools = Toolbox(get_action_group(ACTION_SYSTEM_NAME))
 
 
+def get_visible_names(room: Room, character: Character) -> Set[str]:
+    """
+    Collect the normalized names of the entities that a character can act on.
+    """
+
+    names = {normalize_name(other.name) for other in room.characters}
+    names.update(normalize_name(item.name) for item in room.items)
+    names.update(normalize_name(item.name) for item in character.items)
+    return names
+
+
+def find_action_conflicts(
+    value: str, frozen_names: Set[str], current_names: Set[str]
+) -> List[str]:
+    """
+    Find any parameters that named an entity which was visible when the character was prompted, but has since left the
+    room or been taken by another character.
+    """
+
+    call = loads(value)
+    parameters = call.get("parameters") if isinstance(call, dict) else None
+    if not isinstance(parameters, dict):
+        return []
+
+    return [
+        parameter
+        for parameter in parameters.values()
+        if isinstance(parameter, str)
+        and normalize_name(parameter) in frozen_names
+        and normalize_name(parameter) not in current_names
+    ]
+
+
+def prompt_character_call(agent, prompt: str, action_toolbox: Toolbox) -> str:
+    """
+    Prompt a character for their action without running it. The reply is checked for a valid tool call and returned
+    as a JSON string, so the action can be applied later.
+    """
+
+    action_names = action_toolbox.list_tools()
+
+    def result_parser(value, **kwargs):
+        value = clean_action_value(value)
+
+        try:
+            action = loads(value)
+        except Exception:
+            action = None
+
+        if not isinstance(action, dict) or "function" not in action:
+            raise ActionError(
+                format_prompt(
+                    "world_simulate_character_action_error_json",
+                    actions=action_names,
+                )
+            )
+
+        if action["function"] not in action_names:
+            raise ActionError(
+                format_prompt(
+                    "world_simulate_character_action_error_unknown_tool",
+                    actions=action_names,
+                )
+            )
+
+        return value
+
+    logger.info("prompting character for action: %s", agent.name)
+    return loop_retry(
+        agent,
+        prompt,
+        result_parser=result_parser,
+        toolbox=action_toolbox,
+    )
+
+
+def apply_character_call(
+    room: Room,
+    character: Character,
+    agent,
+    value: str,
+    frozen_names: Set[str],
+    action_toolbox: Toolbox,
+) -> str:
+    """
+    Run an action that was collected by prompt_character_call. Raises an ActionError if the action conflicts with
+    another character's action or cannot be run in the current room.
+    """
+
+    action_names = action_toolbox.list_tools()
+
+    conflicts = find_action_conflicts(
+        value, frozen_names, get_visible_names(room, character)
+    )
+    if conflicts:
+        raise ActionError(
+            format_prompt(
+                "world_simulate_character_action_error_conflict",
+                targets=conflicts,
+            )
+        )
+
+    event = ActionEvent.from_json(value, room, character)
+    broadcast(event)
+
+    try:
+        result = world_result_parser(value, agent=agent, toolbox=action_toolbox)
+    except ToolError as e:
+        raise convert_tool_error(e, action_names)
+
+    logger.debug(f"{character.name} action result: {result}")
+    if agent.memory:
+        agent.memory.append(result)
+
+    return result
+
+
+class PendingAction:
+    room: Room
+    character: Character
+    agent: Any
+    frozen_names: Set[str]
+    prompt: str
+
+    def __init__(
+        self,
+        room: Room,
+        character: Character,
+        agent,
+        frozen_names: Set[str],
+        prompt: str,
+    ):
+        self.room = room
+        self.character = character
+        self.agent = agent
+        self.frozen_names = frozen_names
+        self.prompt = prompt
+
+
+def prompt_pending_action(
+    world: World, turn: int, pending: PendingAction, action_toolbox: Toolbox
+) -> str:
+    with bind_action_context(world, pending.room, pending.character, turn):
+        return prompt_character_call(pending.agent, pending.prompt, action_toolbox)
+
+
+def simulate_action_concurrent(world: World, turn: int, workers: int):
+    """
+    Prompt every character for their action at the same time, then apply the actions in turn order.
+
+    An action that conflicts with an earlier action in the same turn is rejected. With `action_conflicts: retry`, the
+    character is prompted again on the simulation thread using prompt_character_action, with a fresh view of the room,
+    and their new action is applied before moving on to the next character.
+    """
+
+    config = get_game_config()
+    if action_tools is None:
+        raise ValueError("The action system must be initialized before simulating")
+
+    # freeze the view of the turn: format every prompt before any action is applied
+    pending_actions: List[PendingAction] = []
+    for character_name in world.order:
+        character, agent = get_character_agent_for_name(character_name)
+        if not agent or not character:
+            logger.error(f"agent or character not found for name {character_name}")
+            continue
+
+        room = find_containing_room(world, character)
+        if not room:
+            logger.error(f"character {character_name} is not in a room")
+            continue
+
+        set_current_room(room)
+        set_current_character(character)
+
+        try:
+            prompt = format_action_prompt(room, character, action_tools, turn)
+        except Exception:
+            logger.exception(f"error preparing action for character {character.name}")
+            continue
+
+        pending_actions.append(
+            PendingAction(
+                room, character, agent, get_visible_names(room, character), prompt
+            )
+        )
+
+    # prompt the characters at the same time, each with their own action context
+    calls: Dict[str, Future[str]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for pending in pending_actions:
+            calls[pending.character.name] = executor.submit(
+                prompt_pending_action, world, turn, pending, action_tools
+            )
+
+    values: Dict[str, str] = {}
+    for name, call in calls.items():
+        try:
+            values[name] = call.result()
+        except Exception:
+            logger.exception(f"error prompting character {name}")
+
+    # apply the actions in turn order
+    for pending in pending_actions:
+        character = pending.character
+        if character.name not in values:
+            continue
+
+        room = find_containing_room(world, character)
+        if not room:
+            logger.error(f"character {character.name} is not in a room")
+            continue
+
+        set_current_room(room)
+        set_current_character(character)
+
+        try:
+            result = apply_character_call(
+                room,
+                character,
+                pending.agent,
+                values[character.name],
+                pending.frozen_names,
+                action_tools,
+            )
+        except ActionError as e:
+            logger.warning(f"action conflict for character {character.name}: {e}")
+
+            if config.world.turn.action_conflicts == "retry":
+                try:
+                    result = prompt_character_action(
+                        room, character, pending.agent, action_tools, turn
+                    )
+                except Exception:
+                    logger.exception(
+                        f"error during action for character {character.name}"
+                    )
+                    continue
+            else:
+                result = str(e)
+                if pending.agent.memory:
+                    pending.agent.memory.append(result)
+        except Exception:
+            logger.exception(f"error during action for character {character.name}")
+            continue
+
+        result_event = ResultEvent(result=result, room=room, character=character)
+        broadcast(result_event)
+
+
 def simulate_action(world: World, turn: int, data: Any | None = None):
+    # remove any effects that have expired, before any character acts
+    expire_world_effects(world, turn)
+
+    config = get_game_config()
+    if config.world.turn.action_concurrency > 1:
+        simulate_action_concurrent(world, turn, config.world.turn.action_concurrency)
+        return
+
     for character_name in world.order:
         character, agent = get_character_agent_for_name(character_name)
         if not agent or not character:
@@ -184,9 +470,6 @@ def simulate_action(world: World, turn: int, data: Any | None = None):
         set_current_room(room)
         set_current_character(character)
 
-        # decrement effects on the character and remove any that have expired
-        expire_effects(character)
-
         try:
             result = prompt_character_action(room, character, agent, action_tools, turn)
             result_event = ResultEvent(result=result, room=room, character=character)
@@ -0,0 +1,92 @@
+from logging import getLogger
+from os import path
+from typing import Any, Tuple
+
+from taleweave.game_system import GameSystem
+from taleweave.models.entity import World
+from taleweave.utils.worker import CoalescingWorker
+
+logger = getLogger(__name__)
+
+GRAPH_SYSTEM = "graph"
+
+# the name, characters, and portals of each room
+WorldLayout = Tuple[Tuple[str, Tuple[str, ...], Tuple[Tuple[str, str], ...]], ...]
+
+
+def get_world_layout(world: World) -> WorldLayout:
+    """
+    Get the room and portal topology of a world, along with the characters in each room.
+    """
+
+    return tuple(
+        (
+            room.name,
+            tuple(character.name for character in room.characters),
+            tuple((portal.name, portal.destination) for portal in room.portals),
+        )
+        for room in world.rooms
+    )
+
+
+def graph_world_layout(name: str, layout: WorldLayout, turn: int) -> None:
+    import graphviz
+
+    graph_name = f"{path.basename(name)}-{turn}"
+    graph = graphviz.Digraph(graph_name, format="png")
+    for room_name, characters, portals in layout:
+        room_label = "\n".join([room_name, *characters])
+        graph.node(room_name, room_label)
+        for portal_name, destination in portals:
+            graph.edge(room_name, destination, label=portal_name)
+
+    graph_path = path.dirname(name)
+    graph.render(directory=graph_path)
+
+
+def graph_world(world: World, turn: int) -> None:
+    graph_world_layout(world.name, get_world_layout(world), turn)
+
+
+class GraphRenderer(CoalescingWorker):
+    """
+    Render world graphs on a background thread, since rendering runs `dot` in a subprocess.
+
+    The layout of the last world that was submitted is kept, and graphs are only rendered when the rooms, portals, or
+    character placement have changed.
+    """
+
+    last_layout: int | None
+
+    def __init__(self):
+        super().__init__(GRAPH_SYSTEM)
+        self.last_layout = None
+
+    def handle(self, key: str, item: Any) -> None:
+        layout, turn = item
+        graph_world_layout(key, layout, turn)
+
+    def submit_world(self, world: World, turn: int) -> bool:
+        layout = get_world_layout(world)
+        layout_hash = hash(layout)
+        if layout_hash == self.last_layout:
+            logger.debug("world layout has not changed, skipping graph")
+            return False
+
+        if not self.running:
+            self.start()
+
+        self.last_layout = layout_hash
+        self.submit(world.name, (layout, turn))
+        return True
+
+
+graph_renderer = GraphRenderer()
+
+
+def simulate_graph(world: World, turn: int, data: Any | None = None) -> None:
+    graph_renderer.submit_world(world, turn)
+
+
+def init():
+    return [GameSystem(GRAPH_SYSTEM, simulate=simulate_graph)]
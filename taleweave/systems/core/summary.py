@@ -1,25 +1,67 @@
+from functools import partial
 from logging import getLogger
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Tuple
 
-from taleweave.context import get_current_world, get_prompt_library, subscribe
+from taleweave.context import (
+    get_current_world,
+    get_game_config,
+    get_prompt_library,
+    subscribe,
+)
 from taleweave.game_system import FormatPerspective, GameSystem
-from taleweave.models.entity import Character, Room, World, WorldEntity
+from taleweave.models.config import DEFAULT_DIGEST_LIMIT
+from taleweave.models.entity import Character, Portal, Room, World, WorldEntity
 from taleweave.models.event import ActionEvent, GameEvent
-from taleweave.utils.search import find_containing_room, find_portal, find_room
-from taleweave.utils.template import format_prompt, format_str
+from taleweave.utils.event import EventLog
+from taleweave.utils.search import (
+    find_containing_room,
+    find_portal_in_room,
+    find_room,
+)
+from taleweave.utils.template import (
+    format_prompt,
+    format_str,
+    get_template_variables,
+)
 
 logger = getLogger(__name__)
 
 
-def create_move_digest(
-    world: World,
-    active_room: Room,
-    active_character: Character,
+# rendered digest lines for each event in the log, keyed by the parts of the observer that their template uses
+digest_lines: Dict[str, Dict[Tuple[str, ...], str | None]] = {}
+
+
+def render_digest_line(
     event: ActionEvent,
+    observer_key: Tuple[str, ...],
+    render: Callable[[], str | None],
 ) -> str | None:
-    source_room = event.room
+    """
+    Render a digest line for an event once, and share it with every observer that has the same key.
+    """
+
+    lines = digest_lines.setdefault(event.id, {})
+    if observer_key not in lines:
+        lines[observer_key] = render()
+
+    return lines[observer_key]
+
+
+def get_observer_key(
+    template_str: str, active_room: Room, active_character: Character
+) -> Tuple[str, ...]:
+    variables = get_template_variables(template_str)
+    return (
+        active_character.id if "active_character" in variables else "",
+        active_room.id if "active_room" in variables else "",
+    )
+
+
+def find_move_destination(
+    world: World, event: ActionEvent
+) -> Tuple[Portal, Room] | None:
     direction = str(event.parameters.get("direction"))
-    destination_portal = find_portal(world, direction)
+    destination_portal = find_portal_in_room(event.room, direction)
     if not destination_portal:
         logger.warning(f"Could not find portal for direction {direction}")
         return None
@@ -31,7 +73,25 @@ def create_move_digest(
         )
         return None
 
-    if not (destination_room == source_room or destination_room == active_room):
+    return destination_portal, destination_room
+
+
+def create_move_digest(
+    world: World,
+    active_room: Room,
+    active_character: Character,
+    event: ActionEvent,
+) -> str | None:
+    source_room = event.room
+    direction = str(event.parameters.get("direction"))
+    destination = find_move_destination(world, event)
+    if not destination:
+        return None
+
+    destination_portal, destination_room = destination
+    if not (
+        destination_room.id == source_room.id or destination_room.id == active_room.id
+    ):
         return None
 
     # look up the source portal
@@ -47,19 +107,42 @@ def create_move_digest(
         logger.warning(f"Could not find source portal for {destination_portal.name}")
         return None
 
-    character_mode = "self" if (event.character == active_character) else "other"
-    direction_mode = "enter" if (destination_room == active_room) else "exit"
-
-    message = format_prompt(
-        f"digest_move_{character_mode}_{direction_mode}",
-        destination_portal=destination_portal,
-        destination_room=destination_room,
-        direction=direction,
-        event=event,
-        source_portal=source_portal,
-        source_room=source_room,
+    character_mode = "self" if (event.character.id == active_character.id) else "other"
+    direction_mode = "enter" if (destination_room.id == active_room.id) else "exit"
+
+    # the move prompts only use the event and the rooms and portals on either end, which are the same for every
+    # observer with the same modes
+    return render_digest_line(
+        event,
+        ("move", character_mode, direction_mode),
+        lambda: format_prompt(
+            f"digest_move_{character_mode}_{direction_mode}",
+            destination_portal=destination_portal,
+            destination_room=destination_room,
+            direction=direction,
+            event=event,
+            source_portal=source_portal,
+            source_room=source_room,
+        ),
     )
-    return message
+
+
+def format_action_digest(
+    template: str,
+    active_room: Room,
+    active_character: Character,
+    event: ActionEvent,
+) -> str | None:
+    try:
+        return format_str(
+            template,
+            active_character=active_character,
+            active_room=active_room,
+            event=event,
+        )
+    except Exception:
+        logger.exception("error formatting digest event: %s", event)
+        return None
 
 
 def create_turn_digest(
@@ -84,39 +167,62 @@ def create_turn_digest(
                     logger.exception(
                         "error formatting digest for move event: %s", event
                     )
-            elif event.character == active_character or event.room == active_room:
+            elif (
+                event.character.id == active_character.id
+                or event.room.id == active_room.id
+            ):
                 prompt_key = f"digest_{event.action}"
                 if prompt_key in library.prompts:
-                    try:
-                        template = library.prompts[prompt_key]
-                        message = format_str(
+                    template = library.prompts[prompt_key]
+                    message = render_digest_line(
+                        event,
+                        get_observer_key(template, active_room, active_character),
+                        partial(
+                            format_action_digest,
                             template,
-                            active_character=active_character,
-                            active_room=active_room,
-                            event=event,
-                        )
+                            active_room,
+                            active_character,
+                            event,
+                        ),
+                    )
+                    if message:
                         messages.append(message)
-                    except Exception:
-                        logger.exception("error formatting digest event: %s", event)
 
     return messages
 
 
-character_buffers: Dict[str, List[GameEvent]] = {}
+event_log = EventLog(DEFAULT_DIGEST_LIMIT)
+
+
+def get_event_keys(world: World | None, event: ActionEvent) -> List[str]:
+    """
+    Get the IDs of the rooms and characters that can see an event in their digest. Move events are seen from the
+    destination room, other events from the room where they happened.
+    """
+
+    keys = [event.character.id]
+    if event.action == "action_move":
+        destination = find_move_destination(world, event) if world else None
+        if destination:
+            _portal, destination_room = destination
+            keys.append(destination_room.id)
+    else:
+        keys.append(event.room.id)
+
+    return keys
 
 
 def digest_listener(event: GameEvent):
     if isinstance(event, ActionEvent):
-        character = event.character.name
+        # add the event to the shared log and move the acting character's cursor past it. the acting character
+        # should have their digest reset, because they can only act on their turn
+        keys = get_event_keys(get_current_world(), event)
+        evicted = event_log.append(event, keys)
+        if evicted:
+            digest_lines.pop(evicted.id, None)
 
-        # append the event to every character's buffer except the one who triggered it. the
-        # acting character should have their buffer reset, because they can only act on their turn
-
-        for name, buffer in character_buffers.items():
-            if name == character:
-                buffer.clear()
-            else:
-                buffer.append(event)
+        # the keys of the acting character's own event are the character and the room they are in after acting
+        event_log.reset_reader(event.character.name, keys)
 
 
 def format_digest(
@@ -129,8 +235,6 @@ def format_digest(
     if perspective != FormatPerspective.SECOND_PERSON:
         return []
 
-    buffer = character_buffers[entity.name]
-
     world = get_current_world()
     if not world:
         raise ValueError("No world found")
@@ -139,20 +243,33 @@ def format_digest(
     if not room:
         raise ValueError("Character not found in any room")
 
-    digest = create_turn_digest(world, room, entity, buffer)
+    missed, events = event_log.read(entity.name, [room.id, entity.id])
+
+    digest = create_turn_digest(world, room, entity, events)
+    if missed > 0:
+        library = get_prompt_library()
+        if "digest_missed_events" in library.prompts:
+            digest.insert(0, format_prompt("digest_missed_events", count=missed))
+
     return digest
 
 
 def generate_digest(agent: Any, world: World, entity: WorldEntity):
     if isinstance(entity, Character):
-        if entity.name not in character_buffers:
-            character_buffers[entity.name] = []
+        room = find_containing_room(world, entity)
+        event_log.add_reader(entity.name, [room.id, entity.id] if room else None)
 
 
 def initialize_digest(world: World):
+    global event_log
+
+    config = get_game_config()
+    event_log = EventLog(config.world.character.digest_limit)
+    digest_lines.clear()
+
     for room in world.rooms:
         for character in room.characters:
-            character_buffers[character.name] = []
+            event_log.add_reader(character.name, [room.id, character.id])
 
 
 def init():
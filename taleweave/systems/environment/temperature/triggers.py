@@ -1,4 +1,5 @@
 from taleweave.models.entity import Attributes, Room
+from taleweave.utils.changes import set_entity_attribute
 
 
 def hot_room(room: Room, attributes: Attributes):
@@ -7,7 +8,7 @@ def hot_room(room: Room, attributes: Attributes):
     """
 
     for character in room.characters:
-        character.attributes["hot"] = "hot"
+        set_entity_attribute(character, "hot", "hot")
 
     return attributes
 
@@ -18,6 +19,6 @@ def cold_room(room: Room, attributes: Attributes):
     """
 
     for character in room.characters:
-        character.attributes["cold"] = "cold"
+        set_entity_attribute(character, "cold", "cold")
 
     return attributes
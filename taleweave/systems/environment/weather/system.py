@@ -12,6 +12,7 @@ from taleweave.game_system import GameSystem
 from taleweave.models.base import dataclass
 from taleweave.models.entity import Room, World, WorldEntity
 from taleweave.systems.generic.logic import load_logic
+from taleweave.utils.changes import set_entity_attribute
 from taleweave.utils.string import or_list
 
 logger = getLogger(__name__)
@@ -53,7 +54,7 @@ def initialize_weather(world: World):
     time_of_day = get_time_of_day(0)
     for room in world.rooms:
         logger.info(f"initializing weather for {room.name}")
-        room.attributes["time"] = time_of_day.name
+        set_entity_attribute(room, "time", time_of_day.name)
 
         if "environment" not in room.attributes:
             dungeon_master = get_dungeon_master()
@@ -74,7 +75,7 @@ def generate_room_weather(agent: Agent, theme: str, entity: Room) -> None:
         },
         result_parser=environment_result,
     )
-    entity.attributes["environment"] = environment
+    set_entity_attribute(entity, "environment", environment)
     logger.info(f"generated environment for {entity.name}: {environment}")
 
 
@@ -87,7 +88,7 @@ def generate_weather(agent: Agent, world: World, entity: WorldEntity) -> None:
 def simulate_weather(world: World, turn: int, data: None = None):
     time_of_day = get_time_of_day(turn)
     for room in world.rooms:
-        room.attributes["time"] = time_of_day.name
+        set_entity_attribute(room, "time", time_of_day.name)
 
 
 def init():
@@ -1,20 +1,36 @@
+import re
 from functools import partial, wraps
 from logging import getLogger
+from math import log
 from os import path
 from random import random
-from typing import Any, Dict, List, Optional, Protocol
+from time import perf_counter
+from typing import Any, Dict, Generator, List, Optional, Protocol, Set, Tuple
 
+import numpy as np
 from pydantic import Field
 from rule_engine import Rule
+from rule_engine.errors import EngineError
 from yaml import Loader, load
 
 from taleweave.game_system import FormatPerspective, GameSystem
+from taleweave.models.base import AttributeValue
 from taleweave.models.entity import Attributes, World, WorldEntity, dataclass
 from taleweave.plugins import get_plugin_function
+from taleweave.systems.generic.profiler import get_logic_profiler
+from taleweave.utils.changes import (
+    get_entity_version,
+    remove_entity_attributes,
+    set_entity_attributes,
+)
+from taleweave.utils.columns import AttributeColumns
+from taleweave.utils.effect import get_effective_attributes
 from taleweave.utils.template import format_str
 
 logger = getLogger(__name__)
 
+random_generator = np.random.default_rng()
+
 
 @dataclass
 class LogicLabel:
@@ -56,77 +72,512 @@ class LogicTrigger(Protocol):
 TriggerTable = Dict[str, LogicTrigger]
 
 
-def match_logic(
-    entity: WorldEntity,
-    matcher: LogicLabel | LogicRule,
-) -> bool:
-    typed_attributes = {
-        **entity.attributes,
-        "type": entity.type,
-    }
-
-    if matcher.rule:
-        # TODO: pre-compile rules
-        rule_impl = Rule(matcher.rule)
-        if not rule_impl.matches(
-            {
-                "attributes": typed_attributes,
-            }
-        ):
-            logger.debug("logic rule did not match attributes: %s", matcher.rule)
+class LogicSource(Protocol):
+    match: Optional[Attributes]
+    rule: Optional[str]
+
+
+PRESENCE_PATTERN = re.compile(r'^"(\w+)"\s+(in|not\s+in)\s+attributes$')
+
+
+def parse_presence(rule: str) -> Tuple[List[Tuple[str, bool]], bool]:
+    """
+    Find the `"key" in attributes` and `"key" not in attributes` checks at the start of a rule expression that only
+    joins its clauses with `and`. Every entity that matches the rule must pass those checks.
+
+    Returns the key and whether it must be present for each check, and whether the checks are the whole rule.
+    """
+
+    if re.search(r"\bor\b|[()]", rule):
+        return [], False
+
+    checks = []
+    clauses = re.split(r"\s+and\s+", rule.strip())
+    for clause in clauses:
+        presence = PRESENCE_PATTERN.match(clause)
+        if not presence:
+            break
+
+        checks.append((presence.group(1), presence.group(2) == "in"))
+
+    return checks, len(checks) == len(clauses)
+
+
+class LogicMatcher:
+    """
+    The compiled rule expression and match predicate for a logic rule or label.
+    """
+
+    match: List[Tuple[str, AttributeValue]]
+    presence: List[Tuple[str, bool]]
+    presence_only: bool
+    required_keys: List[str]
+    required_type: AttributeValue | None
+    rule: Rule | None
+    source: LogicSource
+
+    def __init__(self, source: LogicSource):
+        self.match = list((source.match or {}).items())
+        self.required_keys = [key for key, _ in self.match if key != "type"]
+        self.required_type = (source.match or {}).get("type")
+        self.rule = Rule(source.rule) if source.rule else None
+        self.presence, self.presence_only = parse_presence(source.rule or "")
+        self.source = source
+
+    def matches(self, entity: WorldEntity) -> bool:
+        if not self.matches_attributes(entity):
             return False
 
-    if matcher.match and not (matcher.match.items() <= typed_attributes.items()):
-        logger.debug("logic did not match attributes: %s", matcher.match)
+        if self.rule and not self.matches_rule(entity):
+            return False
+
+        return True
+
+    def matches_attributes(self, entity: WorldEntity) -> bool:
+        attributes = get_effective_attributes(entity)
+        for key, value in self.match:
+            if key == "type":
+                if entity.type != value:
+                    logger.debug("logic did not match type: %s", self.source.match)
+                    return False
+            elif key not in attributes or attributes[key] != value:
+                logger.debug("logic did not match attributes: %s", self.source.match)
+                return False
+
+        return True
+
+    def matches_rule(self, entity: WorldEntity) -> bool:
+        if self.rule is None:
+            return True
+
+        attributes = get_effective_attributes(entity)
+        for key, present in self.presence:
+            if (key == "type" or key in attributes) != present:
+                logger.debug("logic rule did not match keys: %s", self.source.rule)
+                return False
+
+        if self.presence_only:
+            return True
+
+        typed_attributes = {
+            **attributes,
+            "type": entity.type,
+        }
+        if not self.rule.matches({"attributes": typed_attributes}):
+            logger.debug("logic rule did not match attributes: %s", self.source.rule)
+            return False
+
+        return True
+
+
+ENTITY_TYPES = ["character", "item", "portal", "room"]
+
+
+class LogicDispatch:
+    """
+    An index of matchers by the entity type they require and by one attribute key that they require, so each entity
+    is only tested against the matchers that could match it. Candidates are returned in their original order.
+    """
+
+    count: int
+    types: Dict[str, Tuple[List[int], Dict[str, List[int]]]]
+
+    def __init__(self, matchers: List[LogicMatcher]):
+        self.count = len(matchers)
+        self.types = {}
+
+        for entity_type in ENTITY_TYPES:
+            unkeyed: List[int] = []
+            keyed: Dict[str, List[int]] = {}
+
+            for i, matcher in enumerate(matchers):
+                if matcher.required_type not in (None, entity_type):
+                    continue
+
+                if matcher.required_keys:
+                    keyed.setdefault(matcher.required_keys[0], []).append(i)
+                else:
+                    unkeyed.append(i)
+
+            self.types[entity_type] = (unkeyed, keyed)
+
+    def candidates(self, entity: WorldEntity) -> List[int]:
+        bucket = self.types.get(entity.type)
+        if bucket is None:
+            return list(range(self.count))
+
+        unkeyed, keyed = bucket
+        if not keyed:
+            return unkeyed
+
+        attributes = get_effective_attributes(entity)
+        indexes = list(unkeyed)
+        if len(keyed) < len(attributes):
+            for key, keyed_indexes in keyed.items():
+                if key in attributes:
+                    indexes.extend(keyed_indexes)
+        else:
+            for key in attributes:
+                indexes.extend(keyed.get(key, []))
+
+        indexes.sort()
+        return indexes
+
+
+class CompiledLogicTable:
+    """
+    A logic table with every rule and label compiled into a matcher.
+    """
+
+    name: str
+    labels: List[Tuple[LogicLabel, LogicMatcher]]
+    label_dispatch: LogicDispatch
+    rules: List[Tuple[LogicRule, LogicMatcher]]
+    rule_dispatch: LogicDispatch
+    table: LogicTable
+
+    def __init__(self, table: LogicTable, name: str):
+        self.name = name
+        self.table = table
+        self.labels = [
+            (label, compile_matcher(label, f"label {i} in {name}"))
+            for i, label in enumerate(table.labels)
+        ]
+        self.label_dispatch = LogicDispatch([matcher for _, matcher in self.labels])
+        self.rules = [
+            (rule, compile_matcher(rule, f"rule {i} in {name}"))
+            for i, rule in enumerate(table.rules)
+        ]
+        self.rule_dispatch = LogicDispatch([matcher for _, matcher in self.rules])
+
+        profiler = get_logic_profiler()
+        if profiler:
+            profiler.register(name, "label", [matcher for _, matcher in self.labels])
+            profiler.register(name, "rule", [matcher for _, matcher in self.rules])
+
+
+def sample_geometric(chance: float) -> int:
+    """
+    Sample the number of rolls with the given chance up to and including the first success.
+    """
+
+    return int(log(1.0 - random()) / log(1.0 - chance)) + 1
+
+
+class LogicSchedule:
+    """
+    The pass on which each chance rule will next fire for each entity, sampled from a geometric distribution instead
+    of rolling on every pass, and a timer wheel of the rules that are scheduled for each pass.
+
+    The rolls are independent, so when a rule is not reached on some pass, because it did not match or another rule
+    in its group ran first, the rest of its schedule is still valid. A rule that was not reached on the pass it was
+    scheduled for is sampled again the next time it is reached. This gives the same distribution as rolling whenever
+    the rule is reached, and rules that are scheduled for a later pass do not need to be matched at all.
+
+    For incremental updates, the schedule also keeps the version of each entity whose last pass did not change
+    anything. Another pass over the same version would not change anything either, until one of its chance rules is
+    due.
+    """
+
+    due: Set[str]
+    next_step: Dict[Tuple[str, int], int]
+    settled: Dict[str, int]
+    step: int
+    wheel: Dict[int, Set[Tuple[str, int]]]
+
+    def __init__(self):
+        self.due = set()
+        self.next_step = {}
+        self.settled = {}
+        self.step = 0
+        self.wheel = {}
+
+    def advance(self) -> None:
+        """
+        Start the next pass, dropping any schedules that were missed on the last one.
+        """
+
+        for key in self.wheel.pop(self.step, set()):
+            if self.next_step.get(key) == self.step:
+                del self.next_step[key]
+
+        self.step += 1
+        self.due = {entity_id for entity_id, _ in self.wheel.get(self.step, set())}
+
+    def is_settled(self, entity: WorldEntity) -> bool:
+        """
+        Check whether an entity can be skipped on this pass: its attributes have not changed since a pass that did
+        not change anything, and none of its chance rules are due.
+        """
+
+        if entity.id in self.due:
+            return False
+
+        return self.settled.get(entity.id) == get_entity_version(entity)
+
+    def settle(self, entity: WorldEntity, settled: bool) -> None:
+        if settled:
+            self.settled[entity.id] = get_entity_version(entity)
+        else:
+            self.settled.pop(entity.id, None)
+
+    def is_waiting(self, entity: WorldEntity, index: int) -> bool:
+        """
+        Check whether a chance rule is scheduled to fire for an entity on a later pass, so it cannot fire on this one.
+        """
+
+        next_step = self.next_step.get((entity.id, index))
+        return next_step is not None and next_step > self.step
+
+    def roll(self, entity: WorldEntity, index: int, chance: float) -> bool:
+        """
+        Check whether a chance rule that has been reached fires for an entity on this pass.
+        """
+
+        if chance <= 0:
+            return False
+
+        key = (entity.id, index)
+        next_step = self.next_step.get(key)
+        if next_step is None or next_step < self.step:
+            next_step = self.step + sample_geometric(chance) - 1
+            self.next_step[key] = next_step
+            self.wheel.setdefault(next_step, set()).add(key)
+
+        if next_step == self.step:
+            del self.next_step[key]
+            return True
+
         return False
 
-    return True
 
+def compile_matcher(source: LogicSource, location: str) -> LogicMatcher:
+    try:
+        return LogicMatcher(source)
+    except EngineError as e:
+        raise ValueError(f"error compiling {location}: {e}") from e
 
-def update_attributes(
+
+def match_logic(entity: WorldEntity, matcher: LogicMatcher | LogicSource) -> bool:
+    if not isinstance(matcher, LogicMatcher):
+        matcher = LogicMatcher(matcher)
+
+    return matcher.matches(entity)
+
+
+def run_triggers(
     entity: WorldEntity,
-    rules: LogicTable,
+    rule: LogicRule,
     triggers: TriggerTable,
 ) -> None:
+    for trigger in rule.trigger or []:
+        if isinstance(trigger, str):
+            trigger_name = trigger
+            trigger_params: Attributes = {}
+        else:
+            trigger_name = trigger.function
+            trigger_params = trigger.parameters or {}
+
+        if trigger_name in triggers:
+            trigger_function = triggers[trigger_name]
+            trigger_function(entity, **trigger_params)
+
+
+def update_attributes(
+    entity: WorldEntity,
+    rules: CompiledLogicTable,
+    triggers: TriggerTable,
+    schedule: LogicSchedule | None = None,
+) -> bool:
+    """
+    Apply the rules from a logic table to an entity.
+
+    Returns True if the pass did not change the entity attributes, fire any chance rules, or run any triggers.
+    """
+
+    profiler = get_logic_profiler()
     skip_groups = set()
+    settled = True
+    version = get_entity_version(entity)
+
+    candidates = rules.rule_dispatch.candidates(entity)
+    position = 0
 
-    for rule in rules.rules:
+    while position < len(candidates):
+        index = candidates[position]
+        position += 1
+
+        rule, matcher = rules.rules[index]
         if rule.group:
             if rule.group in skip_groups:
                 logger.debug("already ran a rule from group %s, skipping", rule.group)
+                if profiler:
+                    profiler.record(rules.name, "rule", index, matcher, skipped=1)
+
                 continue
 
-        if not match_logic(entity, rule):
+        # a chance rule that is not due cannot fire, and rules that do not fire have no effect on their group
+        if rule.chance < 1 and schedule and schedule.is_waiting(entity, index):
+            continue
+
+        if profiler:
+            if not profiler.match(rules.name, "rule", index, matcher, entity):
+                continue
+        elif not match_logic(entity, matcher):
             continue
 
         logger.info("matched logic: %s", rule.match)
         if rule.chance < 1:
-            if random() > rule.chance:
+            if schedule:
+                fired = schedule.roll(entity, index, rule.chance)
+            else:
+                fired = random() <= rule.chance
+
+            if not fired:
                 logger.info("logic skipped by chance: %s", rule.chance)
                 continue
 
+            settled = False
+
+        if profiler:
+            profiler.record(rules.name, "rule", index, matcher, fired=1)
+
         if rule.group:
             skip_groups.add(rule.group)
 
-        for key in rule.remove or []:
-            entity.attributes.pop(key, None)
+        if rule.remove:
+            remove_entity_attributes(entity, rule.remove)
 
         if rule.set:
-            entity.attributes.update(rule.set)
+            set_entity_attributes(entity, rule.set)
             logger.info("logic set state: %s", rule.set)
 
         if rule.trigger:
-            for trigger in rule.trigger:
-                if isinstance(trigger, str):
-                    trigger_name = trigger
-                    trigger_params: Attributes = {}
-                else:
-                    trigger_name = trigger.function
-                    trigger_params = trigger.parameters or {}
+            run_triggers(entity, rule, triggers)
+            settled = False
 
-                if trigger_name in triggers:
-                    trigger_function = triggers[trigger_name]
-                    trigger_function(entity, **trigger_params)
+        # new attributes may allow later rules to match
+        if rule.set or rule.trigger:
+            candidates = [
+                later
+                for later in rules.rule_dispatch.candidates(entity)
+                if later > index
+            ]
+            position = 0
+
+    return settled and version == get_entity_version(entity)
+
+
+def update_incremental(
+    entity: WorldEntity,
+    rules: CompiledLogicTable,
+    triggers: TriggerTable,
+    schedule: LogicSchedule,
+) -> None:
+    """
+    Apply the rules from a logic table to an entity, unless the schedule shows that they would not change anything.
+    """
+
+    if schedule.is_settled(entity):
+        return
+
+    settled = update_attributes(
+        entity, rules=rules, triggers=triggers, schedule=schedule
+    )
+    schedule.settle(entity, settled)
+
+
+def update_columns(
+    columns: AttributeColumns,
+    rules: CompiledLogicTable,
+    triggers: TriggerTable,
+) -> None:
+    """
+    Apply the rules from a logic table to every entity in the columns at once, one rule at a time. The match
+    predicates and chance rolls are evaluated as masks over all of the rows, and only the rows that pass are updated.
+
+    Since rules only change the entity they matched, the results have the same distribution as applying every rule
+    to one entity at a time. Triggers may change other entities, so the columns are rebuilt after running them.
+    """
+
+    profiler = get_logic_profiler()
+    skip_groups: Dict[str, np.ndarray] = {}
+
+    for index, (rule, matcher) in enumerate(rules.rules):
+        skipped = 0
+        mask = columns.match_mask(matcher.match)
+        if rule.group in skip_groups:
+            skipped = int(np.count_nonzero(mask & skip_groups[rule.group]))
+            mask &= ~skip_groups[rule.group]
+
+        evaluated = int(np.count_nonzero(mask))
+        rule_time = 0.0
+        if matcher.presence:
+            # key checks in the rule expression are evaluated as masks, and only the rest is checked one row at a time
+            start = perf_counter()
+            mask &= columns.presence_mask(matcher.presence)
+            rule_time = perf_counter() - start
+
+        rows = np.flatnonzero(mask)
+        if matcher.rule and not matcher.presence_only and len(rows) > 0:
+            start = perf_counter()
+            rule_mask = np.fromiter(
+                (matcher.matches_rule(columns.entities[row]) for row in rows),
+                dtype=bool,
+                count=len(rows),
+            )
+            rule_time += perf_counter() - start
+            rows = rows[rule_mask]
+
+        matched = len(rows)
+        if rule.chance < 1:
+            rows = rows[random_generator.random(len(rows)) <= rule.chance]
+
+        if profiler:
+            # rows that failed the match attributes are not counted, since they were never checked one at a time
+            profiler.record(
+                rules.name,
+                "rule",
+                index,
+                matcher,
+                evaluated=evaluated,
+                fired=len(rows),
+                matched=matched,
+                rule_time=rule_time,
+                skipped=skipped,
+            )
+
+        if len(rows) == 0:
+            continue
+
+        logger.debug("logic matched %d entities: %s", len(rows), rule.match)
+        if rule.group:
+            if rule.group not in skip_groups:
+                skip_groups[rule.group] = np.zeros(len(columns.entities), dtype=bool)
+
+            skip_groups[rule.group][rows] = True
+
+        for row in rows:
+            entity = columns.entities[row]
+            if rule.remove:
+                remove_entity_attributes(entity, rule.remove)
+
+            if rule.set:
+                set_entity_attributes(entity, rule.set)
+
+            if rule.trigger:
+                run_triggers(entity, rule, triggers)
+
+        if rule.trigger:
+            columns.rebuild()
+        else:
+            columns.remove_rows(rows, rule.remove or [])
+            columns.set_rows(rows, rule.set or {})
+
+            # active effects may override the new attributes
+            for row in rows:
+                if getattr(columns.entities[row], "active_effects", None):
+                    columns.sync_row(row)
 
 
 def update_logic(
@@ -134,30 +585,54 @@ def update_logic(
     turn: int,
     data: Any | None = None,
     *,
-    rules: LogicTable,
+    rules: CompiledLogicTable,
     triggers: TriggerTable,
+    schedule: LogicSchedule | None = None,
+    incremental: bool = False,
 ) -> None:
-    for room in world.rooms:
-        update_attributes(room, rules=rules, triggers=triggers)
-        for character in room.characters:
-            update_attributes(character, rules=rules, triggers=triggers)
-            for item in character.items:
-                update_attributes(item, rules=rules, triggers=triggers)
-        for item in room.items:
-            update_attributes(item, rules=rules, triggers=triggers)
+    if schedule:
+        schedule.advance()
+
+    for entity in list_logic_entities(world):
+        if incremental and schedule:
+            update_incremental(
+                entity, rules=rules, triggers=triggers, schedule=schedule
+            )
+        else:
+            update_attributes(entity, rules=rules, triggers=triggers, schedule=schedule)
 
     logger.info("updated world attributes")
 
 
+def list_logic_entities(world: World) -> Generator[WorldEntity, Any, None]:
+    """
+    List the entities that logic rules are applied to, in the order they are updated.
+    """
+
+    for room in world.rooms:
+        yield room
+        for character in room.characters:
+            yield character
+            yield from character.items
+        yield from room.items
+
+
 def format_logic(
     entity: WorldEntity,
-    rules: LogicTable,
+    rules: CompiledLogicTable,
     perspective: FormatPerspective = FormatPerspective.SECOND_PERSON,
 ) -> List[str]:
+    profiler = get_logic_profiler()
     labels = []
 
-    for label in rules.labels:
-        if match_logic(entity, label):
+    for index in rules.label_dispatch.candidates(entity):
+        label, matcher = rules.labels[index]
+        if profiler:
+            matched = profiler.match(rules.name, "label", index, matcher, entity)
+        else:
+            matched = match_logic(entity, matcher)
+
+        if matched:
             if perspective == FormatPerspective.SECOND_PERSON and label.backstory:
                 backstory = format_str(label.backstory, entity=entity)
                 labels.append(backstory)
@@ -173,35 +648,183 @@ def format_logic(
     return labels
 
 
+class LogicSystem(GameSystem):
+    """
+    A game system that runs the rules and formats the labels from a logic table.
+    """
+
+    rules: CompiledLogicTable
+    schedule: LogicSchedule
+    triggers: TriggerTable
+
+    def __init__(self, name: str, rules: CompiledLogicTable, triggers: TriggerTable):
+        schedule = LogicSchedule()
+        super().__init__(
+            name=name,
+            format=wraps(format_logic)(partial(format_logic, rules=rules)),
+            format_cache=True,
+            initialize=wraps(update_logic)(
+                partial(
+                    update_logic,
+                    turn=0,
+                    rules=rules,
+                    triggers=triggers,
+                    schedule=schedule,
+                )
+            ),
+            simulate=wraps(update_logic)(
+                partial(update_logic, rules=rules, triggers=triggers, schedule=schedule)
+            ),
+        )
+        self.rules = rules
+        self.schedule = schedule
+        self.triggers = triggers
+
+
 def load_logic(filename: str, name_prefix: str = "logic") -> GameSystem:
     basename = path.splitext(path.basename(filename))[0]
     system_name = f"{name_prefix}_{basename}"
     logger.info("loading logic from file %s as system %s", filename, system_name)
 
     with open(filename) as file:
-        logic_rules = LogicTable(**load(file, Loader=Loader))
+        logic_table = LogicTable(**load(file, Loader=Loader))
+        logic_rules = CompiledLogicTable(logic_table, filename)
         logic_triggers = {}
 
-        for rule in logic_rules.rules:
+        for rule in logic_table.rules:
             if rule.trigger:
                 for trigger in rule.trigger:
                     function_name = (
                         trigger if isinstance(trigger, str) else trigger.function
                     )
-                    logic_triggers[trigger] = get_plugin_function(function_name)
+                    logic_triggers[function_name] = get_plugin_function(function_name)
 
-    logger.info("initialized logic system with %d rules", len(logic_rules.rules))
-    system_format = wraps(format_logic)(partial(format_logic, rules=logic_rules))
-    system_initialize = wraps(update_logic)(
-        partial(update_logic, turn=0, rules=logic_rules, triggers=logic_triggers)
-    )
-    system_simulate = wraps(update_logic)(
-        partial(update_logic, rules=logic_rules, triggers=logic_triggers)
+    logger.info("initialized logic system with %d rules", len(logic_table.rules))
+    return LogicSystem(system_name, logic_rules, logic_triggers)
+
+
+# region logic engine
+LOGIC_ENGINE_SYSTEM = "logic_engine"
+LOGIC_ENGINE_MODES = ["columnar", "incremental"]
+
+LogicTables = List[Tuple[CompiledLogicTable, TriggerTable, LogicSchedule]]
+
+
+def update_logic_engine(
+    world: World,
+    turn: int,
+    data: Any | None = None,
+    *,
+    tables: LogicTables,
+    columnar: bool = False,
+    incremental: bool = False,
+) -> None:
+    """
+    Visit each entity once, applying the rules from every logic table in order.
+
+    When columnar is set, copy the entity attributes into columns and apply each rule to every entity at once. When
+    incremental is set, skip the tables that would not change an entity.
+    """
+
+    if columnar:
+        columns = AttributeColumns(list(list_logic_entities(world)))
+        logger.debug("built attribute columns for %d entities", len(columns.entities))
+
+        for rules, triggers, _ in tables:
+            update_columns(columns, rules=rules, triggers=triggers)
+
+        logger.info("updated world attributes using %d logic tables", len(tables))
+        return
+
+    for _, _, schedule in tables:
+        schedule.advance()
+
+    for entity in list_logic_entities(world):
+        for rules, triggers, schedule in tables:
+            if incremental:
+                update_incremental(
+                    entity, rules=rules, triggers=triggers, schedule=schedule
+                )
+            else:
+                update_attributes(
+                    entity, rules=rules, triggers=triggers, schedule=schedule
+                )
+
+    logger.info("updated world attributes using %d logic tables", len(tables))
+
+
+def format_logic_engine(
+    entity: WorldEntity,
+    perspective: FormatPerspective = FormatPerspective.SECOND_PERSON,
+    *,
+    tables: LogicTables,
+) -> List[str]:
+    labels = []
+    for rules, _, _ in tables:
+        labels.extend(format_logic(entity, rules, perspective=perspective))
+
+    return labels
+
+
+def fuse_logic(
+    systems: List[GameSystem],
+    columnar: bool = False,
+    incremental: bool = False,
+) -> List[GameSystem]:
+    """
+    Replace every logic system with a single logic engine system, which runs at the position of the first logic
+    system. Each entity is visited once per turn and the rules from each table are applied in their original order.
+    When columnar is set, the rules are evaluated over an attribute column store instead. When incremental is set,
+    entities are skipped until their attributes change or one of their chance rules is due.
+
+    Triggers that change other entities may be seen by later tables sooner than they would be when each table runs
+    as a separate system.
+    """
+
+    logic_systems = [system for system in systems if isinstance(system, LogicSystem)]
+    if len(logic_systems) == 0:
+        return systems
+
+    tables = [
+        (system.rules, system.triggers, system.schedule) for system in logic_systems
+    ]
+    logger.info(
+        "fusing %d logic systems into the logic engine: %s",
+        len(logic_systems),
+        logic_systems,
     )
 
-    return GameSystem(
-        name=system_name,
-        format=system_format,
-        initialize=system_initialize,
-        simulate=system_simulate,
+    engine = GameSystem(
+        name=LOGIC_ENGINE_SYSTEM,
+        format=wraps(format_logic_engine)(partial(format_logic_engine, tables=tables)),
+        format_cache=True,
+        initialize=wraps(update_logic_engine)(
+            partial(
+                update_logic_engine,
+                turn=0,
+                tables=tables,
+                columnar=columnar,
+                incremental=incremental,
+            )
+        ),
+        simulate=wraps(update_logic_engine)(
+            partial(
+                update_logic_engine,
+                tables=tables,
+                columnar=columnar,
+                incremental=incremental,
+            )
+        ),
     )
+
+    fused_systems = []
+    for system in systems:
+        if system is logic_systems[0]:
+            fused_systems.append(engine)
+        elif not isinstance(system, LogicSystem):
+            fused_systems.append(system)
+
+    return fused_systems
+
+
+# endregion
@@ -0,0 +1,286 @@
+import argparse
+from csv import DictReader, DictWriter
+from json import dump, dumps, load
+from logging import getLogger
+from os import path
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from taleweave.models.entity import WorldEntity
+
+if TYPE_CHECKING:
+    from taleweave.systems.generic.logic import LogicMatcher
+
+logger = getLogger(__name__)
+
+REPORT_FIELDS = [
+    "table",
+    "kind",
+    "index",
+    "group",
+    "match",
+    "rule",
+    "evaluated",
+    "skipped",
+    "matched",
+    "fired",
+    "rule_time",
+]
+
+
+class LogicStats:
+    """
+    Counters for one logic rule or label.
+    """
+
+    evaluated: int
+    fired: int
+    matched: int
+    rule_time: float
+    skipped: int
+
+    def __init__(self):
+        self.evaluated = 0
+        self.fired = 0
+        self.matched = 0
+        self.rule_time = 0.0
+        self.skipped = 0
+
+
+class LogicProfiler:
+    """
+    Records how often each logic rule and label is evaluated, matched, and fired, and how long their rule
+    expressions take to run.
+    """
+
+    sources: Dict[Tuple[str, str, int], "LogicMatcher"]
+    stats: Dict[Tuple[str, str, int], LogicStats]
+
+    def __init__(self):
+        self.sources = {}
+        self.stats = {}
+
+    def get_stats(
+        self, table: str, kind: str, index: int, matcher: "LogicMatcher"
+    ) -> LogicStats:
+        key = (table, kind, index)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = LogicStats()
+            self.sources[key] = matcher
+
+        return stats
+
+    def register(self, table: str, kind: str, matchers: List["LogicMatcher"]) -> None:
+        """
+        Add a row for every rule or label in a table, so the ones that are never offered to an entity are still
+        included in the report.
+        """
+
+        for index, matcher in enumerate(matchers):
+            self.get_stats(table, kind, index, matcher)
+
+    def match(
+        self,
+        table: str,
+        kind: str,
+        index: int,
+        matcher: "LogicMatcher",
+        entity: WorldEntity,
+    ) -> bool:
+        """
+        Check whether a rule or label matches an entity, timing the rule expression.
+        """
+
+        stats = self.get_stats(table, kind, index, matcher)
+        stats.evaluated += 1
+
+        if not matcher.matches_attributes(entity):
+            return False
+
+        if matcher.rule:
+            start = perf_counter()
+            matched = matcher.matches_rule(entity)
+            stats.rule_time += perf_counter() - start
+
+            if not matched:
+                return False
+
+        stats.matched += 1
+        return True
+
+    def record(
+        self,
+        table: str,
+        kind: str,
+        index: int,
+        matcher: "LogicMatcher",
+        evaluated: int = 0,
+        fired: int = 0,
+        matched: int = 0,
+        rule_time: float = 0.0,
+        skipped: int = 0,
+    ) -> None:
+        stats = self.get_stats(table, kind, index, matcher)
+        stats.evaluated += evaluated
+        stats.fired += fired
+        stats.matched += matched
+        stats.rule_time += rule_time
+        stats.skipped += skipped
+
+    def report(self) -> List[Dict]:
+        rows = []
+        for key, stats in self.stats.items():
+            table, kind, index = key
+            source = self.sources[key].source
+            rows.append(
+                {
+                    "table": table,
+                    "kind": kind,
+                    "index": index,
+                    "group": getattr(source, "group", None) or "",
+                    "match": dumps(source.match) if source.match else "",
+                    "rule": (source.rule or "").strip(),
+                    "evaluated": stats.evaluated,
+                    "skipped": stats.skipped,
+                    "matched": stats.matched,
+                    "fired": stats.fired,
+                    "rule_time": stats.rule_time,
+                }
+            )
+
+        rows.sort(key=lambda row: (row["table"], row["kind"], row["index"]))
+        return rows
+
+    def save(self, filename: str) -> None:
+        save_report(filename, self.report())
+
+
+def save_report(filename: str, rows: List[Dict]) -> None:
+    """
+    Save a profiler report as CSV or JSON, based on the file extension.
+    """
+
+    logger.info("saving logic profile with %d rows to %s", len(rows), filename)
+    with open(filename, "w", newline="") as file:
+        if path.splitext(filename)[1] == ".csv":
+            writer = DictWriter(file, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            dump(rows, file, indent=2)
+
+
+def load_report(filename: str) -> List[Dict]:
+    with open(filename, "r", newline="") as file:
+        if path.splitext(filename)[1] == ".csv":
+            rows: List[Dict] = list(DictReader(file))
+            for row in rows:
+                for field in ["index", "evaluated", "skipped", "matched", "fired"]:
+                    row[field] = int(row[field])
+
+                row["rule_time"] = float(row["rule_time"])
+
+            return rows
+
+        return load(file)
+
+
+def format_row(row: Dict) -> str:
+    return f"{row['table']} {row['kind']} {row['index']}: {row['match'] or row['rule']}"
+
+
+def format_summary(rows: List[Dict], limit: int = 10) -> List[str]:
+    """
+    Summarize a profiler report: the rules with the slowest rule expressions, the rules that were never offered to
+    any entity, the rules that were evaluated but never matched, the rules that matched but never fired, and the rules
+    that were always skipped because another rule in their group ran first.
+    """
+
+    lines = []
+
+    expensive = sorted(
+        [row for row in rows if row["rule_time"] > 0],
+        key=lambda row: row["rule_time"],
+        reverse=True,
+    )[:limit]
+    lines.append("most expensive rules:")
+    for row in expensive:
+        lines.append(
+            f"  {row['rule_time'] * 1000:.2f} ms over {row['evaluated']} evaluations - {format_row(row)}"
+        )
+
+    never_offered = [
+        row
+        for row in rows
+        if row["kind"] == "rule" and row["evaluated"] == 0 and row["skipped"] == 0
+    ]
+    lines.append(f"rules never offered to any entity: {len(never_offered)}")
+    for row in never_offered:
+        lines.append(f"  {format_row(row)}")
+
+    never_matched = [
+        row
+        for row in rows
+        if row["kind"] == "rule" and row["evaluated"] > 0 and row["matched"] == 0
+    ]
+    lines.append(f"rules that never matched: {len(never_matched)}")
+    for row in never_matched:
+        lines.append(f"  evaluated {row['evaluated']} - {format_row(row)}")
+
+    never_fired = [
+        row
+        for row in rows
+        if row["kind"] == "rule" and row["matched"] > 0 and row["fired"] == 0
+    ]
+    lines.append(f"rules that never fired: {len(never_fired)}")
+    for row in never_fired:
+        lines.append(
+            f"  matched {row['matched']} of {row['evaluated']} - {format_row(row)}"
+        )
+
+    always_skipped = [
+        row
+        for row in rows
+        if row["kind"] == "rule" and row["skipped"] > 0 and row["evaluated"] == 0
+    ]
+    lines.append(f"rules always skipped by their group: {len(always_skipped)}")
+    for row in always_skipped:
+        lines.append(f"  group {row['group']} - {format_row(row)}")
+
+    return lines
+
+
+logic_profiler: LogicProfiler | None = None
+
+
+def get_logic_profiler() -> LogicProfiler | None:
+    return logic_profiler
+
+
+def set_logic_profiler(profiler: LogicProfiler | None) -> None:
+    global logic_profiler
+    logic_profiler = profiler
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Summarize a logic profiler report")
+    parser.add_argument("report", type=str, help="The JSON or CSV report to read")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="The number of expensive rules to list",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    rows = load_report(args.report)
+    for line in format_summary(rows, limit=args.limit):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from taleweave.context import (
 from taleweave.generate import generate_item
 from taleweave.models.base import dataclass
 from taleweave.models.entity import Item
+from taleweave.utils.index import add_item, remove_item
 
 
 @dataclass
@@ -57,7 +58,7 @@ def action_craft(item: str) -> str:
             item_to_remove = next(
                 item for item in action_character.items if item.name == ingredient
             )
-            action_character.items.remove(item_to_remove)
+            remove_item(action_world, action_character, item_to_remove)
 
         # Create and add the crafted item to inventory
         result_item = next(
@@ -73,7 +74,7 @@ def action_craft(item: str) -> str:
                 dungeon_master, action_world, systems
             )  # TODO: pass crafting recipe and generate from that
 
-        action_character.items.append(new_item)
+        add_item(action_world, action_character, new_item)
 
         broadcast(f"{action_character.name} crafts a {item}.")
         return f"You successfully craft a {item}."
@@ -4,6 +4,7 @@ from random import randint
 from taleweave.context import get_current_world
 from taleweave.models.entity import Character, WorldEntity
 from taleweave.utils.attribute import subtract_attribute
+from taleweave.utils.changes import mark_changed, set_entity_attribute
 from taleweave.utils.search import find_containing_room
 
 logger = getLogger(__name__)
@@ -19,15 +20,19 @@ def character_bleeding(entity: WorldEntity) -> None:
 
     # remove bleeding from health, then reduce bleeding
     amount = int(entity.attributes.get("bleeding", 0))
+    previous = (entity.attributes.get("health"), entity.attributes.get("bleeding"))
     subtract_attribute(entity.attributes, "health", amount)
 
     if amount > 0 and randint(0, 1):
         subtract_attribute(entity.attributes, "bleeding", 1)
 
+    if (entity.attributes.get("health"), entity.attributes.get("bleeding")) != previous:
+        mark_changed(entity)
+
     # leave blood in the room
     room = find_containing_room(world, entity)
     if room:
-        room.attributes["bloody"] = True
+        set_entity_attribute(room, "bloody", True)
         logger.info(f"{entity.name} bleeds in {room.name}")
     else:
         logger.warning(f"{entity.name} not found in any room")
@@ -1,6 +1,7 @@
 from random import randint
 
 from taleweave.context import action_context, broadcast, get_dungeon_master
+from taleweave.utils.changes import mark_changed
 from taleweave.utils.search import find_character_in_room
 
 
@@ -28,6 +29,7 @@ def action_cast(spell: str, target: str) -> str:
         action_character.attributes["mana"] -= action_character.attributes["spells"][
             spell
         ]
+        mark_changed(action_character)
         # Get flavor text from the dungeon master
         flavor_text = dungeon_master(f"Describe the effects of {spell} on {target}.")
         broadcast(f"{action_character.name} casts {spell} on {target}. {flavor_text}")
@@ -36,6 +38,7 @@ def action_cast(spell: str, target: str) -> str:
         if spell == "heal" and target_character:
             heal_amount = randint(10, 30)
             target_character.attributes["health"] += heal_amount
+            mark_changed(target_character)
             return f"{target} is healed for {heal_amount} points."
 
         return f"{spell} was successfully cast on {target}."
@@ -1,5 +1,5 @@
 from logging import getLogger
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from packit.agent import Agent
 from pydantic import Field
@@ -15,19 +15,27 @@ from taleweave.models.entity import (
     World,
     WorldEntity,
 )
-from taleweave.systems.generic.logic import match_logic
+from taleweave.systems.generic.logic import LogicMatcher, compile_matcher, match_logic
 from taleweave.utils.search import (
     find_entity_reference,
     find_item_in_container,
     find_item_in_room,
 )
-from taleweave.utils.systems import load_system_data, save_system_data
+from taleweave.utils.systems import (
+    dump_system_data,
+    load_system_data,
+    restore_system_data,
+    save_system_data,
+)
 
 logger = getLogger(__name__)
 
 
 QUEST_SYSTEM = "quest"
 
+# compiled matchers for the attribute goals, by quest ID
+quest_matchers: Dict[str, LogicMatcher] = {}
+
 
 # region models
 @dataclass
@@ -124,6 +132,41 @@ def get_active_quest(quests: QuestData, character: Character) -> Quest | None:
     return quests.active.get(character.name)
 
 
+def compile_quest_matchers(quests: QuestData) -> None:
+    """
+    Compile the attribute goals for every active and available quest, so rule errors are reported when the quest data
+    is loaded.
+    """
+
+    quest_matchers.clear()
+
+    pending = list(quests.active.values())
+    for available in quests.available.values():
+        pending.extend(available)
+
+    for quest in pending:
+        if isinstance(quest.goal, QuestGoalAttributes):
+            quest_matchers[quest.id] = compile_matcher(
+                quest.goal, f"goal for quest {quest.name}"
+            )
+
+
+def get_quest_matcher(quest: Quest) -> LogicMatcher:
+    """
+    Get the compiled matcher for an attribute goal, compiling it if the quest was added after the data was loaded.
+    """
+
+    if not isinstance(quest.goal, QuestGoalAttributes):
+        raise ValueError(f"quest goal is not an attribute goal: {quest.name}")
+
+    matcher = quest_matchers.get(quest.id)
+    if matcher is None or matcher.source is not quest.goal:
+        matcher = compile_matcher(quest.goal, f"goal for quest {quest.name}")
+        quest_matchers[quest.id] = matcher
+
+    return matcher
+
+
 def is_quest_complete(world: World, quest: Quest) -> bool:
     """
     Check if the given quest is complete.
@@ -153,7 +196,7 @@ def is_quest_complete(world: World, quest: Quest) -> bool:
         if not target:
             raise ValueError(f"quest target not found: {quest.goal.target}")
 
-        if match_logic(target, quest.goal):
+        if match_logic(target, get_quest_matcher(quest)):
             return True
 
     return False
@@ -169,6 +212,7 @@ def initialize_quests(world: World) -> QuestData:
     """
 
     logger.info("initializing quest data for world %s", world.name)
+    quest_matchers.clear()
     return QuestData(active={}, available={}, completed={})
 
 
@@ -221,7 +265,9 @@ def simulate_quests(world: World, turn: int, data: QuestData | None = None) -> N
 # region I/O
 def load_quest_data(file: str) -> QuestData:
     logger.info(f"loading quest data from {file}")
-    return load_system_data(QuestData, file)
+    data = load_system_data(QuestData, file)
+    compile_quest_matchers(data)
+    return data
 
 
 def save_quest_data(file: str, data: QuestData) -> None:
@@ -229,6 +275,16 @@ def save_quest_data(file: str, data: QuestData) -> None:
     return save_system_data(QuestData, file, data)
 
 
+def dump_quest_data(data: QuestData) -> Any:
+    return dump_system_data(QuestData, data)
+
+
+def restore_quest_data(data: Any) -> QuestData:
+    quests = restore_system_data(QuestData, data)
+    compile_quest_matchers(quests)
+    return quests
+
+
 # endregion
 
 
@@ -239,6 +295,8 @@ def init() -> List[GameSystem]:
             data=SystemData(
                 load=load_quest_data,
                 save=save_quest_data,
+                dump=dump_quest_data,
+                restore=restore_quest_data,
             ),
             generate=generate_quests,
             initialize=initialize_quests,
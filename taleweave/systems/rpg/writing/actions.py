@@ -1,4 +1,5 @@
 from taleweave.context import action_context, broadcast
+from taleweave.utils.changes import set_entity_attribute
 from taleweave.utils.search import find_item_in_character
 
 
@@ -34,6 +35,6 @@ def action_write(item: str, text: str) -> str:
         if not action_item:
             return f"You do not have a {item} to write on."
 
-        action_item.attributes["text"] = text
+        set_entity_attribute(action_item, "text", text)
         broadcast(f"{action_character.name} writes on {item}")
         return f"You write on the {item}."
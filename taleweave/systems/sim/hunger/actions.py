@@ -1,4 +1,6 @@
-from taleweave.context import action_context
+from taleweave.context import action_context, world_context
+from taleweave.utils.changes import set_entity_attribute
+from taleweave.utils.index import remove_item
 from taleweave.utils.search import find_item_in_character
 
 
@@ -25,7 +27,7 @@ def action_cook(item: str) -> str:
             return "That item is already cooked."
 
         # Cook the item
-        target_item.attributes["cooked"] = True
+        set_entity_attribute(target_item, "cooked", True)
         return f"You cook the {item}."
 
 
@@ -36,7 +38,7 @@ def action_eat(item: str) -> str:
     Args:
       item: The name of the item to eat.
     """
-    with action_context() as (_, action_character):
+    with world_context() as (action_world, _, action_character):
         target_item = find_item_in_character(action_character, item)
         if target_item is None:
             return "You don't have the item to eat."
@@ -62,6 +64,6 @@ def action_eat(item: str) -> str:
             return "You're not hungry."
 
         # Eat the item
-        action_character.items.remove(target_item)
-        action_character.attributes["hunger"] = "full"
+        remove_item(action_world, action_character, target_item)
+        set_entity_attribute(action_character, "hunger", "full")
         return f"You eat the {item}."
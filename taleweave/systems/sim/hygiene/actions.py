@@ -1,4 +1,5 @@
 from taleweave.context import action_context, get_dungeon_master
+from taleweave.utils.changes import set_entity_attribute
 from taleweave.utils.world import describe_entity
 
 
@@ -18,5 +19,5 @@ def action_wash(unused: bool) -> str:
             "If the room has a shower or running water, they should be cleaner. If the room is dirty, they should end up dirtier."
         )
 
-        action_character.attributes["clean"] = outcome.strip().lower()
+        set_entity_attribute(action_character, "clean", outcome.strip().lower())
         return f"You wash yourself in the {action_room.name} and feel {outcome}"
@@ -1,4 +1,5 @@
 from taleweave.context import action_context, get_dungeon_master
+from taleweave.utils.changes import set_entity_attribute
 from taleweave.utils.world import describe_entity
 
 
@@ -14,5 +15,5 @@ def action_sleep(unused: bool) -> str:
             "How rested are they? Respond with 'rested' or 'tired'."
         )
 
-        action_character.attributes["rested"] = outcome
+        set_entity_attribute(action_character, "rested", outcome)
         return f"You sleep in the {action_room.name} and wake up feeling {outcome}"
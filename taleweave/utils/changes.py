@@ -0,0 +1,86 @@
+from logging import getLogger
+from typing import Dict, Iterable
+
+from taleweave.models.base import Attributes, AttributeValue
+from taleweave.models.entity import WorldEntity
+
+logger = getLogger(__name__)
+
+
+class ChangeTracker:
+    """
+    Enables the caches that compare entity versions instead of attributes.
+
+    Entity versions are kept whether or not a tracker is enabled, but changes made without the mutation helpers are
+    not seen. While a tracker is enabled, the effective attributes and description caches compare versions instead of
+    attributes, so it should only be enabled with game systems and actions that use the helpers.
+    """
+
+    def version(self, entity: WorldEntity) -> int:
+        return get_entity_version(entity)
+
+
+change_tracker: ChangeTracker | None = None
+
+# the attribute version of every entity that has been changed, kept whether or not change tracking is enabled
+entity_versions: Dict[str, int] = {}
+
+
+def get_change_tracker() -> ChangeTracker | None:
+    return change_tracker
+
+
+def set_change_tracker(tracker: ChangeTracker | None) -> None:
+    global change_tracker
+    change_tracker = tracker
+
+
+def get_entity_version(entity: WorldEntity) -> int:
+    """
+    Get the attribute version of an entity, which increases every time the entity is marked as changed.
+    """
+
+    return entity_versions.get(entity.id, 0)
+
+
+def mark_changed(*entities: WorldEntity) -> None:
+    """
+    Record that some entities have changed, invalidating anything cached for their current version.
+    """
+
+    for entity in entities:
+        entity_versions[entity.id] = entity_versions.get(entity.id, 0) + 1
+
+
+# region mutation helpers
+def set_entity_attribute(entity: WorldEntity, name: str, value: AttributeValue) -> None:
+    changed = name not in entity.attributes or entity.attributes[name] != value
+    entity.attributes[name] = value
+    if changed:
+        mark_changed(entity)
+
+
+def set_entity_attributes(entity: WorldEntity, attributes: Attributes) -> None:
+    changed = False
+    for name, value in attributes.items():
+        if name not in entity.attributes or entity.attributes[name] != value:
+            changed = True
+
+        entity.attributes[name] = value
+
+    if changed:
+        mark_changed(entity)
+
+
+def remove_entity_attributes(entity: WorldEntity, names: Iterable[str]) -> None:
+    changed = False
+    for name in names:
+        if name in entity.attributes:
+            del entity.attributes[name]
+            changed = True
+
+    if changed:
+        mark_changed(entity)
+
+
+# endregion
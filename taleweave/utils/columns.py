@@ -0,0 +1,158 @@
+from logging import getLogger
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from taleweave.models.base import Attributes, AttributeValue
+from taleweave.models.entity import WorldEntity
+from taleweave.utils.effect import get_effective_attributes
+
+logger = getLogger(__name__)
+
+MISSING = -1
+
+
+class AttributeCodes:
+    """
+    Intern attribute values as integer codes. Values are interned by Python equality, so two values share a code
+    exactly when they would compare equal in an attribute dict.
+    """
+
+    codes: Dict[AttributeValue, int]
+
+    def __init__(self):
+        self.codes = {}
+
+    def code(self, value: AttributeValue) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.codes)
+            self.codes[value] = code
+
+        return code
+
+    def find(self, value: AttributeValue) -> int:
+        """
+        Get the code for a value without interning it. Values that have never been seen return MISSING.
+        """
+
+        return self.codes.get(value, MISSING)
+
+
+class AttributeColumns:
+    """
+    A columnar copy of the effective attributes of a list of entities, with one array of value codes for each attribute
+    key. Rows are in the same order as the entities, and missing attributes use the MISSING code.
+
+    The entity attribute dicts remain the source of truth: after changing an entity, update its row using the
+    helpers here or call `sync_row`.
+    """
+
+    columns: Dict[str, np.ndarray]
+    entities: List[WorldEntity]
+    types: np.ndarray
+    values: AttributeCodes
+
+    def __init__(self, entities: Sequence[WorldEntity]):
+        self.entities = list(entities)
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        self.columns = {}
+        self.values = AttributeCodes()
+        self.types = np.array(
+            [self.values.code(entity.type) for entity in self.entities],
+            dtype=np.int32,
+        )
+
+        # fill plain lists first, since setting one array item at a time is much slower
+        rows = len(self.entities)
+        codes: Dict[str, List[int]] = {}
+        value_codes = self.values.codes
+        for row, entity in enumerate(self.entities):
+            for key, value in get_effective_attributes(entity).items():
+                column = codes.get(key)
+                if column is None:
+                    column = codes[key] = [MISSING] * rows
+
+                code = value_codes.get(value)
+                if code is None:
+                    code = self.values.code(value)
+
+                column[row] = code
+
+        for key, column in codes.items():
+            self.columns[key] = np.array(column, dtype=np.int32)
+
+    def column(self, key: str) -> np.ndarray:
+        column = self.columns.get(key)
+        if column is None:
+            column = np.full(len(self.entities), MISSING, dtype=np.int32)
+            self.columns[key] = column
+
+        return column
+
+    def match_mask(
+        self,
+        match: Sequence[Tuple[str, AttributeValue]],
+    ) -> np.ndarray:
+        """
+        Get a mask of the rows whose attributes match every pair. The `type` key matches the entity type.
+        """
+
+        mask = np.ones(len(self.entities), dtype=bool)
+        for key, value in match:
+            code = self.values.find(value)
+            if code == MISSING:
+                mask[:] = False
+                break
+
+            if key == "type":
+                mask &= self.types == code
+            elif key in self.columns:
+                mask &= self.columns[key] == code
+            else:
+                mask[:] = False
+                break
+
+        return mask
+
+    def presence_mask(self, checks: Sequence[Tuple[str, bool]]) -> np.ndarray:
+        """
+        Get a mask of the rows that have, or do not have, each key. The `type` key is present on every row.
+        """
+
+        mask = np.ones(len(self.entities), dtype=bool)
+        for key, present in checks:
+            if key == "type":
+                has_key = np.ones(len(self.entities), dtype=bool)
+            elif key in self.columns:
+                has_key = self.columns[key] != MISSING
+            else:
+                has_key = np.zeros(len(self.entities), dtype=bool)
+
+            mask &= has_key if present else ~has_key
+
+        return mask
+
+    def remove_rows(self, rows: np.ndarray, keys: Sequence[str]) -> None:
+        for key in keys:
+            if key in self.columns:
+                self.columns[key][rows] = MISSING
+
+    def set_rows(self, rows: np.ndarray, attributes: Attributes) -> None:
+        for key, value in attributes.items():
+            self.column(key)[rows] = self.values.code(value)
+
+    def sync_row(self, row: int) -> None:
+        """
+        Update a row from its entity, after the entity attributes have been changed elsewhere.
+        """
+
+        attributes = get_effective_attributes(self.entities[row])
+        for key, column in self.columns.items():
+            if key not in attributes:
+                column[row] = MISSING
+
+        for key, value in attributes.items():
+            self.column(key)[row] = self.values.code(value)
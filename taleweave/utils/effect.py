@@ -1,5 +1,7 @@
+from heapq import heappop, heappush
+from itertools import count
 from logging import getLogger
-from typing import List, Literal
+from typing import Dict, Iterator, List, Literal, Tuple
 
 from taleweave.models.effect import (
     BooleanEffectPattern,
@@ -13,7 +15,15 @@ from taleweave.models.effect import (
     StringEffectPattern,
     StringEffectResult,
 )
-from taleweave.models.entity import Attributes, Character
+from taleweave.models.entity import (
+    Attributes,
+    Character,
+    Item,
+    Portal,
+    Room,
+    World,
+    WorldEntity,
+)
 from taleweave.utils.attribute import (
     add_value,
     append_value,
@@ -21,10 +31,13 @@ from taleweave.utils.attribute import (
     prepend_value,
 )
 
+from .changes import get_change_tracker, get_entity_version, mark_changed
 from .random import resolve_float_range, resolve_int_range, resolve_string_list
 
 logger = getLogger(__name__)
 
+EffectTarget = Character | Item | Room
+
 
 def effective_boolean(attributes: Attributes, effect: BooleanEffectResult) -> bool:
     """
@@ -210,11 +223,14 @@ def resolve_effects(effects: List[EffectPattern]) -> List[EffectResult]:
     return results
 
 
-def is_active_effect(effect: EffectResult) -> bool:
+def is_active_effect(effect: EffectResult, turn: int | None = None) -> bool:
     """
-    Determine if an effect is active.
+    Determine if an effect is active. Effects with an expiry turn are active until that turn.
     """
 
+    if effect.expires is not None and turn is not None:
+        return turn < effect.expires
+
     return effect.duration is None or effect.duration > 0
 
 
@@ -252,36 +268,228 @@ def apply_permanent_effects(
     return apply_permanent_results(attributes, results)
 
 
-def apply_effects(target: Character, effects: List[EffectPattern]) -> None:
+class EffectiveAttributes:
+    """
+    The attributes of an entity with its active effects applied, along with the base attributes, effects, and
+    version they were built from.
+
+    Changes to the base attributes are only seen through the entity version, so they must be made with the mutation
+    helpers or followed by `mark_changed`.
+    """
+
+    attributes: Attributes
+    base: Attributes
+    effects: List[EffectResult]
+    version: int
+
+    def __init__(self, entity: EffectTarget):
+        self.base = entity.attributes
+        self.effects = list(entity.active_effects)
+        self.version = get_entity_version(entity)
+        self.attributes = effective_attributes(self.effects, self.base)
+
+    def add_effects(self, effects: List[EffectResult], version: int) -> None:
+        self.attributes = effective_attributes(effects, self.attributes)
+        self.effects.extend(effects)
+        self.version = version
+
+    def is_current(self, entity: EffectTarget) -> bool:
+        if (
+            self.version != get_entity_version(entity)
+            or self.base is not entity.attributes
+        ):
+            return False
+
+        if len(self.effects) != len(entity.active_effects):
+            return False
+
+        return all(
+            cached is active
+            for cached, active in zip(self.effects, entity.active_effects)
+        )
+
+
+effective_cache: Dict[str, EffectiveAttributes] = {}
+
+
+def get_effective_attributes(entity: WorldEntity) -> Attributes:
+    """
+    Get the attributes of an entity with its active effects applied. While change tracking is enabled, the result is
+    cached until the entity version or active effects change, and must not be modified.
+    """
+
+    if isinstance(entity, Portal) or not entity.active_effects:
+        return entity.attributes
+
+    # changes made without the helpers do not change the entity version, so only cache while they are being tracked
+    if not get_change_tracker():
+        return effective_attributes(entity.active_effects, entity.attributes)
+
+    cached = effective_cache.get(entity.id)
+    if cached is None or not cached.is_current(entity):
+        cached = effective_cache[entity.id] = EffectiveAttributes(entity)
+
+    return cached.attributes
+
+
+def apply_effects(
+    world: World, target: EffectTarget, effects: List[EffectPattern]
+) -> None:
     """
-    Apply a set of effects to a character and their attributes.
+    Apply a set of effects to a character, item, or room and their attributes.
     """
 
-    permanent_effects = [
+    permanent_patterns = [
         effect for effect in effects if effect.application == "permanent"
     ]
-    permanent_effects = resolve_effects(permanent_effects)
-    target.attributes = apply_permanent_results(target.attributes, permanent_effects)
+    permanent_effects = resolve_effects(permanent_patterns)
+    if permanent_effects:
+        target.attributes = apply_permanent_results(
+            target.attributes, permanent_effects
+        )
+        mark_changed(target)
 
-    temporary_effects = [
+    temporary_patterns = [
         effect for effect in effects if effect.application == "temporary"
     ]
-    temporary_effects = resolve_effects(temporary_effects)
-    target.active_effects.extend(temporary_effects)
+    temporary_effects = resolve_effects(temporary_patterns)
+    if temporary_effects:
+        # update the effective attributes in place, if they are still current before adding the new effects
+        cached = effective_cache.get(target.id)
+        current = cached is not None and cached.is_current(target)
+
+        target.active_effects.extend(temporary_effects)
+        mark_changed(target)
+
+        if cached and current:
+            cached.add_effects(temporary_effects, get_entity_version(target))
+
+    schedule = get_existing_schedule(world)
+    if schedule:
+        for effect in temporary_effects:
+            schedule.add(target, effect)
+
+
+def list_effect_targets(world: World) -> Iterator[EffectTarget]:
+    def list_items(items: List[Item]) -> Iterator[Item]:
+        for item in items:
+            yield item
+            yield from list_items(item.items)
+
+    for room in world.rooms:
+        yield room
+        yield from list_items(room.items)
+        for character in room.characters:
+            yield character
+            yield from list_items(character.items)
 
 
-def expire_effects(target: Character) -> None:
+class EffectSchedule:
     """
-    Decrement the duration of effects on a character and remove any that have expired.
+    A heap of the active effects on every character, item, and room in a world, ordered by the turn on which they
+    expire, so each turn only needs to visit the effects that are expiring.
+
+    Effects that do not have an expiry turn yet expire after their remaining duration, counting from the next turn
+    to be expired. Effects removed from their target some other way are skipped when they reach the top of the heap.
     """
 
-    for effect in target.active_effects:
-        if effect.duration is not None:
-            effect.duration -= 1
+    heap: List[Tuple[int, int, EffectTarget, EffectResult]]
+    order: Iterator[int]
+    turn: int
+    world: World
 
-    target.active_effects[:] = [
-        effect for effect in target.active_effects if is_active_effect(effect)
-    ]
+    def __init__(self, world: World, turn: int):
+        self.heap = []
+        self.order = count()
+        self.turn = turn
+        self.world = world
+
+        for target in list_effect_targets(world):
+            for effect in target.active_effects:
+                self.add(target, effect)
+
+    def add(self, target: EffectTarget, effect: EffectResult) -> None:
+        if effect.expires is None:
+            if effect.duration is None:
+                return
+
+            effect.expires = self.turn + effect.duration
+
+        heappush(self.heap, (effect.expires, next(self.order), target, effect))
+
+    def expire(self, turn: int) -> List[Tuple[EffectTarget, EffectResult]]:
+        """
+        Remove the effects that expire on or before the given turn from their targets.
+        """
+
+        self.turn = turn
+        expired = []
+
+        while self.heap and self.heap[0][0] <= turn:
+            _expires, _order, target, effect = heappop(self.heap)
+            if any(active is effect for active in target.active_effects):
+                target.active_effects[:] = [
+                    active for active in target.active_effects if active is not effect
+                ]
+                effective_cache.pop(target.id, None)
+                mark_changed(target)
+                expired.append((target, effect))
+
+        return expired
+
+    def update_durations(self, turn: int) -> None:
+        """
+        Set the remaining duration of each effect, counting the turn that will be simulated after loading a snapshot
+        taken on this turn, for saved states that only use relative durations.
+        """
+
+        for expires, _order, _target, effect in self.heap:
+            effect.duration = max(expires - turn + 1, 0)
+
+
+effect_schedules: Dict[str, EffectSchedule] = {}
+
+
+def get_effect_schedule(world: World, turn: int) -> EffectSchedule:
+    """
+    Get the effect schedule for a world, building it on first use. Effects without an expiry turn that are found
+    while building the schedule will expire after their remaining duration, counting from this turn.
+    """
+
+    schedule = get_existing_schedule(world)
+    if schedule is None:
+        schedule = EffectSchedule(world, turn - 1)
+        effect_schedules[world.id] = schedule
+
+    return schedule
+
+
+def get_existing_schedule(world: World) -> EffectSchedule | None:
+    schedule = effect_schedules.get(world.id)
+    if schedule is not None and schedule.world is world:
+        return schedule
+
+    return None
+
+
+def expire_world_effects(
+    world: World, turn: int
+) -> List[Tuple[EffectTarget, EffectResult]]:
+    """
+    Remove any effects that have expired from the characters, items, and rooms in a world.
+    """
+
+    expired = get_effect_schedule(world, turn).expire(turn)
+    for target, effect in expired:
+        logger.info("effect %s expired on %s", effect.name, target.name)
+
+    return expired
+
+
+def update_effect_durations(world: World, turn: int) -> None:
+    schedule = get_existing_schedule(world)
+    if schedule:
+        schedule.update_durations(turn)
 
 
 def is_effect_ready(
@@ -0,0 +1,125 @@
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Sequence, Set, Tuple, cast
+
+from taleweave.models.event import GameEvent
+
+
+class EventLog:
+    """
+    A bounded log of action events shared by every character, with a cursor for each character. A character's digest
+    is the events between their cursor and the head of the log, and their cursor moves up to the head when they act.
+
+    Events are kept in a ring, so the oldest events are overwritten once the log is full. A cursor that points at an
+    overwritten event is moved past it, and the event is counted as missed if it was indexed by one of the reader's
+    keys, so cursors always stay within the log.
+
+    Each event can be indexed by a list of keys, usually entity IDs, so readers can find the events for a few keys
+    without scanning the whole log.
+    """
+
+    cursors: Dict[str, int]
+    event_keys: List[Sequence[str]]
+    events: List[GameEvent | None]
+    head: int
+    indexes: Dict[str, Deque[int]]
+    lowest: int
+    missed: Dict[str, int]
+    reader_keys: Dict[str, Set[str] | None]
+    size: int
+
+    def __init__(self, size: int):
+        self.cursors = {}
+        self.event_keys = [()] * size
+        self.events = [None] * size
+        self.head = 0
+        self.indexes = {}
+        self.lowest = 0
+        self.missed = {}
+        self.reader_keys = {}
+        self.size = size
+
+    def append(self, event: GameEvent, keys: Sequence[str] = ()) -> GameEvent | None:
+        """
+        Add an event to the log, returning the oldest event if it was overwritten.
+        """
+
+        position = self.head
+        slot = position % self.size
+        evicted = self.events[slot]
+        if evicted is not None:
+            self.evict(position - self.size, self.event_keys[slot])
+
+        self.events[slot] = event
+        self.event_keys[slot] = keys
+        self.head += 1
+
+        oldest = self.head - self.size
+        for key in keys:
+            positions = self.indexes.setdefault(key, deque())
+            if positions and positions[-1] == position:
+                continue
+
+            positions.append(position)
+            while positions[0] < oldest:
+                positions.popleft()
+
+        return evicted
+
+    def evict(self, position: int, keys: Sequence[str]) -> None:
+        # no reader can be at the evicted position unless one was left behind
+        if position < self.lowest:
+            return
+
+        for name, cursor in self.cursors.items():
+            if cursor <= position:
+                self.cursors[name] = position + 1
+                reader_keys = self.reader_keys.get(name)
+                if reader_keys is None or not reader_keys.isdisjoint(keys):
+                    self.missed[name] = self.missed.get(name, 0) + 1
+
+        self.lowest = min(self.cursors.values(), default=self.head)
+
+    def add_reader(self, name: str, keys: Iterable[str] | None = None) -> None:
+        """
+        Add a reader at the head of the log. If keys are given, only the overwritten events indexed by at least one of
+        them are counted as missed.
+        """
+
+        if name not in self.cursors:
+            self.cursors[name] = self.head
+            self.reader_keys[name] = None if keys is None else set(keys)
+
+    def reset_reader(self, name: str, keys: Iterable[str] | None = None) -> None:
+        """
+        Move a reader to the head of the log and clear their missed events, updating their keys if they are given.
+        """
+
+        self.cursors[name] = self.head
+        self.missed.pop(name, None)
+        if keys is not None:
+            self.reader_keys[name] = set(keys)
+
+    def read(
+        self, name: str, keys: Iterable[str] | None = None
+    ) -> Tuple[int, List[GameEvent]]:
+        """
+        Get the number of events that the reader has missed since their cursor, and the events that are still in the
+        log. If keys are given, only the events indexed by at least one of those keys are returned.
+        """
+
+        cursor = self.cursors.get(name, self.head)
+        if keys is None:
+            positions: Iterable[int] = range(cursor, self.head)
+        else:
+            matches = set()
+            for key in keys:
+                for position in reversed(self.indexes.get(key, ())):
+                    if position < cursor:
+                        break
+
+                    matches.add(position)
+
+            positions = sorted(matches)
+
+        events = [self.events[position % self.size] for position in positions]
+        return self.missed.get(name, 0), cast(List[GameEvent], events)
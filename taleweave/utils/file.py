@@ -1,3 +1,8 @@
+from json import dumps
+from json import load as load_json
+from os import fsync, replace
+from typing import Any, Callable, Dict
+
 from yaml import Loader, dump, load
 
 # this module MUST NOT import any other taleweave modules, since it is used to initialize the logger
@@ -9,3 +14,73 @@ def load_yaml(file):
 
 def save_yaml(file, data):
     return dump(data, file)
+
+
+def write_atomic(filename: str, data: str | bytes) -> None:
+    """
+    Write a file by writing a temporary file next to it and renaming that over the original, so readers and crashes
+    never see a partially written file.
+    """
+
+    temp_filename = f"{filename}.tmp"
+    with open(temp_filename, "wb" if isinstance(data, bytes) else "w") as f:
+        f.write(data)
+        f.flush()
+        fsync(f.fileno())
+
+    replace(temp_filename, filename)
+
+
+def is_binary_file(filename: str) -> bool:
+    """
+    Check whether a state file uses the binary MessagePack format, optionally compressed with zstd.
+    """
+
+    return filename.endswith(".msgpack") or filename.endswith(".msgpack.zst")
+
+
+def load_state_data(filename: str) -> Dict[str, Any]:
+    """
+    Load the data from a state file, using the format for its extension. JSON and YAML files are both supported.
+    """
+
+    if is_binary_file(filename):
+        import msgpack
+
+        with open(filename, "rb") as f:
+            data = f.read()
+
+        if filename.endswith(".zst"):
+            import zstandard
+
+            data = zstandard.ZstdDecompressor().decompress(data)
+
+        return msgpack.unpackb(data)
+
+    with open(filename, "r") as f:
+        if filename.endswith(".json"):
+            return load_json(f)
+
+        return load_yaml(f)
+
+
+def dump_state_data(
+    filename: str, data: Dict[str, Any], default: Callable[[Any], Any] | None = None
+) -> str | bytes:
+    """
+    Serialize the data for a state file, using the format for its extension. Files that are not binary are written
+    as JSON, which can also be loaded as YAML.
+    """
+
+    if is_binary_file(filename):
+        import msgpack
+
+        packed = msgpack.packb(data, default=default)
+        if filename.endswith(".zst"):
+            import zstandard
+
+            packed = zstandard.ZstdCompressor().compress(packed)
+
+        return packed
+
+    return dumps(data, default=default, indent=2)
@@ -0,0 +1,282 @@
+from logging import getLogger
+from typing import Callable, Dict, List, Sequence
+
+from taleweave.models.entity import Character, Item, Portal, Room, World, WorldEntity
+
+from .changes import mark_changed
+from .string import normalize_name
+
+logger = getLogger(__name__)
+
+Container = Room | Character | Item
+
+
+class WorldIndex:
+    """
+    Lookup tables for the entities in a world: by ID, by normalized name for each entity type, and by the container
+    that directly holds each entity.
+
+    The index is updated by the mutation helpers in this module. Lookups check that an entity is still held by its
+    indexed container before returning it, so changes made without the helpers are never returned incorrectly, but
+    they are not found until the index is rebuilt. Rooms added to the world directly are found by their count.
+    """
+
+    world: World
+    entities: Dict[str, WorldEntity]
+    names: Dict[str, Dict[str, List[WorldEntity]]]
+    parents: Dict[str, Container]
+    room_count: int
+
+    def __init__(self, world: World):
+        self.world = world
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        logger.debug("rebuilding index for world: %s", self.world.name)
+
+        self.entities = {}
+        self.names = {
+            "character": {},
+            "item": {},
+            "portal": {},
+            "room": {},
+        }
+        self.parents = {}
+        self.room_count = len(self.world.rooms)
+
+        for room in self.world.rooms:
+            self.add_room(room)
+
+    def add_entity(self, entity: WorldEntity, parent: Container | None) -> None:
+        self.entities[entity.id] = entity
+
+        named = self.names[entity.type].setdefault(normalize_name(entity.name), [])
+        if not any(other is entity for other in named):
+            named.append(entity)
+
+        if parent is None:
+            self.parents.pop(entity.id, None)
+        else:
+            self.parents[entity.id] = parent
+
+    def add_room(self, room: Room) -> None:
+        self.add_entity(room, None)
+
+        for portal in room.portals:
+            self.add_entity(portal, room)
+
+        for character in room.characters:
+            self.add_character(character, room)
+
+        for item in room.items:
+            self.add_item(item, room)
+
+    def add_character(self, character: Character, room: Room) -> None:
+        self.add_entity(character, room)
+
+        for item in character.items:
+            self.add_item(item, character)
+
+    def add_item(self, item: Item, parent: Container) -> None:
+        self.add_entity(item, parent)
+
+        for child in item.items:
+            self.add_item(child, item)
+
+    def remove_entity(self, entity: WorldEntity) -> None:
+        self.entities.pop(entity.id, None)
+        self.parents.pop(entity.id, None)
+
+        name = normalize_name(entity.name)
+        named = self.names[entity.type].get(name, [])
+        named[:] = [other for other in named if other is not entity]
+        if not named:
+            self.names[entity.type].pop(name, None)
+
+        if isinstance(entity, Room):
+            for portal in entity.portals:
+                self.remove_entity(portal)
+
+            for character in entity.characters:
+                self.remove_entity(character)
+
+        if not isinstance(entity, Portal):
+            for item in entity.items:
+                self.remove_entity(item)
+
+    def check_rooms(self) -> None:
+        """
+        Rebuild the index if rooms have been added to the world without using the mutation helpers.
+        """
+
+        if len(self.world.rooms) != self.room_count:
+            self.rebuild()
+
+    def get_parent(self, entity: WorldEntity) -> Container | None:
+        """
+        Get the container that directly holds an entity, if the entity is still there.
+        """
+
+        parent = self.parents.get(entity.id)
+        if parent is not None and is_contained(parent, entity):
+            return parent
+
+        return None
+
+    def get_room(self, entity: WorldEntity) -> Room | None:
+        """
+        Get the room that holds an entity, following its containers up to the room.
+        """
+
+        if isinstance(entity, Room):
+            return entity
+
+        parent = self.get_parent(entity)
+        while parent is not None and not isinstance(parent, Room):
+            parent = self.get_parent(parent)
+
+        return parent
+
+    def is_current(self, entity: WorldEntity) -> bool:
+        if isinstance(entity, Room):
+            return entity.id in self.entities
+
+        return self.get_parent(entity) is not None
+
+    def find_name(
+        self,
+        entity_type: str,
+        name: str,
+        predicate: Callable[[WorldEntity], bool] | None = None,
+    ) -> WorldEntity | None:
+        self.check_rooms()
+
+        for entity in self.names[entity_type].get(normalize_name(name), []):
+            if self.is_current(entity) and (predicate is None or predicate(entity)):
+                return entity
+
+        return None
+
+
+def is_contained(container: Container, entity: WorldEntity) -> bool:
+    contents: Sequence[WorldEntity]
+    if isinstance(entity, Character):
+        if not isinstance(container, Room):
+            return False
+
+        contents = container.characters
+    elif isinstance(entity, Portal):
+        if not isinstance(container, Room):
+            return False
+
+        contents = container.portals
+    else:
+        contents = container.items
+
+    return any(other.id == entity.id for other in contents)
+
+
+world_indexes: Dict[str, WorldIndex] = {}
+
+
+def get_world_index(world: World) -> WorldIndex:
+    """
+    Get the index for a world, building it on first use.
+    """
+
+    index = world_indexes.get(world.id)
+    if index is None or index.world is not world:
+        index = WorldIndex(world)
+        world_indexes[world.id] = index
+
+    return index
+
+
+def get_existing_index(world: World) -> WorldIndex | None:
+    index = world_indexes.get(world.id)
+    if index is not None and index.world is world:
+        return index
+
+    return None
+
+
+def invalidate_world_index(world: World) -> None:
+    """
+    Drop the index for a world, so it will be rebuilt on the next lookup.
+    """
+
+    world_indexes.pop(world.id, None)
+
+
+# region mutation helpers
+def add_room(world: World, room: Room) -> None:
+    world.rooms.append(room)
+    mark_changed(room)
+
+    index = get_existing_index(world)
+    if index:
+        index.add_room(room)
+        index.room_count = len(world.rooms)
+
+
+def add_portal(world: World, room: Room, portal: Portal) -> None:
+    room.portals.append(portal)
+    mark_changed(room, portal)
+
+    index = get_existing_index(world)
+    if index:
+        index.add_entity(portal, room)
+
+
+def add_character(world: World, room: Room, character: Character) -> None:
+    room.characters.append(character)
+    mark_changed(room, character)
+
+    index = get_existing_index(world)
+    if index:
+        index.add_character(character, room)
+
+
+def add_item(world: World, container: Container, item: Item) -> None:
+    container.items.append(item)
+    mark_changed(container, item)
+
+    index = get_existing_index(world)
+    if index:
+        index.add_item(item, container)
+
+
+def remove_item(world: World, container: Container, item: Item) -> None:
+    container.items.remove(item)
+    mark_changed(container, item)
+
+    index = get_existing_index(world)
+    if index:
+        index.remove_entity(item)
+
+
+def move_item(
+    world: World, source: Container, destination: Container, item: Item
+) -> None:
+    source.items.remove(item)
+    destination.items.append(item)
+    mark_changed(source, destination, item)
+
+    index = get_existing_index(world)
+    if index:
+        index.add_entity(item, destination)
+
+
+def move_character(
+    world: World, source: Room, destination: Room, character: Character
+) -> None:
+    source.characters.remove(character)
+    destination.characters.append(character)
+    mark_changed(source, destination, character)
+
+    index = get_existing_index(world)
+    if index:
+        index.add_entity(character, destination)
+
+
+# endregion
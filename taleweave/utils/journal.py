@@ -0,0 +1,273 @@
+from json import dumps, loads
+from logging import getLogger
+from os import fsync, path, remove
+from typing import Any, Callable, Dict, List, Tuple
+
+from taleweave.utils.file import dump_state_data, load_state_data, write_atomic
+
+logger = getLogger(__name__)
+
+# the keys that hold child entities, for each entity type
+CHILD_KEYS: Dict[str, List[str]] = {
+    "character": ["items"],
+    "item": ["items"],
+    "portal": [],
+    "room": ["characters", "items", "portals"],
+}
+
+EntityRecords = Dict[str, Dict[str, Any]]
+MemoryState = Dict[str, List[Any]]
+
+
+def flatten_world(world: Dict[str, Any]) -> Tuple[Dict[str, Any], EntityRecords]:
+    """
+    Split a dumped world into the world fields and a flat record for each entity, where lists of child entities have
+    been replaced by lists of their IDs.
+    """
+
+    entities: EntityRecords = {}
+
+    def add_entity(entity: Dict[str, Any]) -> str:
+        entity_id = entity["id"]
+        if entity_id in entities:
+            raise ValueError(f"duplicate entity ID: {entity_id}")
+
+        record = dict(entity)
+        entities[entity_id] = record
+        for key in CHILD_KEYS[entity["type"]]:
+            record[key] = [add_entity(child) for child in entity.get(key, [])]
+
+        return entity_id
+
+    header = dict(world)
+    header["rooms"] = [add_entity(room) for room in world["rooms"]]
+    return header, entities
+
+
+def unflatten_world(header: Dict[str, Any], entities: EntityRecords) -> Dict[str, Any]:
+    def get_entity(entity_id: str) -> Dict[str, Any]:
+        entity = dict(entities[entity_id])
+        for key in CHILD_KEYS[entity["type"]]:
+            entity[key] = [get_entity(child) for child in entity.get(key, [])]
+
+        return entity
+
+    world = dict(header)
+    world["rooms"] = [get_entity(room_id) for room_id in header["rooms"]]
+    return world
+
+
+def diff_memory(previous: List[Any], current: List[Any]) -> Dict[str, Any] | None:
+    """
+    Describe the change from one memory to the next as the number of old messages that were dropped from the front
+    and the new messages that were appended, or replace the whole memory if it changed some other way.
+    """
+
+    if previous == current:
+        return None
+
+    for dropped in range(len(previous) + 1):
+        kept = len(previous) - dropped
+        if current[:kept] == previous[dropped:]:
+            return {"drop": dropped, "append": current[kept:]}
+
+    return {"replace": current}
+
+
+def apply_memory(previous: List[Any], delta: Dict[str, Any]) -> List[Any]:
+    if "replace" in delta:
+        return list(delta["replace"])
+
+    return previous[delta["drop"] :] + list(delta["append"])
+
+
+def diff_state(
+    previous: Tuple[Dict[str, Any], EntityRecords, MemoryState],
+    current: Tuple[Dict[str, Any], EntityRecords, MemoryState],
+    turn: int,
+) -> Dict[str, Any]:
+    previous_header, previous_entities, previous_memory = previous
+    header, entities, memory = current
+
+    delta: Dict[str, Any] = {"turn": turn}
+    if header != previous_header:
+        delta["world"] = header
+
+    changed = {
+        entity_id: record
+        for entity_id, record in entities.items()
+        if previous_entities.get(entity_id) != record
+    }
+    if changed:
+        delta["set"] = changed
+
+    removed = [
+        entity_id for entity_id in previous_entities if entity_id not in entities
+    ]
+    if removed:
+        delta["remove"] = removed
+
+    memory_delta = {}
+    for name, messages in memory.items():
+        message_delta = diff_memory(previous_memory.get(name, []), messages)
+        if message_delta:
+            memory_delta[name] = message_delta
+
+    removed_memory = [name for name in previous_memory if name not in memory]
+    if memory_delta:
+        delta["memory"] = memory_delta
+
+    if removed_memory:
+        delta["remove_memory"] = removed_memory
+
+    return delta
+
+
+def apply_delta(
+    state: Tuple[Dict[str, Any], EntityRecords, MemoryState], delta: Dict[str, Any]
+) -> Tuple[Dict[str, Any], EntityRecords, MemoryState]:
+    header, entities, memory = state
+    header = delta.get("world", header)
+
+    entities.update(delta.get("set", {}))
+    for entity_id in delta.get("remove", []):
+        entities.pop(entity_id, None)
+
+    for name, message_delta in delta.get("memory", {}).items():
+        memory[name] = apply_memory(memory.get(name, []), message_delta)
+
+    for name in delta.get("remove_memory", []):
+        memory.pop(name, None)
+
+    return header, entities, memory
+
+
+def get_journal_path(state_path: str) -> str:
+    return f"{state_path}.journal"
+
+
+class StateJournal:
+    """
+    Save the world state as a base snapshot and an append-only journal of the changes made on each turn, so each turn
+    only writes what has changed. The journal is compacted into a new base snapshot every few turns.
+
+    Each journal entry records its turn, and entries from before the base snapshot are skipped when loading, so a
+    crash between writing a new base and truncating the journal is harmless.
+    """
+
+    compact_turns: int
+    default: Callable[[Any], Any] | None
+    entries: int
+    journal_path: str
+    last: Tuple[Dict[str, Any], EntityRecords, MemoryState] | None
+    state_path: str
+
+    def __init__(
+        self,
+        state_path: str,
+        compact_turns: int,
+        default: Callable[[Any], Any] | None = None,
+    ):
+        self.compact_turns = compact_turns
+        self.default = default
+        self.entries = 0
+        self.journal_path = get_journal_path(state_path)
+        self.last = None
+        self.state_path = state_path
+
+    def write(self, state: Dict[str, Any]) -> None:
+        # round trip through JSON, so the messages and other objects compare the same way they will be loaded
+        state = loads(dumps(state, default=self.default))
+        try:
+            current = (
+                *flatten_world(state["world"]),
+                {name: list(messages) for name, messages in state["memory"].items()},
+            )
+        except ValueError:
+            logger.exception("cannot journal world state, saving a full snapshot")
+            self.write_base(state)
+            self.last = None
+            return
+
+        if self.last is None or self.entries >= self.compact_turns:
+            self.write_base(state)
+        else:
+            delta = diff_state(self.last, current, state["turn"])
+            with open(self.journal_path, "a") as f:
+                f.write(dumps(delta) + "\n")
+                f.flush()
+                fsync(f.fileno())
+
+            self.entries += 1
+
+        self.last = current
+
+    def write_base(self, state: Dict[str, Any]) -> None:
+        logger.info("compacting world state journal into %s", self.state_path)
+        write_atomic(self.state_path, dump_state_data(self.state_path, state))
+        write_atomic(self.journal_path, "")
+        self.entries = 0
+
+
+def load_state_file(state_path: str) -> Dict[str, Any]:
+    """
+    Load a world state file and replay its journal, if there is one.
+    """
+
+    return replay_journal(state_path, load_state_data(state_path))
+
+
+def write_state_file(
+    state_path: str,
+    state: Dict[str, Any],
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """
+    Write a full world state file. The new state replaces any journal left over from a previous run, since replaying
+    the old journal on top of it would undo the changes.
+    """
+
+    write_atomic(state_path, dump_state_data(state_path, state, default=default))
+
+    journal_path = get_journal_path(state_path)
+    if path.exists(journal_path):
+        remove(journal_path)
+
+
+def replay_journal(state_path: str, state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply the journal entries for a base world state, if there are any.
+    """
+
+    journal_path = get_journal_path(state_path)
+    if not path.exists(journal_path):
+        return state
+
+    current = (*flatten_world(state["world"]), dict(state["memory"]))
+    turn = state["turn"]
+    with open(journal_path, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+
+            try:
+                delta = loads(line)
+            except ValueError:
+                # a crash while appending can leave a partial line at the end
+                logger.warning("skipping partial entry in %s", journal_path)
+                break
+
+            if delta["turn"] <= state["turn"]:
+                continue
+
+            current = apply_delta(current, delta)
+            turn = delta["turn"]
+
+    header, entities, memory = current
+    logger.info("replayed world state journal up to turn %s", turn)
+    return {
+        **state,
+        "memory": memory,
+        "turn": turn,
+        "world": unflatten_world(header, entities),
+    }
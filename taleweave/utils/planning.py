@@ -1,4 +1,20 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Set
+
 from taleweave.models.entity import Character
+from taleweave.models.planning import CalendarEvent
+
+
+def event_turn(event: CalendarEvent) -> int:
+    return event.turn
+
+
+def add_event(character: Character, event: CalendarEvent) -> None:
+    """
+    Add an event to a character's calendar, keeping the events in order by turn.
+    """
+
+    insort(character.planner.calendar.events, event, key=event_turn)
 
 
 def expire_events(character: Character, current_turn: int):
@@ -7,37 +23,160 @@ def expire_events(character: Character, current_turn: int):
     """
 
     events = character.planner.calendar.events
-    expired_events = [event for event in events if event.turn < current_turn]
-    character.planner.calendar.events[:] = [
-        event for event in events if event not in expired_events
-    ]
+    expired_count = bisect_left(events, current_turn, key=event_turn)
+    expired_events = events[:expired_count]
+    del events[:expired_count]
 
     return expired_events
 
 
-def get_recent_notes(character: Character, count: int = 3):
+def get_upcoming_events(
+    character: Character, current_turn: int, upcoming_turns: int = 3
+):
     """
-    Get the most recent facts from your notes.
+    Get a list of upcoming events within a certain number of turns.
     """
 
-    return character.planner.notes[-count:]
+    events = character.planner.calendar.events
+    upcoming_count = bisect_right(events, current_turn + upcoming_turns, key=event_turn)
+    return events[:upcoming_count]
 
 
-def get_upcoming_events(
-    character: Character, current_turn: int, upcoming_turns: int = 3
-):
+class NoteIndex:
     """
-    Get a list of upcoming events within a certain number of turns.
+    A set of a character's notes for duplicate checks, and a sorted copy for finding the notes that start with a
+    prefix, along with the note version they were built from.
+
+    The index is updated by the note helpers in this module, which also increase the version. It is rebuilt when the
+    note list or version has changed, or the number of notes does not match. Code that changes the notes some other
+    way should call `mark_notes_changed`.
     """
 
-    calendar = character.planner.calendar
-    upcoming = [
-        event
-        for event in calendar.events
-        if event.turn - current_turn <= upcoming_turns
+    notes: List[str]
+    note_set: Set[str]
+    sorted_notes: List[str]
+    version: int
+
+    def __init__(self, notes: List[str], version: int):
+        self.notes = notes
+        self.note_set = set(notes)
+        self.sorted_notes = sorted(notes)
+        self.version = version
+
+    def is_current(self, notes: List[str], version: int) -> bool:
+        return (
+            self.notes is notes
+            and self.version == version
+            and len(self.sorted_notes) == len(notes)
+        )
+
+    def add(self, note: str) -> None:
+        self.note_set.add(note)
+        insort(self.sorted_notes, note)
+
+    def find(self, note: str) -> int | None:
+        index = bisect_left(self.sorted_notes, note)
+        if index < len(self.sorted_notes) and self.sorted_notes[index] == note:
+            return index
+
+        return None
+
+    def remove(self, note: str) -> None:
+        index = self.find(note)
+        if index is not None:
+            del self.sorted_notes[index]
+
+        # duplicate notes can only come from a saved state, but keep them in the set until the last one is gone
+        if self.find(note) is None:
+            self.note_set.discard(note)
+
+    def find_prefix(self, prefix: str) -> List[str]:
+        start = bisect_left(self.sorted_notes, prefix)
+        end = start
+        while end < len(self.sorted_notes) and self.sorted_notes[end].startswith(
+            prefix
+        ):
+            end += 1
+
+        return self.sorted_notes[start:end]
+
+
+note_indexes: Dict[str, NoteIndex] = {}
+note_versions: Dict[str, int] = {}
+
+
+def mark_notes_changed(character: Character) -> int:
+    """
+    Record that a character's notes have changed, returning the new note version.
+    """
+
+    note_versions[character.id] = note_versions.get(character.id, 0) + 1
+    return note_versions[character.id]
+
+
+def get_note_index(character: Character) -> NoteIndex:
+    notes = character.planner.notes
+    version = note_versions.get(character.id, 0)
+    index = note_indexes.get(character.id)
+    if index is None or not index.is_current(notes, version):
+        index = note_indexes[character.id] = NoteIndex(notes, version)
+
+    return index
+
+
+def has_note(character: Character, note: str) -> bool:
+    return note in get_note_index(character).note_set
+
+
+def add_note(character: Character, note: str) -> None:
+    index = get_note_index(character)
+    character.planner.notes.append(note)
+    index.add(note)
+    index.version = mark_notes_changed(character)
+
+
+def erase_prefix_notes(character: Character, prefix: str) -> int:
+    """
+    Erase the notes that start with a prefix, returning the number of notes that were erased.
+    """
+
+    index = get_note_index(character)
+    matches = index.find_prefix(prefix)
+    if not matches:
+        return 0
+
+    for note in matches:
+        index.remove(note)
+
+    character.planner.notes[:] = [
+        note for note in character.planner.notes if not note.startswith(prefix)
     ]
+    index.version = mark_notes_changed(character)
+    return len(matches)
+
+
+def replace_note(character: Character, old: str, new: str) -> None:
+    index = get_note_index(character)
+    notes = character.planner.notes
+    for i, note in enumerate(notes):
+        if note == old:
+            notes[i] = new
+            index.remove(old)
+            index.add(new)
+
+    index.version = mark_notes_changed(character)
+
 
-    # sort by turn
-    upcoming.sort(key=lambda event: event.turn)
+def set_notes(character: Character, notes: List[str]) -> None:
+    character.planner.notes[:] = notes
+    note_indexes[character.id] = NoteIndex(
+        character.planner.notes, mark_notes_changed(character)
+    )
 
-    return upcoming
+
+def get_recent_notes(character: Character, count: int = 3):
+    """
+    Get the most recent facts from your notes.
+    """
+
+    return character.planner.notes[-count:]
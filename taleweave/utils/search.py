@@ -10,6 +10,7 @@ from taleweave.models.entity import (
     WorldEntity,
 )
 
+from .index import get_world_index
 from .string import normalize_name
 
 
@@ -21,27 +22,25 @@ def get_entity_name(entity: WorldEntity | str) -> str:
 
 
 def find_room(world: World, room_name: str) -> Room | None:
-    for room in world.rooms:
-        if normalize_name(room.name) == normalize_name(room_name):
-            return room
+    room = get_world_index(world).find_name("room", room_name)
+    if isinstance(room, Room):
+        return room
 
     return None
 
 
 def find_portal(world: World, portal_name: str) -> Portal | None:
-    for room in world.rooms:
-        portal = find_portal_in_room(room, portal_name)
-        if portal:
-            return portal
+    portal = get_world_index(world).find_name("portal", portal_name)
+    if isinstance(portal, Portal):
+        return portal
 
     return None
 
 
 def find_character(world: World, character_name: str) -> Character | None:
-    for room in world.rooms:
-        character = find_character_in_room(room, character_name)
-        if character:
-            return character
+    character = get_world_index(world).find_name("character", character_name)
+    if isinstance(character, Character):
+        return character
 
     return None
 
@@ -69,13 +68,24 @@ def find_item(
     include_item_inventory=False,
 ) -> Item | None:
     item_name = get_entity_name(item)
+    index = get_world_index(world)
 
-    for room in world.rooms:
-        result = find_item_in_room(
-            room, item_name, include_character_inventory, include_item_inventory
-        )
-        if result:
-            return result
+    def is_reachable(entity: WorldEntity) -> bool:
+        parent = index.get_parent(entity)
+        while isinstance(parent, Item):
+            if not include_item_inventory:
+                return False
+
+            parent = index.get_parent(parent)
+
+        if isinstance(parent, Character):
+            return include_character_inventory
+
+        return isinstance(parent, Room)
+
+    indexed_item = index.find_name("item", item_name, is_reachable)
+    if isinstance(indexed_item, Item):
+        return indexed_item
 
     return None
 
@@ -126,9 +136,13 @@ def find_containing_room(world: World, entity: Room | Character | Item) -> Room
     if isinstance(entity, Room):
         return entity
 
-    for room in world.rooms:
-        if entity in room.characters or entity in room.items:
-            return room
+    index = get_world_index(world)
+    index.check_rooms()
+
+    # entities held by a character or item are not directly in a room
+    parent = index.get_parent(entity)
+    if isinstance(parent, Room):
+        return parent
 
     return None
 
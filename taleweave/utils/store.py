@@ -0,0 +1,389 @@
+import sqlite3
+from json import dumps, loads
+from logging import getLogger
+from threading import Lock
+from typing import Any, Callable, Dict, List, Tuple
+
+from taleweave.utils.journal import (
+    CHILD_KEYS,
+    EntityRecords,
+    MemoryState,
+    diff_memory,
+    flatten_world,
+    unflatten_world,
+)
+
+logger = getLogger(__name__)
+
+STORE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS world (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS entities "
+    "(id TEXT PRIMARY KEY, type TEXT NOT NULL, name TEXT NOT NULL, data TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS entities_type ON entities (type, name)",
+    "CREATE TABLE IF NOT EXISTS attributes "
+    "(entity_id TEXT NOT NULL, name TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (entity_id, name))",
+    "CREATE INDEX IF NOT EXISTS attributes_name ON attributes (name, value)",
+    "CREATE TABLE IF NOT EXISTS containment "
+    "(child_id TEXT PRIMARY KEY, parent_id TEXT, kind TEXT NOT NULL, position INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS containment_parent ON containment (parent_id, kind, position)",
+    "CREATE TABLE IF NOT EXISTS portals "
+    "(id TEXT PRIMARY KEY, room_id TEXT NOT NULL, destination TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS portals_destination ON portals (destination)",
+    "CREATE TABLE IF NOT EXISTS memory "
+    "(agent TEXT NOT NULL, position INTEGER NOT NULL, message TEXT NOT NULL, PRIMARY KEY (agent, position))",
+    "CREATE TABLE IF NOT EXISTS system_data (name TEXT PRIMARY KEY, data TEXT NOT NULL)",
+]
+
+# the fields of each entity that are stored in their own tables
+ENTITY_TABLE_KEYS = {"attributes", "characters", "items", "portals"}
+
+WorldRecords = Tuple[Dict[str, Any], EntityRecords, MemoryState]
+
+
+def is_store_file(filename: str) -> bool:
+    return filename.endswith(STORE_EXTENSIONS)
+
+
+def get_entity_data(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in record.items() if key not in ENTITY_TABLE_KEYS}
+
+
+class WorldStore:
+    """
+    Store the world state and system data in a SQLite database, with tables for the entities, their attributes, which
+    entity contains each entity, the portals between rooms, agent memory, and system data.
+
+    Each write compares the state with the last one and only changes the rows for entities, attributes, messages, and
+    system data that are different, in a single transaction, so a crash leaves the previous turn in place.
+    """
+
+    connection: sqlite3.Connection
+    default: Callable[[Any], Any] | None
+    last: WorldRecords | None
+    last_systems: Dict[str, Any] | None
+    lock: Lock
+    path: str
+
+    def __init__(self, path: str, default: Callable[[Any], Any] | None = None):
+        # the store is opened on the main thread and written by the snapshot thread, one at a time
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.default = default
+        self.last = None
+        self.last_systems = None
+        self.lock = Lock()
+        self.path = path
+
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+
+    def close(self) -> None:
+        with self.lock:
+            self.connection.close()
+
+    def has_state(self) -> bool:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT 1 FROM world WHERE key = 'turn'"
+            ).fetchone()
+
+        return row is not None
+
+    # region world state
+    def load_records(self) -> Tuple[WorldRecords, int]:
+        cursor = self.connection.cursor()
+        fields = {
+            key: loads(value)
+            for key, value in cursor.execute("SELECT key, value FROM world")
+        }
+        turn = fields.pop("turn", 0)
+
+        entities: EntityRecords = {}
+        for entity_id, entity_type, data in cursor.execute(
+            "SELECT id, type, data FROM entities"
+        ):
+            record = loads(data)
+            record["attributes"] = {}
+            for key in CHILD_KEYS[entity_type]:
+                record[key] = []
+
+            entities[entity_id] = record
+
+        for entity_id, name, value in cursor.execute(
+            "SELECT entity_id, name, value FROM attributes"
+        ):
+            entities[entity_id]["attributes"][name] = loads(value)
+
+        rooms = []
+        for child_id, parent_id, kind in cursor.execute(
+            "SELECT child_id, parent_id, kind FROM containment ORDER BY parent_id, kind, position"
+        ):
+            if parent_id is None:
+                rooms.append(child_id)
+            else:
+                entities[parent_id][kind].append(child_id)
+
+        memory: MemoryState = {}
+        for agent, message in cursor.execute(
+            "SELECT agent, message FROM memory ORDER BY agent, position"
+        ):
+            memory.setdefault(agent, []).append(loads(message))
+
+        header = {**fields, "rooms": rooms}
+        return (header, entities, memory), turn
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Load the world state, in the same shape as a world state file.
+        """
+
+        with self.lock:
+            records, turn = self.load_records()
+
+        self.last = records
+        header, entities, memory = records
+        return {
+            "memory": {name: list(messages) for name, messages in memory.items()},
+            "turn": turn,
+            "world": unflatten_world(header, entities),
+        }
+
+    def write(self, state: Dict[str, Any]) -> None:
+        """
+        Write the changes since the last state. The state can include a `systems` field with the dumped data for each
+        game system, which is written in the same transaction.
+        """
+
+        # round trip through JSON, so the messages and other objects compare the same way they will be loaded
+        state = loads(dumps(state, default=self.default))
+        current = (
+            *flatten_world(state["world"]),
+            {name: list(messages) for name, messages in state["memory"].items()},
+        )
+
+        with self.lock, self.connection:
+            if self.last is None:
+                self.last, _turn = self.load_records()
+
+            changed = self.write_records(self.last, current)
+            changed += self.write_systems(state.get("systems", {}))
+            self.connection.execute(
+                "INSERT OR REPLACE INTO world (key, value) VALUES ('turn', ?)",
+                (dumps(state["turn"]),),
+            )
+            self.last = current
+
+        logger.debug("wrote %d changes to %s", changed, self.path)
+
+    def write_records(self, previous: WorldRecords, current: WorldRecords) -> int:
+        previous_header, previous_entities, previous_memory = previous
+        header, entities, memory = current
+        cursor = self.connection.cursor()
+        changed = 0
+
+        # world fields
+        for key, value in header.items():
+            if key != "rooms" and previous_header.get(key) != value:
+                cursor.execute(
+                    "INSERT OR REPLACE INTO world (key, value) VALUES (?, ?)",
+                    (key, dumps(value)),
+                )
+                changed += 1
+
+        # removed entities
+        removed = [
+            (entity_id,) for entity_id in previous_entities if entity_id not in entities
+        ]
+        for table, column in [
+            ("entities", "id"),
+            ("attributes", "entity_id"),
+            ("containment", "child_id"),
+            ("portals", "id"),
+        ]:
+            cursor.executemany(f"DELETE FROM {table} WHERE {column} = ?", removed)
+
+        changed += len(removed)
+
+        # containment, removing the old children of every changed list before adding the new ones
+        containment: List[Tuple[str | None, str, List[str]]] = []
+        if previous_header.get("rooms") != header["rooms"]:
+            containment.append((None, "rooms", header["rooms"]))
+
+        for entity_id, record in entities.items():
+            previous_children = previous_entities.get(entity_id, {})
+            for key in CHILD_KEYS[record["type"]]:
+                if previous_children.get(key) != record[key]:
+                    containment.append((entity_id, key, record[key]))
+
+        for parent_id, kind, children in containment:
+            cursor.execute(
+                "DELETE FROM containment WHERE parent_id IS ? AND kind = ?",
+                (parent_id, kind),
+            )
+
+        for parent_id, kind, children in containment:
+            cursor.executemany(
+                "INSERT OR REPLACE INTO containment (child_id, parent_id, kind, position) VALUES (?, ?, ?, ?)",
+                [
+                    (child_id, parent_id, kind, position)
+                    for position, child_id in enumerate(children)
+                ],
+            )
+
+            if kind == "portals":
+                cursor.execute("DELETE FROM portals WHERE room_id = ?", (parent_id,))
+                cursor.executemany(
+                    "INSERT OR REPLACE INTO portals (id, room_id, destination) VALUES (?, ?, ?)",
+                    [
+                        (portal_id, parent_id, entities[portal_id]["destination"])
+                        for portal_id in children
+                    ],
+                )
+
+        changed += len(containment)
+
+        # entities and attributes
+        for entity_id, record in entities.items():
+            previous_record = previous_entities.get(entity_id)
+            if previous_record == record:
+                continue
+
+            changed += 1
+            data = get_entity_data(record)
+            if previous_record is None or get_entity_data(previous_record) != data:
+                cursor.execute(
+                    "INSERT OR REPLACE INTO entities (id, type, name, data) VALUES (?, ?, ?, ?)",
+                    (entity_id, record["type"], record["name"], dumps(data)),
+                )
+
+                if record["type"] == "portal":
+                    cursor.execute(
+                        "UPDATE portals SET destination = ? WHERE id = ?",
+                        (record["destination"], entity_id),
+                    )
+
+            attributes = record.get("attributes", {})
+            previous_attributes = (
+                previous_record.get("attributes", {}) if previous_record else {}
+            )
+            cursor.executemany(
+                "INSERT OR REPLACE INTO attributes (entity_id, name, value) VALUES (?, ?, ?)",
+                [
+                    (entity_id, name, dumps(value))
+                    for name, value in attributes.items()
+                    if name not in previous_attributes
+                    or previous_attributes[name] != value
+                ],
+            )
+            cursor.executemany(
+                "DELETE FROM attributes WHERE entity_id = ? AND name = ?",
+                [
+                    (entity_id, name)
+                    for name in previous_attributes
+                    if name not in attributes
+                ],
+            )
+
+        # agent memory
+        for agent, messages in memory.items():
+            delta = diff_memory(previous_memory.get(agent, []), messages)
+            if delta is None:
+                continue
+
+            changed += 1
+            self.write_memory(agent, delta)
+
+        cursor.executemany(
+            "DELETE FROM memory WHERE agent = ?",
+            [(agent,) for agent in previous_memory if agent not in memory],
+        )
+
+        return changed
+
+    def write_memory(self, agent: str, delta: Dict[str, Any]) -> None:
+        cursor = self.connection.cursor()
+        if "replace" in delta:
+            cursor.execute("DELETE FROM memory WHERE agent = ?", (agent,))
+            messages = delta["replace"]
+            start = 0
+        else:
+            start, end = cursor.execute(
+                "SELECT MIN(position), MAX(position) FROM memory WHERE agent = ?",
+                (agent,),
+            ).fetchone()
+            if start is None:
+                start = end = -1
+
+            # positions are contiguous, so the oldest messages are the ones with the lowest positions
+            cursor.execute(
+                "DELETE FROM memory WHERE agent = ? AND position < ?",
+                (agent, start + delta["drop"]),
+            )
+            messages = delta["append"]
+            start = end + 1
+
+        cursor.executemany(
+            "INSERT INTO memory (agent, position, message) VALUES (?, ?, ?)",
+            [
+                (agent, start + offset, dumps(message))
+                for offset, message in enumerate(messages)
+            ],
+        )
+
+    # endregion
+
+    # region system data
+    def write_systems(self, systems: Dict[str, Any]) -> int:
+        if self.last_systems is None:
+            self.last_systems = {
+                name: loads(data)
+                for name, data in self.connection.execute(
+                    "SELECT name, data FROM system_data"
+                )
+            }
+
+        changed = {
+            name: data
+            for name, data in systems.items()
+            if name not in self.last_systems or self.last_systems[name] != data
+        }
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO system_data (name, data) VALUES (?, ?)",
+            [(name, dumps(data)) for name, data in changed.items()],
+        )
+        self.last_systems.update(changed)
+        return len(changed)
+
+    def has_system_data(self, name: str) -> bool:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT 1 FROM system_data WHERE name = ?", (name,)
+            ).fetchone()
+
+        return row is not None
+
+    def load_system_data(self, name: str) -> Any:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data FROM system_data WHERE name = ?", (name,)
+            ).fetchone()
+
+        if row is None:
+            raise ValueError(f"no system data for {name}")
+
+        return loads(row[0])
+
+    def save_system_data(self, name: str, data: Any) -> None:
+        data = loads(dumps(data, default=self.default))
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO system_data (name, data) VALUES (?, ?)",
+                (name, dumps(data)),
+            )
+            if self.last_systems is not None:
+                self.last_systems[name] = data
+
+    # endregion
@@ -9,6 +9,14 @@ def load_system_data(cls, file):
     return cls(**data)
 
 
+def dump_system_data(cls, model):
+    return dump_model(cls, model)
+
+
+def restore_system_data(cls, data):
+    return cls(**data)
+
+
 def save_system_data(cls, file, model):
     data = dump_model(cls, model)
     with open(file, "w") as f:
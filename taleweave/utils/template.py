@@ -1,8 +1,11 @@
+from functools import lru_cache
 from logging import getLogger
+from typing import Dict, FrozenSet, Tuple
 
-from jinja2 import Environment
+from jinja2 import Environment, Template, meta
 
 from taleweave.context import get_prompt_library
+from taleweave.models.prompt import PromptLibrary
 from taleweave.utils.string import and_list, or_list
 from taleweave.utils.world import describe_entity, name_entity
 
@@ -48,11 +51,58 @@ jinja_env.filters["the_prefix"] = the_prefix
 jinja_env.filters["punctuate"] = punctuate
 
 
+# compiled templates for each prompt key, along with the source they were compiled from
+prompt_templates: Dict[str, Tuple[str, Template]] = {}
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template_str: str) -> Template:
+    """
+    Compile a template string, keeping the most recently used templates.
+    """
+
+    return jinja_env.from_string(template_str)
+
+
+@lru_cache(maxsize=1024)
+def get_template_variables(template_str: str) -> FrozenSet[str]:
+    """
+    Get the names of the variables that a template string reads from its context.
+    """
+
+    return frozenset(meta.find_undeclared_variables(jinja_env.parse(template_str)))
+
+
+def compile_prompt(prompt_key: str, template_str: str) -> Template:
+    cached = prompt_templates.get(prompt_key)
+    if cached and cached[0] == template_str:
+        return cached[1]
+
+    template = jinja_env.from_string(template_str)
+    prompt_templates[prompt_key] = (template_str, template)
+    return template
+
+
+def compile_prompt_library(library: PromptLibrary) -> None:
+    """
+    Compile every prompt in the library, so template errors are reported when the library is loaded.
+    """
+
+    for prompt_key, template_str in library.prompts.items():
+        try:
+            compile_prompt(prompt_key, template_str)
+        except Exception as e:
+            raise ValueError(f"error compiling prompt {prompt_key}: {e}") from e
+
+    logger.info("compiled %d prompts", len(library.prompts))
+
+
 def format_prompt(prompt_key: str, **kwargs) -> str:
     try:
         library = get_prompt_library()
         template_str = library.prompts[prompt_key]
-        return format_str(template_str, **kwargs)
+        template = compile_prompt(prompt_key, template_str)
+        return template.render(**kwargs)
     except Exception as e:
         logger.exception("error formatting prompt: %s", prompt_key)
         raise e
@@ -62,7 +112,7 @@ def format_str(template_str: str, **kwargs) -> str:
     """
     Render a template string with the given keyword arguments.
 
-    Jinja will cache the template for future use.
+    The compiled template will be cached for future use.
     """
-    template = jinja_env.from_string(template_str)
+    template = compile_template(template_str)
     return template.render(**kwargs)
@@ -0,0 +1,103 @@
+from logging import getLogger
+from threading import Condition, Thread
+from typing import Any, Dict
+
+logger = getLogger(__name__)
+
+
+class CoalescingWorker:
+    """
+    Handle work on a background thread, keeping only the latest pending item for each key. When the worker falls
+    behind, older items are skipped rather than queued.
+
+    Subclasses implement `handle`, which is called on the worker thread.
+    """
+
+    condition: Condition
+    handled: int
+    name: str
+    pending: Dict[str, Any]
+    running: bool
+    skipped: int
+    thread: Thread | None
+    working: bool
+
+    def __init__(self, name: str):
+        self.condition = Condition()
+        self.handled = 0
+        self.name = name
+        self.pending = {}
+        self.running = False
+        self.skipped = 0
+        self.thread = None
+        self.working = False
+
+    def handle(self, key: str, item: Any) -> None:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def start(self) -> None:
+        self.running = True
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def submit(self, key: str, item: Any) -> None:
+        with self.condition:
+            if key in self.pending:
+                logger.debug(
+                    "%s worker is behind, skipping item for %s", self.name, key
+                )
+                self.skipped += 1
+
+            self.pending[key] = item
+            self.condition.notify_all()
+
+    def flush(self) -> None:
+        """
+        Wait until every pending item has been handled.
+        """
+
+        with self.condition:
+            self.condition.wait_for(
+                lambda: not (self.pending or self.working) or not self.running
+            )
+
+    def stop(self) -> None:
+        """
+        Handle any pending items and stop the worker thread.
+        """
+
+        self.flush()
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+        logger.info(
+            "%s worker handled %d items and skipped %d",
+            self.name,
+            self.handled,
+            self.skipped,
+        )
+
+    def run(self) -> None:
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending or not self.running)
+                if not self.pending:
+                    return
+
+                key, item = self.pending.popitem()
+                self.working = True
+
+            try:
+                self.handle(key, item)
+                self.handled += 1
+            except Exception:
+                logger.exception("error in %s worker for %s", self.name, key)
+            finally:
+                with self.condition:
+                    self.working = False
+                    self.condition.notify_all()
@@ -1,9 +1,11 @@
 from logging import getLogger
-from typing import List
+from typing import Dict, Hashable, List, Tuple
 
 from taleweave.context import get_game_systems
-from taleweave.game_system import FormatPerspective
+from taleweave.game_system import FormatPerspective, GameSystem
 from taleweave.models.entity import Character, WorldEntity
+from taleweave.utils.changes import get_change_tracker
+from taleweave.utils.effect import get_effective_attributes
 
 logger = getLogger(__name__)
 
@@ -52,14 +54,85 @@ def describe_entity(
     return describe_static(entity)
 
 
+def get_description_key(entity: WorldEntity) -> Hashable:
+    """
+    Get a value that changes whenever the name or effective attributes of an entity change. When change tracking is
+    enabled, the version of the entity is used instead of its attributes.
+    """
+
+    tracker = get_change_tracker()
+    if tracker:
+        return (entity.name, tracker.version(entity))
+
+    return (entity.name, frozenset(get_effective_attributes(entity).items()))
+
+
+class DescriptionCache:
+    """
+    The attribute descriptions from each game system that allows its format callback to be cached, for each entity
+    and perspective, along with the description key they were formatted from.
+    """
+
+    entries: Dict[Tuple[str, str, FormatPerspective], Tuple[Hashable, List[str]]]
+    hits: int
+    misses: int
+    systems: List[GameSystem]
+
+    def __init__(self, systems: List[GameSystem]):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.systems = systems
+
+    def format(
+        self,
+        system: GameSystem,
+        entity: WorldEntity,
+        perspective: FormatPerspective,
+    ) -> List[str]:
+        if not system.format:
+            return []
+
+        key = (system.name, entity.id, perspective)
+        description_key = get_description_key(entity)
+        cached = self.entries.get(key)
+        if cached and cached[0] == description_key:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        descriptions = system.format(entity, perspective=perspective)
+        self.entries[key] = (description_key, descriptions)
+        return descriptions
+
+
+description_cache: DescriptionCache | None = None
+
+
+def get_description_cache() -> DescriptionCache:
+    """
+    Get the description cache for the current game systems, starting a new one when the systems have changed.
+    """
+
+    global description_cache
+
+    systems = get_game_systems()
+    if description_cache is None or description_cache.systems is not systems:
+        description_cache = DescriptionCache(systems)
+
+    return description_cache
+
+
 def format_attributes(
     entity: WorldEntity,
     perspective: FormatPerspective = FormatPerspective.SECOND_PERSON,
 ) -> List[str]:
-    systems = get_game_systems()
+    cache = get_description_cache()
     attribute_descriptions = []
-    for system in systems:
-        if system.format:
+    for system in cache.systems:
+        if system.format_cache:
+            attribute_descriptions.extend(cache.format(system, entity, perspective))
+        elif system.format:
             attribute_descriptions.extend(
                 system.format(entity, perspective=perspective)
             )
@@ -0,0 +1,247 @@
+from copy import deepcopy
+from json import dumps, loads
+from time import sleep
+from typing import Dict, List
+from unittest import TestCase
+from unittest.mock import patch
+
+from taleweave import context
+from taleweave.context import (
+    CharacterAgentRegistry,
+    get_current_character,
+    get_current_room,
+    set_character_agent,
+    set_current_world,
+    set_game_config,
+    set_prompt_library,
+)
+from taleweave.models.config import DEFAULT_CONFIG
+from taleweave.models.entity import Character, Item, Room, World
+from taleweave.models.event import ActionEvent, ResultEvent
+from taleweave.models.prompt import PromptLibrary
+from taleweave.systems.core import action
+from taleweave.systems.core.action import (
+    find_action_conflicts,
+    get_visible_names,
+    simulate_action_concurrent,
+)
+from taleweave.utils.search import find_item_in_room
+
+
+class TestActionConflicts(TestCase):
+    def test_visible_names(self):
+        character = Character(
+            name="Test Character",
+            backstory="A test character.",
+            description="A test character.",
+            items=[Item(name="Lantern", description="A lantern.")],
+        )
+        room = Room(
+            name="Test Room",
+            description="A test room.",
+            characters=[character],
+            items=[Item(name="Sword", description="A sword.")],
+        )
+
+        self.assertEqual(
+            get_visible_names(room, character), {"test character", "sword", "lantern"}
+        )
+
+    def test_missing_target(self):
+        call = dumps({"function": "action_take", "parameters": {"item": "Sword"}})
+        self.assertEqual(find_action_conflicts(call, {"sword"}, set()), ["Sword"])
+        self.assertEqual(find_action_conflicts(call, {"sword"}, {"sword"}), [])
+
+    def test_missing_parameters(self):
+        call = dumps({"function": "action_look"})
+        self.assertEqual(find_action_conflicts(call, {"sword"}, set()), [])
+
+    def test_invalid_parameters(self):
+        for parameters in [None, ["Sword"], "Sword"]:
+            call = dumps({"function": "action_take", "parameters": parameters})
+            self.assertEqual(find_action_conflicts(call, {"sword"}, set()), [])
+
+
+class StubAgent:
+    """
+    An agent that replies with a queue of canned actions, optionally waiting before each reply.
+    """
+
+    def __init__(self, name: str, replies: List[Dict], delay: float = 0.0) -> None:
+        self.name = name
+        self.replies = replies
+        self.delay = delay
+        self.memory: List[str] = []
+        self.prompts: List[str] = []
+
+    def __call__(self, prompt: str) -> str:
+        sleep(self.delay)
+        self.prompts.append(prompt)
+        return dumps(self.replies.pop(0))
+
+
+class StubToolbox:
+    def __init__(self, tools):
+        self.tools = {tool.__name__: tool for tool in tools}
+
+    def list_tools(self) -> List[str]:
+        return list(self.tools.keys())
+
+
+def action_take(item: str) -> str:
+    room = get_current_room()
+    character = get_current_character()
+    if not room or not character:
+        raise ValueError("no action context")
+
+    found = find_item_in_room(room, item)
+    if not found:
+        return f"There is no {item} here."
+
+    room.items.remove(found)
+    character.items.append(found)
+    return f"{character.name} takes the {found.name}."
+
+
+def action_wait() -> str:
+    character = get_current_character()
+    if not character:
+        raise ValueError("no action context")
+
+    return f"{character.name} waits."
+
+
+def stub_loop_retry(agent, prompt, result_parser, toolbox):
+    return result_parser(agent(prompt), agent=agent, toolbox=toolbox)
+
+
+def stub_function_result(value, agent, toolbox, **kwargs):
+    call = loads(value)
+    return toolbox.tools[call["function"]](**call.get("parameters", {}))
+
+
+TEST_PROMPTS = PromptLibrary(
+    prompts={
+        "world_simulate_character_action": "You see: {{ visible_items | join(', ') }}",
+        "world_simulate_character_action_error_conflict": "Conflict: {{ targets | join(', ') }}",
+        "world_simulate_character_planning_notes_none": "",
+        "world_simulate_character_planning_events_none": "",
+    }
+)
+
+
+class TestSimulateActionConcurrent(TestCase):
+    def setUp(self):
+        self.events = []
+        self.sword = Item(name="Sword", description="A sword.")
+        self.first = Character(
+            name="First Character", backstory="", description="The first character."
+        )
+        self.second = Character(
+            name="Second Character", backstory="", description="The second character."
+        )
+        self.room = Room(
+            name="Test Room",
+            description="A test room.",
+            characters=[self.first, self.second],
+            items=[self.sword],
+        )
+        self.world = World(
+            name="Test World",
+            rooms=[self.room],
+            theme="testing",
+            order=[self.first.name, self.second.name],
+        )
+
+        self.config = deepcopy(DEFAULT_CONFIG)
+        set_current_world(self.world)
+        set_game_config(self.config)
+        set_prompt_library(TEST_PROMPTS)
+
+        self.patches = [
+            patch.object(context, "character_agents", CharacterAgentRegistry()),
+            patch.object(
+                action, "action_tools", StubToolbox([action_take, action_wait])
+            ),
+            patch.object(action, "broadcast", self.events.append),
+            patch.object(action, "loop_retry", stub_loop_retry),
+            patch.object(action, "function_result", stub_function_result),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+
+        set_current_world(None)
+        set_game_config(DEFAULT_CONFIG)
+        set_prompt_library(PromptLibrary(prompts={}))
+
+    def add_agents(self, first_replies, second_replies):
+        # the first character replies last, so the replies arrive out of turn order
+        first_agent = StubAgent(self.first.name, first_replies, delay=0.05)
+        second_agent = StubAgent(self.second.name, second_replies)
+        set_character_agent(self.first.name, self.first, first_agent)
+        set_character_agent(self.second.name, self.second, second_agent)
+        return first_agent, second_agent
+
+    def results(self) -> List[str]:
+        return [event.result for event in self.events if isinstance(event, ResultEvent)]
+
+    def test_apply_in_turn_order(self):
+        take = {"function": "action_take", "parameters": {"item": "Sword"}}
+        wait = {"function": "action_wait", "parameters": {}}
+        self.add_agents([take], [wait])
+
+        simulate_action_concurrent(self.world, 1, workers=2)
+
+        self.assertEqual(
+            self.results(),
+            ["First Character takes the Sword.", "Second Character waits."],
+        )
+        self.assertEqual(
+            [event.character.name for event in self.events],
+            [
+                "First Character",
+                "First Character",
+                "Second Character",
+                "Second Character",
+            ],
+        )
+        self.assertIsInstance(self.events[0], ActionEvent)
+        self.assertEqual(self.first.items, [self.sword])
+        self.assertEqual(self.room.items, [])
+
+    def test_retry_conflict(self):
+        take = {"function": "action_take", "parameters": {"item": "Sword"}}
+        wait = {"function": "action_wait", "parameters": {}}
+        first_agent, second_agent = self.add_agents([take], [take, wait])
+
+        simulate_action_concurrent(self.world, 1, workers=2)
+
+        self.assertEqual(
+            self.results(),
+            ["First Character takes the Sword.", "Second Character waits."],
+        )
+        self.assertEqual(self.first.items, [self.sword])
+        self.assertEqual(self.second.items, [])
+
+        # both characters were prompted with the frozen view, then the retry saw the current room
+        self.assertEqual(first_agent.prompts, ["You see: Sword"])
+        self.assertEqual(second_agent.prompts, ["You see: Sword", "You see: "])
+        self.assertEqual(second_agent.replies, [])
+
+    def test_reject_conflict(self):
+        self.config.world.turn.action_conflicts = "reject"
+        take = {"function": "action_take", "parameters": {"item": "Sword"}}
+        first_agent, second_agent = self.add_agents([take], [take])
+
+        simulate_action_concurrent(self.world, 1, workers=2)
+
+        self.assertEqual(
+            self.results(), ["First Character takes the Sword.", "Conflict: Sword"]
+        )
+        self.assertEqual(self.first.items, [self.sword])
+        self.assertEqual(self.second.items, [])
+        self.assertEqual(len(second_agent.prompts), 1)
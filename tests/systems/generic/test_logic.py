@@ -0,0 +1,176 @@
+from random import seed
+from unittest import TestCase
+
+from taleweave.models.entity import Character, Item, Room
+from taleweave.systems.generic.logic import (
+    CompiledLogicTable,
+    LogicRule,
+    LogicSchedule,
+    LogicTable,
+    parse_presence,
+    update_attributes,
+)
+from taleweave.systems.generic.profiler import (
+    LogicProfiler,
+    format_summary,
+    set_logic_profiler,
+)
+from taleweave.utils.changes import set_entity_attribute
+
+
+class TestLogicProfiler(TestCase):
+    def setUp(self):
+        self.profiler = LogicProfiler()
+        set_logic_profiler(self.profiler)
+
+    def tearDown(self):
+        set_logic_profiler(None)
+
+    def test_update_attributes(self):
+        table = CompiledLogicTable(
+            LogicTable(
+                rules=[
+                    LogicRule(
+                        group="mood",
+                        match={"type": "character", "mood": "sad"},
+                        set={"mood": "happy"},
+                    ),
+                    LogicRule(group="mood", match={"type": "character"}),
+                    LogicRule(match={"type": "portal"}, set={"open": True}),
+                    LogicRule(match={"hunger": "full"}, chance=0.0),
+                    LogicRule(
+                        match={"type": "character"},
+                        rule='"thirst" not in attributes',
+                        set={"thirst": "hydrated"},
+                    ),
+                ]
+            ),
+            "test.yaml",
+        )
+
+        # every rule has a row as soon as the table is compiled
+        self.assertEqual(len(self.profiler.report()), 5)
+
+        character = Character(
+            name="Test Character",
+            backstory="A test character.",
+            description="A test character.",
+            attributes={"mood": "sad", "hunger": "full"},
+        )
+        room = Room(name="Test Room", description="A test room.")
+        item = Item(name="Test Item", description="A test item.")
+        for entity in [character, room, item]:
+            update_attributes(entity, table, {})
+
+        self.assertEqual(character.attributes["mood"], "happy")
+        self.assertEqual(character.attributes["thirst"], "hydrated")
+
+        rows = {row["index"]: row for row in self.profiler.report()}
+        counts = {
+            index: (row["evaluated"], row["matched"], row["fired"], row["skipped"])
+            for index, row in rows.items()
+        }
+        self.assertEqual(
+            counts,
+            {
+                0: (1, 1, 1, 0),
+                1: (0, 0, 0, 1),
+                2: (0, 0, 0, 0),
+                3: (1, 1, 0, 0),
+                4: (1, 1, 1, 0),
+            },
+        )
+
+        summary = "\n".join(format_summary(self.profiler.report()))
+        self.assertIn("rules never offered to any entity: 1", summary)
+        self.assertIn("rules that never matched: 0", summary)
+        self.assertIn('test.yaml rule 2: {"type": "portal"}', summary)
+        self.assertIn("rules that never fired: 1", summary)
+        self.assertIn("rules always skipped by their group: 1", summary)
+
+
+class TestParsePresence(TestCase):
+    def test_presence_only(self):
+        self.assertEqual(
+            parse_presence('"hunger" not in attributes\n'), ([("hunger", False)], True)
+        )
+        self.assertEqual(
+            parse_presence('"a" in attributes and "b" not in attributes'),
+            ([("a", True), ("b", False)], True),
+        )
+
+    def test_presence_prefix(self):
+        self.assertEqual(
+            parse_presence('"health" in attributes and attributes&.health <= 0'),
+            ([("health", True)], False),
+        )
+
+    def test_other_expressions(self):
+        self.assertEqual(
+            parse_presence('"time" not in attributes or attributes&.time == "day"'),
+            ([], False),
+        )
+        self.assertEqual(parse_presence("attributes&.health <= 0"), ([], False))
+
+
+class TestLogicSchedule(TestCase):
+    def test_settled_version(self):
+        schedule = LogicSchedule()
+        item = Item(name="Test Item", description="A test item.")
+
+        schedule.settle(item, True)
+        self.assertTrue(schedule.is_settled(item))
+
+        set_entity_attribute(item, "color", "red")
+        self.assertFalse(schedule.is_settled(item))
+
+    def test_chance_frequency(self):
+        table = CompiledLogicTable(
+            LogicTable(
+                rules=[
+                    LogicRule(
+                        match={"phase": "on"},
+                        chance=0.25,
+                        trigger=["count"],
+                    ),
+                ]
+            ),
+            "test.yaml",
+        )
+        item = Item(name="Test Item", description="A test item.")
+
+        fired = []
+        triggers = {"count": lambda entity: fired.append(entity.id)}
+
+        def run_passes(schedule):
+            fired.clear()
+            reached = 0
+            for step in range(8000):
+                # the rule is only reached on every other pass
+                phase = "on" if step % 2 == 0 else "off"
+                set_entity_attribute(item, "phase", phase)
+                reached += phase == "on"
+
+                if schedule:
+                    schedule.advance()
+
+                update_attributes(item, table, triggers, schedule=schedule)
+
+            return len(fired) / reached
+
+        seed(7)
+        rolled = run_passes(None)
+
+        profiler = LogicProfiler()
+        set_logic_profiler(profiler)
+        try:
+            scheduled = run_passes(LogicSchedule())
+        finally:
+            set_logic_profiler(None)
+
+        # 4000 reached passes with a 0.25 chance have a standard deviation of about 0.007
+        self.assertAlmostEqual(rolled, 0.25, delta=0.03)
+        self.assertAlmostEqual(scheduled, 0.25, delta=0.03)
+
+        # the rule would be matched on all 8000 passes, but is skipped while it is waiting for a later pass
+        self.assertLess(profiler.report()[0]["evaluated"], 6000)
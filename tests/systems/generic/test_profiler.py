@@ -0,0 +1,58 @@
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from taleweave.systems.generic.profiler import (
+    format_summary,
+    load_report,
+    save_report,
+)
+
+
+def make_row(index: int, **kwargs):
+    row = {
+        "table": "test.yaml",
+        "kind": "rule",
+        "index": index,
+        "group": "",
+        "match": "",
+        "rule": "",
+        "evaluated": 10,
+        "skipped": 0,
+        "matched": 5,
+        "fired": 5,
+        "rule_time": 0.0,
+    }
+    row.update(kwargs)
+    return row
+
+
+class TestLogicProfiler(TestCase):
+    def test_report_round_trip(self):
+        rows = [make_row(0, rule_time=0.5), make_row(1, group="test")]
+
+        with TemporaryDirectory() as temp:
+            for extension in [".csv", ".json"]:
+                filename = path.join(temp, f"report{extension}")
+                save_report(filename, rows)
+                self.assertEqual(load_report(filename), rows)
+
+    def test_summary(self):
+        rows = [
+            make_row(0, rule='"hunger" not in attributes', rule_time=0.5),
+            make_row(1, match='{"mood": "happy"}', fired=0),
+            make_row(2, group="mood", evaluated=0, matched=0, fired=0, skipped=10),
+            make_row(3, match='{"type": "portal"}', evaluated=0, matched=0, fired=0),
+            make_row(4, match='{"mood": "sad"}', matched=0, fired=0),
+        ]
+        summary = "\n".join(format_summary(rows))
+
+        self.assertIn('test.yaml rule 0: "hunger" not in attributes', summary)
+        self.assertIn("rules never offered to any entity: 1", summary)
+        self.assertIn('  test.yaml rule 3: {"type": "portal"}', summary)
+        self.assertIn("rules that never matched: 1", summary)
+        self.assertIn('evaluated 10 - test.yaml rule 4: {"mood": "sad"}', summary)
+        self.assertIn("rules that never fired: 1", summary)
+        self.assertIn('test.yaml rule 1: {"mood": "happy"}', summary)
+        self.assertIn("rules always skipped by their group: 1", summary)
+        self.assertIn("group mood - test.yaml rule 2", summary)
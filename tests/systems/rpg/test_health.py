@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from taleweave.context import set_current_world
+from taleweave.models.entity import Character, Room, World
+from taleweave.systems.rpg.health.triggers import character_bleeding
+from taleweave.utils.changes import get_entity_version
+
+
+class TestCharacterBleeding(TestCase):
+    def setUp(self):
+        self.character = Character(
+            name="Test Character",
+            backstory="A test character.",
+            description="A test character.",
+        )
+        self.room = Room(
+            name="Test Room", description="A test room.", characters=[self.character]
+        )
+        set_current_world(
+            World(name="Test World", rooms=[self.room], theme="test", order=[])
+        )
+
+    def tearDown(self):
+        set_current_world(None)
+
+    def test_bleeding(self):
+        self.character.attributes = {"health": 10, "bleeding": 2}
+        character_bleeding(self.character)
+        self.assertEqual(get_entity_version(self.character), 1)
+        self.assertEqual(self.room.attributes["bloody"], True)
+
+    def test_not_bleeding(self):
+        self.character.attributes = {"health": 0, "bleeding": 0}
+        character_bleeding(self.character)
+        self.assertEqual(get_entity_version(self.character), 0)
@@ -0,0 +1,86 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from taleweave.models.entity import Character, Room, World
+from taleweave.systems.generic import logic
+from taleweave.systems.rpg.quest.system import (
+    get_quest_matcher,
+    is_quest_complete,
+    quest_matchers,
+    restore_quest_data,
+    set_active_quest,
+)
+
+
+def make_quest_data(rule: str):
+    quest = {
+        "name": "Test Quest",
+        "description": "A test quest.",
+        "giver": {"character": "Test Character"},
+        "goal": {
+            "target": {"character": "Test Character"},
+            "rule": rule,
+            "type": "attributes",
+        },
+        "reward": {},
+    }
+    return {
+        "active": {"Test Character": quest},
+        "available": {},
+        "completed": {},
+    }
+
+
+class TestQuestMatchers(TestCase):
+    def setUp(self):
+        self.character = Character(
+            name="Test Character",
+            backstory="A test character.",
+            description="A test character.",
+        )
+        self.world = World(
+            name="Test World",
+            rooms=[
+                Room(
+                    name="Test Room",
+                    description="A test room.",
+                    characters=[self.character],
+                )
+            ],
+            theme="test",
+            order=[],
+        )
+
+    def tearDown(self):
+        quest_matchers.clear()
+
+    def test_compile_on_restore(self):
+        quests = restore_quest_data(make_quest_data("attributes.gold > 10"))
+        quest = quests.active["Test Character"]
+
+        self.assertIn(quest.id, quest_matchers)
+        self.assertIs(quest_matchers[quest.id].source, quest.goal)
+
+        self.character.attributes["gold"] = 5
+        with patch.object(logic.LogicMatcher, "__init__", autospec=True) as compile:
+            self.assertFalse(is_quest_complete(self.world, quest))
+            self.character.attributes["gold"] = 20
+            self.assertTrue(is_quest_complete(self.world, quest))
+
+        compile.assert_not_called()
+
+    def test_malformed_rule(self):
+        with self.assertRaises(ValueError) as context:
+            restore_quest_data(make_quest_data("attributes.gold >"))
+
+        self.assertIn("Test Quest", str(context.exception))
+
+    def test_quest_added_later(self):
+        quests = restore_quest_data(make_quest_data("attributes.gold > 10"))
+        other = restore_quest_data(make_quest_data("attributes.gold > 5"))
+        quest = other.active["Test Character"]
+        set_active_quest(quests, self.character, quest)
+
+        matcher = get_quest_matcher(quest)
+        self.assertIs(matcher.source, quest.goal)
+        self.assertIs(get_quest_matcher(quest), matcher)
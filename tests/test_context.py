@@ -0,0 +1,77 @@
+from unittest import TestCase
+
+from taleweave.context import CharacterAgentRegistry
+from taleweave.models.entity import Character
+from taleweave.player import RemotePlayer
+
+
+class StubAgent:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+def make_character(name: str) -> Character:
+    return Character(name=name, backstory="A test character.", description="")
+
+
+class TestCharacterAgentRegistry(TestCase):
+    def test_lookups(self):
+        registry = CharacterAgentRegistry()
+        character = make_character("Test Character")
+        agent = StubAgent(character.name)
+        registry.set(character.name, character, agent)
+
+        entry = (character, agent)
+        self.assertEqual(registry.get_by_name("Test Character"), entry)
+        self.assertEqual(registry.get_by_name("test character"), entry)
+        self.assertEqual(registry.get_by_character(character), entry)
+        self.assertEqual(registry.get_by_agent(agent), entry)
+        self.assertEqual(registry.values(), [entry])
+
+    def test_missing_lookups(self):
+        registry = CharacterAgentRegistry()
+        character = make_character("Test Character")
+        registry.set(character.name, character, StubAgent(character.name))
+
+        self.assertIsNone(registry.get_by_name("Other Character"))
+        self.assertIsNone(registry.get_by_character(make_character("Test Character")))
+        self.assertIsNone(registry.get_by_agent(StubAgent(character.name)))
+
+    def test_swap_player_and_back(self):
+        registry = CharacterAgentRegistry()
+        character = make_character("Test Character")
+        other = make_character("Other Character")
+        agent = StubAgent(character.name)
+        other_agent = StubAgent(other.name)
+        registry.set(character.name, character, agent)
+        registry.set(other.name, other, other_agent)
+
+        player = RemotePlayer(
+            character.name,
+            character.backstory,
+            lambda event: True,
+            fallback_agent=agent,
+        )
+        registry.set(character.name, character, player)
+
+        self.assertIsNone(registry.get_by_agent(agent))
+        self.assertEqual(registry.get_by_agent(player), (character, player))
+        self.assertEqual(registry.get_by_character(character), (character, player))
+        self.assertEqual(registry.get_by_name(character.name), (character, player))
+        self.assertEqual(registry.get_by_name(other.name), (other, other_agent))
+        self.assertEqual(len(registry.values()), 2)
+
+        registry.set(player.name, character, player.fallback_agent)
+
+        self.assertIsNone(registry.get_by_agent(player))
+        self.assertEqual(registry.get_by_agent(agent), (character, agent))
+        self.assertEqual(registry.get_by_character(character), (character, agent))
+        self.assertEqual(registry.get_by_name(character.name), (character, agent))
+        self.assertEqual(registry.get_by_agent(other_agent), (other, other_agent))
+        self.assertEqual(len(registry.agent_index), 2)
+        self.assertEqual(len(registry.id_index), 2)
+        self.assertEqual(len(registry.name_index), 2)
+        self.assertEqual(
+            sorted(registry.values(), key=lambda entry: entry[0].name),
+            [(other, other_agent), (character, agent)],
+        )
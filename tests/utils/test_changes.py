@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from taleweave.models.entity import Item
+from taleweave.utils.changes import (
+    ChangeTracker,
+    get_entity_version,
+    mark_changed,
+    remove_entity_attributes,
+    set_change_tracker,
+    set_entity_attribute,
+    set_entity_attributes,
+)
+from taleweave.utils.index import move_character
+
+from .test_index import make_test_world
+
+
+class TestChangeTracker(TestCase):
+    def setUp(self):
+        self.tracker = ChangeTracker()
+        set_change_tracker(self.tracker)
+
+    def tearDown(self):
+        set_change_tracker(None)
+
+    def test_attribute_versions(self):
+        item = Item(name="Test Item", description="A test item.")
+        set_entity_attribute(item, "color", "red")
+        set_entity_attribute(item, "color", "red")
+        self.assertEqual(self.tracker.version(item), 1)
+
+        set_entity_attributes(item, {"color": "blue", "size": 2})
+        remove_entity_attributes(item, ["missing"])
+        self.assertEqual(self.tracker.version(item), 2)
+
+        remove_entity_attributes(item, ["size"])
+        self.assertEqual(self.tracker.version(item), 3)
+        self.assertEqual(item.attributes, {"color": "blue"})
+
+
+class TestEntityVersion(TestCase):
+    def test_without_tracker(self):
+        item = Item(name="Test Item", description="A test item.")
+        self.assertEqual(get_entity_version(item), 0)
+
+        set_entity_attribute(item, "color", "red")
+        mark_changed(item)
+        self.assertEqual(get_entity_version(item), 2)
+
+    def test_index_helpers(self):
+        world = make_test_world()
+        first_room, second_room = world.rooms
+        character = first_room.characters[0]
+
+        move_character(world, first_room, second_room, character)
+        for entity in [first_room, second_room, character]:
+            self.assertEqual(get_entity_version(entity), 1)
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+import numpy as np
+
+from taleweave.models.entity import Character, Item, Room
+from taleweave.utils.columns import MISSING, AttributeColumns
+
+
+def make_test_entities():
+    return [
+        Room(name="Room", description="A test room.", attributes={"wet": True}),
+        Character(
+            name="Character",
+            backstory="A test character.",
+            description="A test character.",
+            attributes={"hunger": "full", "health": 1},
+        ),
+        Item(
+            name="Item",
+            description="A test item.",
+            attributes={"edible": True, "cooked": False},
+        ),
+    ]
+
+
+class TestAttributeColumns(TestCase):
+    def test_match_type_and_attributes(self):
+        columns = AttributeColumns(make_test_entities())
+
+        self.assertEqual(
+            columns.match_mask([("type", "item"), ("edible", True)]).tolist(),
+            [False, False, True],
+        )
+        self.assertEqual(
+            columns.match_mask([("type", "character"), ("edible", True)]).tolist(),
+            [False, False, False],
+        )
+
+    def test_match_equal_values(self):
+        columns = AttributeColumns(make_test_entities())
+
+        # attribute dicts compare True and 1 as equal, so the columns should too
+        self.assertEqual(
+            columns.match_mask([("health", True)]).tolist(), [False, True, False]
+        )
+
+    def test_match_unknown_value(self):
+        columns = AttributeColumns(make_test_entities())
+
+        self.assertFalse(columns.match_mask([("hunger", "starving")]).any())
+        self.assertFalse(columns.match_mask([("mood", "happy")]).any())
+
+    def test_presence_mask(self):
+        columns = AttributeColumns(make_test_entities())
+
+        self.assertEqual(
+            columns.presence_mask([("hunger", False)]).tolist(), [True, False, True]
+        )
+        self.assertEqual(
+            columns.presence_mask([("type", True), ("edible", True)]).tolist(),
+            [False, False, True],
+        )
+        self.assertEqual(
+            columns.presence_mask([("unknown", True)]).tolist(), [False, False, False]
+        )
+
+    def test_set_and_remove_rows(self):
+        columns = AttributeColumns(make_test_entities())
+        rows = np.array([1, 2])
+
+        columns.set_rows(rows, {"mood": "happy"})
+        columns.remove_rows(rows, ["hunger"])
+
+        self.assertEqual(
+            columns.match_mask([("mood", "happy")]).tolist(), [False, True, True]
+        )
+        self.assertEqual(columns.column("hunger").tolist(), [MISSING] * 3)
+
+    def test_sync_row(self):
+        entities = make_test_entities()
+        columns = AttributeColumns(entities)
+
+        entities[2].attributes.pop("edible")
+        entities[2].attributes["spoiled"] = True
+        columns.sync_row(2)
+
+        self.assertFalse(columns.match_mask([("edible", True)]).any())
+        self.assertEqual(
+            columns.match_mask([("spoiled", True)]).tolist(), [False, False, True]
+        )
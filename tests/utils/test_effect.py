@@ -0,0 +1,157 @@
+from unittest import TestCase
+
+from taleweave.models.effect import (
+    EffectPattern,
+    EffectResult,
+    IntEffectPattern,
+    IntEffectResult,
+)
+from taleweave.models.entity import Character, Item, Room, World
+from taleweave.utils.changes import (
+    ChangeTracker,
+    set_change_tracker,
+    set_entity_attribute,
+)
+from taleweave.utils.effect import (
+    apply_effects,
+    expire_world_effects,
+    get_effect_schedule,
+    get_effective_attributes,
+    update_effect_durations,
+)
+
+
+def make_test_world():
+    character = Character(
+        name="Test Character",
+        backstory="A test character.",
+        description="A test character.",
+    )
+    item = Item(name="Test Item", description="A test item.")
+    room = Room(
+        name="Test Room",
+        description="A test room.",
+        characters=[character],
+        items=[item],
+    )
+    world = World(
+        name="Test World",
+        order=[character.name],
+        rooms=[room],
+        theme="testing",
+    )
+    return world, room, character, item
+
+
+def make_effect(name: str, duration: int | None) -> EffectResult:
+    return EffectResult(name=name, description=name, duration=duration)
+
+
+class TestEffectSchedule(TestCase):
+    def test_expire_saved_durations(self):
+        world, room, character, item = make_test_world()
+        character.active_effects.append(make_effect("short", 1))
+        item.active_effects.append(make_effect("long", 3))
+        room.active_effects.append(make_effect("forever", None))
+
+        expire_world_effects(world, 10)
+        self.assertEqual(character.active_effects, [])
+        self.assertEqual(len(item.active_effects), 1)
+
+        expire_world_effects(world, 11)
+        self.assertEqual(len(item.active_effects), 1)
+
+        expire_world_effects(world, 12)
+        self.assertEqual(item.active_effects, [])
+        self.assertEqual(len(room.active_effects), 1)
+
+    def test_apply_temporary_effect(self):
+        world, _room, character, _item = make_test_world()
+        expire_world_effects(world, 5)
+
+        effect = EffectPattern(
+            name="haste",
+            description="haste",
+            application="temporary",
+            duration=2,
+        )
+        apply_effects(world, character, [effect])
+        self.assertEqual(character.active_effects[0].expires, 7)
+
+        expire_world_effects(world, 6)
+        self.assertEqual(len(character.active_effects), 1)
+
+        expire_world_effects(world, 7)
+        self.assertEqual(character.active_effects, [])
+
+    def test_update_durations(self):
+        world, _room, character, _item = make_test_world()
+        effect = make_effect("slow", 4)
+        character.active_effects.append(effect)
+
+        get_effect_schedule(world, 1)
+        update_effect_durations(world, 2)
+        self.assertEqual(effect.expires, 4)
+        self.assertEqual(effect.duration, 3)
+
+
+class TestEffectiveAttributes(TestCase):
+    def tearDown(self):
+        set_change_tracker(None)
+
+    def make_strong_character(self):
+        _world, _room, character, _item = make_test_world()
+        character.attributes["strength"] = 5
+        character.active_effects.append(
+            EffectResult(
+                name="strong",
+                description="strong",
+                attributes=[IntEffectResult(name="strength", offset=2)],
+            )
+        )
+        return character
+
+    def test_base_attributes_change(self):
+        character = self.make_strong_character()
+        self.assertEqual(get_effective_attributes(character)["strength"], 7)
+
+        # without change tracking, direct changes are seen
+        character.attributes["strength"] = 1
+        self.assertEqual(get_effective_attributes(character)["strength"], 3)
+
+    def test_tracked_changes(self):
+        set_change_tracker(ChangeTracker())
+        character = self.make_strong_character()
+
+        effective = get_effective_attributes(character)
+        self.assertEqual(effective["strength"], 7)
+        self.assertIs(get_effective_attributes(character), effective)
+
+        set_entity_attribute(character, "strength", 1)
+        self.assertEqual(get_effective_attributes(character)["strength"], 3)
+
+    def test_apply_and_expire(self):
+        for tracker in [None, ChangeTracker()]:
+            with self.subTest(tracker=tracker):
+                set_change_tracker(tracker)
+                world, _room, character, _item = make_test_world()
+                character.attributes["strength"] = 5
+                expire_world_effects(world, 1)
+                self.assertIs(get_effective_attributes(character), character.attributes)
+
+                effect = EffectPattern(
+                    name="strong",
+                    description="strong",
+                    application="temporary",
+                    attributes=[IntEffectPattern(name="strength", multiply=2.0)],
+                    duration=1,
+                )
+                apply_effects(world, character, [effect])
+                self.assertEqual(get_effective_attributes(character)["strength"], 10)
+
+                apply_effects(world, character, [effect])
+                self.assertEqual(get_effective_attributes(character)["strength"], 20)
+                self.assertEqual(character.attributes["strength"], 5)
+
+                expire_world_effects(world, 2)
+                self.assertEqual(get_effective_attributes(character)["strength"], 5)
@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from taleweave.models.event import StatusEvent
+from taleweave.utils.event import EventLog
+
+
+def append_events(log: EventLog, *events):
+    for event in events:
+        if isinstance(event, tuple):
+            text, keys = event
+            log.append(StatusEvent(text=text), keys)
+        else:
+            log.append(StatusEvent(text=event))
+
+
+def read_text(log: EventLog, name: str, keys=None):
+    missed, events = log.read(name, keys)
+    return missed, [event.text for event in events]
+
+
+class TestEventLog(TestCase):
+    def test_read_since_cursor(self):
+        log = EventLog(4)
+        log.add_reader("alice")
+        append_events(log, "first")
+        log.reset_reader("alice")
+        log.add_reader("bob")
+        append_events(log, "second")
+
+        self.assertEqual(read_text(log, "alice"), (0, ["second"]))
+        self.assertEqual(read_text(log, "bob"), (0, ["second"]))
+
+    def test_missed_events(self):
+        log = EventLog(3)
+        log.add_reader("alice")
+        append_events(log, "a", "b", "c", "d", "e")
+
+        self.assertEqual(read_text(log, "alice"), (2, ["c", "d", "e"]))
+        self.assertEqual(read_text(log, "unknown"), (0, []))
+
+    def test_read_keys(self):
+        log = EventLog(3)
+        log.add_reader("alice")
+        append_events(
+            log,
+            ("a", ["kitchen", "bob"]),
+            ("b", ["hall", "carol"]),
+            ("c", ["kitchen", "alice"]),
+            ("d", ["hall", "bob"]),
+        )
+
+        self.assertEqual(read_text(log, "alice", ["kitchen", "alice"]), (1, ["c"]))
+        self.assertEqual(read_text(log, "alice", ["hall", "bob"]), (1, ["b", "d"]))
+        self.assertEqual(read_text(log, "alice", []), (1, []))
+
+    def test_missed_keys(self):
+        log = EventLog(2)
+        log.add_reader("alice", ["kitchen", "alice"])
+        append_events(
+            log,
+            ("a", ["kitchen"]),
+            ("b", ["hall", "bob"]),
+            ("c", ["hall"]),
+            ("d", ["kitchen", "alice"]),
+        )
+
+        # only the overwritten events for the reader's own keys are counted
+        self.assertEqual(read_text(log, "alice", ["kitchen", "alice"]), (1, ["d"]))
+        self.assertEqual(read_text(log, "alice"), (1, ["c", "d"]))
+
+        log.reset_reader("alice", ["hall", "alice"])
+        append_events(log, ("e", ["hall"]), ("f", ["kitchen"]), ("g", ["kitchen"]))
+        self.assertEqual(read_text(log, "alice", ["hall", "alice"]), (1, []))
+
+    def test_idle_reader(self):
+        log = EventLog(3)
+        log.add_reader("alice")
+        for turn in range(100):
+            append_events(log, (f"event {turn}", ["hall"]))
+
+        # a reader that never acts does not keep events in the index
+        self.assertEqual(log.cursors["alice"], log.head - log.size)
+        self.assertEqual(list(log.indexes["hall"]), [97, 98, 99])
+        self.assertEqual(read_text(log, "alice")[0], 97)
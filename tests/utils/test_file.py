@@ -0,0 +1,45 @@
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from taleweave.models.base import dump_model
+from taleweave.models.entity import WorldState
+from taleweave.utils.file import (
+    dump_state_data,
+    is_binary_file,
+    load_state_data,
+    write_atomic,
+)
+
+from .test_index import make_test_world
+
+
+class TestStateData(TestCase):
+    def test_formats(self):
+        state = WorldState(
+            memory={"Test Character": ["hello", {"content": "hi", "type": "ai"}]},
+            turn=3,
+            world=make_test_world(),
+        )
+        data = dump_model(WorldState, state)
+
+        with TemporaryDirectory() as temp:
+            for filename in ["state.json", "state.msgpack", "state.msgpack.zst"]:
+                filename = path.join(temp, filename)
+                write_atomic(filename, dump_state_data(filename, data))
+
+                self.assertEqual(WorldState(**load_state_data(filename)), state)
+
+    def test_binary_extensions(self):
+        self.assertTrue(is_binary_file("world.state.msgpack"))
+        self.assertTrue(is_binary_file("world.state.msgpack.zst"))
+        self.assertFalse(is_binary_file("world.state.json"))
+        self.assertFalse(is_binary_file("world.state.zst"))
+
+    def test_load_yaml(self):
+        with TemporaryDirectory() as temp:
+            filename = path.join(temp, "state.yml")
+            with open(filename, "w") as f:
+                f.write("turn: 1\nmemory: {}\n")
+
+            self.assertEqual(load_state_data(filename), {"turn": 1, "memory": {}})
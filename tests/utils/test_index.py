@@ -0,0 +1,113 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from taleweave.models.entity import Character, Item, Room, World
+from taleweave.utils.index import (
+    WorldIndex,
+    add_character,
+    invalidate_world_index,
+    move_character,
+    move_item,
+    remove_item,
+)
+from taleweave.utils.search import (
+    find_character,
+    find_containing_room,
+    find_item,
+    find_portal,
+    find_room,
+)
+
+
+def make_test_world() -> World:
+    item = Item(name="Test Item", description="A test item.")
+    character = Character(
+        name="Test Character",
+        backstory="A test character.",
+        description="A test character.",
+    )
+    first_room = Room(
+        name="First Room",
+        description="A test room.",
+        characters=[character],
+        items=[item],
+    )
+    second_room = Room(name="Second Room", description="Another test room.")
+    return World(
+        name="Test World",
+        rooms=[first_room, second_room],
+        theme="testing",
+        order=[character.name],
+    )
+
+
+class TestWorldIndex(TestCase):
+    def test_move_character(self):
+        world = make_test_world()
+        first_room, second_room = world.rooms
+        character = find_character(world, "test character")
+
+        self.assertEqual(find_containing_room(world, character), first_room)
+        move_character(world, first_room, second_room, character)
+        self.assertIs(find_containing_room(world, character), second_room)
+
+    def test_move_item(self):
+        world = make_test_world()
+        first_room = world.rooms[0]
+        character = first_room.characters[0]
+        item = find_item(world, "Test Item")
+
+        move_item(world, first_room, character, item)
+        self.assertIsNone(find_item(world, "Test Item"))
+        self.assertIs(
+            find_item(world, "Test Item", include_character_inventory=True), item
+        )
+        self.assertIsNone(find_containing_room(world, item))
+
+    def test_remove_item(self):
+        world = make_test_world()
+        first_room = world.rooms[0]
+        item = find_item(world, "Test Item")
+
+        remove_item(world, first_room, item)
+        self.assertIsNone(find_item(world, "Test Item"))
+
+    def test_unindexed_changes(self):
+        world = make_test_world()
+        first_room, second_room = world.rooms
+        character = find_character(world, "Test Character")
+
+        # changes made without the helpers are never returned incorrectly, and are found once the index is rebuilt
+        first_room.characters.remove(character)
+        second_room.characters.append(character)
+        self.assertIsNone(find_containing_room(world, character))
+
+        invalidate_world_index(world)
+        self.assertIs(find_containing_room(world, character), second_room)
+
+        new_room = Room(name="Third Room", description="A new room.")
+        world.rooms.append(new_room)
+        self.assertIs(find_room(world, "Third Room"), new_room)
+
+    def test_missing_names(self):
+        world = make_test_world()
+        find_room(world, "First Room")
+
+        with patch.object(WorldIndex, "rebuild") as rebuild:
+            self.assertIsNone(find_room(world, "Missing Room"))
+            self.assertIsNone(find_character(world, "Missing Character"))
+            self.assertIsNone(find_item(world, "Missing Item"))
+            self.assertIsNone(find_portal(world, "Missing Portal"))
+            rebuild.assert_not_called()
+
+    def test_add_character(self):
+        world = make_test_world()
+        second_room = world.rooms[1]
+        find_room(world, "Second Room")
+
+        character = Character(
+            name="New Character", backstory="A new character.", description="New."
+        )
+        add_character(world, second_room, character)
+        self.assertIs(find_character(world, "New Character"), character)
+        self.assertIs(find_containing_room(world, character), second_room)
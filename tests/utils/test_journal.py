@@ -0,0 +1,105 @@
+from json import load
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from taleweave.models.base import dump_model
+from taleweave.models.entity import Item, World
+from taleweave.utils.index import add_item, move_character
+from taleweave.utils.journal import (
+    StateJournal,
+    diff_memory,
+    get_journal_path,
+    load_state_file,
+    replay_journal,
+    write_state_file,
+)
+
+from .test_index import make_test_world
+
+
+def make_state(world: World, memory, turn: int):
+    return {
+        "world": dump_model(World, world),
+        "memory": {"Test Character": list(memory)},
+        "turn": turn,
+    }
+
+
+class TestStateJournal(TestCase):
+    def test_replay(self):
+        world = make_test_world()
+        first_room, second_room = world.rooms
+        character = first_room.characters[0]
+        memory = ["hello"]
+
+        with TemporaryDirectory() as temp:
+            state_path = path.join(temp, "world.state.json")
+            journal = StateJournal(state_path, compact_turns=5)
+            journal.write(make_state(world, memory, 0))
+
+            move_character(world, first_room, second_room, character)
+            memory.append("moved")
+            journal.write(make_state(world, memory, 1))
+
+            add_item(world, character, Item(name="New Item", description="New."))
+            character.attributes["mood"] = "happy"
+            memory.pop(0)
+            journal.write(make_state(world, memory, 2))
+
+            with open(state_path) as f:
+                base = load(f)
+
+            with open(get_journal_path(state_path)) as f:
+                self.assertEqual(len(f.readlines()), 2)
+
+            self.assertEqual(base["turn"], 0)
+            self.assertEqual(
+                replay_journal(state_path, base), make_state(world, memory, 2)
+            )
+
+    def test_compact(self):
+        world = make_test_world()
+        with TemporaryDirectory() as temp:
+            state_path = path.join(temp, "world.state.json")
+            journal = StateJournal(state_path, compact_turns=2)
+            for turn in range(4):
+                world.rooms[0].attributes["turn"] = turn
+                journal.write(make_state(world, [], turn))
+
+            with open(state_path) as f:
+                base = load(f)
+
+            self.assertEqual(base["turn"], 3)
+            self.assertEqual(replay_journal(state_path, base), base)
+
+    def test_edit_journaled_state(self):
+        world = make_test_world()
+        with TemporaryDirectory() as temp:
+            state_path = path.join(temp, "world.state.json")
+            journal = StateJournal(state_path, compact_turns=5)
+            journal.write(make_state(world, ["hello"], 0))
+
+            world.rooms[0].attributes["weather"] = "rainy"
+            journal.write(make_state(world, ["hello"], 1))
+
+            # load and save the state the way the editor does
+            state = load_state_file(state_path)
+            self.assertEqual(state["turn"], 1)
+            self.assertEqual(
+                state["world"]["rooms"][0]["attributes"]["weather"], "rainy"
+            )
+
+            state["world"]["rooms"][0]["attributes"]["weather"] = "sunny"
+            write_state_file(state_path, state)
+
+            self.assertFalse(path.exists(get_journal_path(state_path)))
+            self.assertEqual(load_state_file(state_path), state)
+
+    def test_diff_memory(self):
+        self.assertEqual(
+            diff_memory(["a", "b", "c"], ["b", "c", "d"]),
+            {"drop": 1, "append": ["d"]},
+        )
+        self.assertEqual(diff_memory(["a"], ["b"]), {"drop": 1, "append": ["b"]})
+        self.assertIsNone(diff_memory(["a"], ["a"]))
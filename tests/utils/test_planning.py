@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+from taleweave.models.entity import Character
+from taleweave.models.planning import Calendar, CalendarEvent, Planner
+from taleweave.utils.planning import (
+    add_event,
+    add_note,
+    erase_prefix_notes,
+    expire_events,
+    get_note_index,
+    get_upcoming_events,
+    has_note,
+    mark_notes_changed,
+    replace_note,
+    set_notes,
+)
+
+
+def make_character(events=None, notes=None) -> Character:
+    return Character(
+        name="Alice",
+        backstory="",
+        description="",
+        planner=Planner(calendar=Calendar(events=events or []), notes=notes or []),
+    )
+
+
+class TestCalendar(TestCase):
+    def test_loaded_events_are_sorted(self):
+        calendar = Calendar(
+            events=[CalendarEvent("later", 5), CalendarEvent("sooner", 2)]
+        )
+        self.assertEqual([event.name for event in calendar.events], ["sooner", "later"])
+
+    def test_expire_and_upcoming(self):
+        character = make_character()
+        for name, turn in [("c", 7), ("a", 1), ("b", 4), ("d", 9)]:
+            add_event(character, CalendarEvent(name, turn))
+
+        expired = expire_events(character, 4)
+        self.assertEqual([event.name for event in expired], ["a"])
+
+        upcoming = get_upcoming_events(character, 4, upcoming_turns=3)
+        self.assertEqual([event.name for event in upcoming], ["b", "c"])
+
+
+class TestNotes(TestCase):
+    def test_add_and_replace(self):
+        character = make_character(notes=["first"])
+        index = get_note_index(character)
+        add_note(character, "second")
+        self.assertTrue(has_note(character, "second"))
+        self.assertIs(get_note_index(character), index)
+
+        replace_note(character, "first", "third")
+        self.assertFalse(has_note(character, "first"))
+        self.assertEqual(character.planner.notes, ["third", "second"])
+
+    def test_erase_prefix(self):
+        character = make_character(notes=["bob is tall", "alice", "bob is kind"])
+        self.assertEqual(erase_prefix_notes(character, "bob"), 2)
+        self.assertEqual(erase_prefix_notes(character, "bob"), 0)
+        self.assertEqual(character.planner.notes, ["alice"])
+
+    def test_notes_changed_elsewhere(self):
+        character = make_character(notes=["one"])
+        self.assertTrue(has_note(character, "one"))
+
+        character.planner.notes.append("two")
+        self.assertTrue(has_note(character, "two"))
+
+        set_notes(character, ["three"])
+        self.assertFalse(has_note(character, "one"))
+        self.assertTrue(has_note(character, "three"))
+
+        # replacing a note keeps the same number of notes, so the version has to change
+        character.planner.notes[0] = "four"
+        mark_notes_changed(character)
+        self.assertFalse(has_note(character, "three"))
+        self.assertTrue(has_note(character, "four"))
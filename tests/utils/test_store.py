@@ -0,0 +1,108 @@
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from taleweave.models.entity import Item, Portal
+from taleweave.utils.index import add_item, move_character
+from taleweave.utils.store import WorldStore, is_store_file
+
+from .test_index import make_test_world
+from .test_journal import make_state
+
+
+class TestWorldStore(TestCase):
+    def test_partial_updates(self):
+        world = make_test_world()
+        first_room, second_room = world.rooms
+        character = first_room.characters[0]
+        first_room.portals.append(
+            Portal(name="Door", description="A door.", destination=second_room.name)
+        )
+        memory = ["hello"]
+
+        with TemporaryDirectory() as temp:
+            store_path = path.join(temp, "world.db")
+            store = WorldStore(store_path)
+            self.assertFalse(store.has_state())
+            store.write(make_state(world, memory, 0))
+
+            move_character(world, first_room, second_room, character)
+            add_item(world, character, Item(name="New Item", description="New."))
+            character.attributes["mood"] = "happy"
+            first_room.items.clear()
+            memory.append("moved")
+            store.write(make_state(world, memory, 1))
+
+            del character.attributes["mood"]
+            character.attributes["hunger"] = 5
+            memory.pop(0)
+            store.write(make_state(world, memory, 2))
+            store.close()
+
+            store = WorldStore(store_path)
+            self.assertTrue(store.has_state())
+            self.assertEqual(store.load(), make_state(world, memory, 2))
+
+            rows = store.connection.execute(
+                "SELECT position, message FROM memory ORDER BY position"
+            ).fetchall()
+            self.assertEqual(rows, [(1, '"moved"')])
+
+            rows = store.connection.execute(
+                "SELECT room_id, destination FROM portals"
+            ).fetchall()
+            self.assertEqual(rows, [(first_room.id, second_room.name)])
+            store.close()
+
+    def test_reopen_without_load(self):
+        world = make_test_world()
+        with TemporaryDirectory() as temp:
+            store_path = path.join(temp, "world.db")
+            store = WorldStore(store_path)
+            store.write(make_state(world, ["hello"], 0))
+            store.close()
+
+            # a new store compares the first write with the rows that are already saved
+            world.rooms[0].attributes["weather"] = "rainy"
+            store = WorldStore(store_path)
+            store.write(make_state(world, ["hello"], 1))
+            self.assertEqual(store.load(), make_state(world, ["hello"], 1))
+            store.close()
+
+    def test_system_data(self):
+        with TemporaryDirectory() as temp:
+            store = WorldStore(path.join(temp, "world.sqlite"))
+            self.assertFalse(store.has_system_data("quest"))
+
+            store.save_system_data("quest", {"active": {"Test Character": "find"}})
+            self.assertTrue(store.has_system_data("quest"))
+            self.assertEqual(
+                store.load_system_data("quest"),
+                {"active": {"Test Character": "find"}},
+            )
+            store.close()
+
+    def test_system_data_each_turn(self):
+        world = make_test_world()
+        with TemporaryDirectory() as temp:
+            store_path = path.join(temp, "world.db")
+            store = WorldStore(store_path)
+            store.save_system_data("quest", {"active": {}})
+
+            for turn in range(3):
+                state = make_state(world, ["hello"], turn)
+                state["systems"] = {"quest": {"active": {"Test Character": turn}}}
+                store.write(state)
+
+            store.close()
+
+            store = WorldStore(store_path)
+            self.assertEqual(
+                store.load_system_data("quest"), {"active": {"Test Character": 2}}
+            )
+            store.close()
+
+    def test_store_extensions(self):
+        self.assertTrue(is_store_file("world.db"))
+        self.assertTrue(is_store_file("world.state.sqlite"))
+        self.assertFalse(is_store_file("world.state.json"))
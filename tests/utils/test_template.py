@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+from taleweave.models.prompt import PromptLibrary
+from taleweave.utils.template import (
+    compile_prompt,
+    compile_prompt_library,
+    compile_template,
+    format_str,
+    get_template_variables,
+    prompt_templates,
+)
+
+
+class TestCompileTemplate(TestCase):
+    def test_cache_hit(self):
+        template_str = "Hello {{ name }} from the template cache test"
+        compile_template.cache_clear()
+
+        first = compile_template(template_str)
+        second = compile_template(template_str)
+
+        self.assertIs(first, second)
+        info = compile_template.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_format_str(self):
+        self.assertEqual(format_str("Hello {{ name }}", name="world"), "Hello world")
+
+
+class TestTemplateVariables(TestCase):
+    def test_variables(self):
+        variables = get_template_variables(
+            "{{ character | name }} is in {{ room.name }}{% for item in items %}{{ item }}{% endfor %}"
+        )
+        self.assertEqual(variables, frozenset(["character", "room", "items"]))
+
+    def test_no_variables(self):
+        self.assertEqual(get_template_variables("plain text"), frozenset())
+
+
+class TestCompilePromptLibrary(TestCase):
+    def tearDown(self):
+        prompt_templates.clear()
+
+    def test_compile_library(self):
+        library = PromptLibrary(
+            prompts={
+                "test_greeting": "Hello {{ name }}",
+                "test_farewell": "Goodbye {{ name }}",
+            }
+        )
+        compile_prompt_library(library)
+
+        self.assertIn("test_greeting", prompt_templates)
+        self.assertIn("test_farewell", prompt_templates)
+        template = prompt_templates["test_greeting"][1]
+        self.assertIs(compile_prompt("test_greeting", "Hello {{ name }}"), template)
+
+    def test_recompile_changed_prompt(self):
+        first = compile_prompt("test_greeting", "Hello {{ name }}")
+        second = compile_prompt("test_greeting", "Hi {{ name }}")
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.render(name="world"), "Hi world")
+
+    def test_malformed_prompt(self):
+        library = PromptLibrary(
+            prompts={
+                "test_greeting": "Hello {{ name }}",
+                "test_broken": "Hello {{ name",
+            }
+        )
+
+        with self.assertRaises(ValueError) as context:
+            compile_prompt_library(library)
+
+        self.assertIn("test_broken", str(context.exception))
+        self.assertNotIn("test_broken", prompt_templates)
@@ -0,0 +1,36 @@
+from threading import Event
+from unittest import TestCase
+
+from taleweave.utils.worker import CoalescingWorker
+
+
+class RecordingWorker(CoalescingWorker):
+    def __init__(self):
+        super().__init__("test")
+        self.blocked = Event()
+        self.started = Event()
+        self.items = []
+
+    def handle(self, key, item):
+        self.started.set()
+        self.blocked.wait(1.0)
+        self.items.append((key, item))
+
+
+class TestCoalescingWorker(TestCase):
+    def test_keep_latest(self):
+        worker = RecordingWorker()
+        worker.start()
+        worker.submit("a", 1)
+        # wait for the first item to be picked up before queueing more
+        worker.started.wait(1.0)
+
+        worker.submit("a", 2)
+        worker.submit("a", 3)
+        worker.submit("b", 4)
+        worker.blocked.set()
+        worker.stop()
+
+        self.assertEqual(sorted(worker.items), [("a", 1), ("a", 3), ("b", 4)])
+        self.assertEqual(worker.skipped, 1)
+        self.assertEqual(worker.handled, 3)